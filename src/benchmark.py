@@ -0,0 +1,135 @@
+import os
+import sys
+import gc
+import json
+import time
+import tracemalloc
+import argparse
+from headless import HeadlessGame, WORLD_SIZE
+
+"""benchmark measures simulation throughput headless, for catching performance regressions in CI"""
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def run_benchmark(enemies=50, projectiles=1000, ticks=600, warmup=60, backend='objects', swept=False, render=False,
+                  seed=0, alloc_ticks=60):
+    """Step a world of enemies Blue targets while keeping projectiles live projectiles in flight.
+
+    Returns a dict with updates/sec, p50/p99/worst frame time (ms), gen-0 GC
+    collections per frame, and allocations per frame measured in a separate
+    tracemalloc pass (so tracing does not skew the timings): allocated blocks
+    still alive after the frame, and peak transient KiB allocated within it.
+    """
+    game = HeadlessGame(enemies, backend, swept, render, seed)
+    manager = game.projectile_manager
+    rng = game.rng
+    width, height = WORLD_SIZE
+    range_ = max(width, height) * 2  # Projectiles leave the screen before running out of range
+
+    def top_up():
+        # Keep the live count at the requested level by replacing projectiles that hit or left the screen
+        for _ in range(projectiles - len(manager)):
+            target = (rng.randint(0, width - 1), rng.randint(0, height - 1))
+            manager.fire_projectile('bench', 1, game.player.projectile_speed, range_, game.player, target)
+
+    frame_ms = []
+    retained_blocks = []
+    transient_kib = []
+    collections = [0]
+
+    def on_gc(phase, info):
+        if phase == 'start' and info['generation'] == 0:
+            collections[0] += 1
+
+    for _ in range(warmup):
+        top_up()
+        game.step()
+
+    gc.callbacks.append(on_gc)
+    try:
+        perf_counter = time.perf_counter
+        getallocatedblocks = sys.getallocatedblocks
+        start = perf_counter()
+        for _ in range(ticks):
+            t0 = perf_counter()
+            top_up()
+            game.step()
+            frame_ms.append((perf_counter() - t0) * 1000.0)
+        elapsed = perf_counter() - start
+    finally:
+        gc.callbacks.remove(on_gc)
+
+    # Allocation pass: same workload, traced
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_ticks):
+            blocks = getallocatedblocks()
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            top_up()
+            game.step()
+            transient_kib.append((tracemalloc.get_traced_memory()[1] - base) / 1024.0)
+            retained_blocks.append(getallocatedblocks() - blocks)
+    finally:
+        tracemalloc.stop()
+
+    frame_ms.sort()
+    return {
+        'backend': backend,
+        'swept': swept,
+        'render': render,
+        'enemies': enemies,
+        'projectiles': projectiles,
+        'ticks': ticks,
+        'updates_per_sec': ticks / elapsed if elapsed > 0 else 0.0,
+        'p50_ms': percentile(frame_ms, 0.50),
+        'p99_ms': percentile(frame_ms, 0.99),
+        'worst_ms': frame_ms[-1] if frame_ms else 0.0,
+        'retained_blocks_per_frame': sum(retained_blocks) / len(retained_blocks) if retained_blocks else 0.0,
+        'transient_kib_per_frame': sorted(transient_kib)[len(transient_kib) // 2] if transient_kib else 0.0,
+        'gc_gen0_per_frame': collections[0] / ticks if ticks else 0.0,
+        'collision_tests_last_frame': manager.collision_tests,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless simulation throughput benchmark.")
+    parser.add_argument('--enemies', type=int, default=50, help="number of Blue targets (N)")
+    parser.add_argument('--projectiles', type=int, default=1000, help="live projectiles to maintain (M)")
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--warmup', type=int, default=60)
+    parser.add_argument('--backend', choices=('objects', 'numpy'), default='objects')
+    parser.add_argument('--swept', action='store_true')
+    parser.add_argument('--render', action='store_true', help="include drawing into the off-screen surface")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--alloc-ticks', type=int, default=60, help="frames in the traced allocation pass")
+    parser.add_argument('--json', metavar='PATH', help="also write the results as JSON")
+    parser.add_argument('--max-p99-ms', type=float, help="exit with status 1 if p99 frame time exceeds this")
+    args = parser.parse_args(argv)
+
+    json_path = os.path.abspath(args.json) if args.json else None  # Relative to the caller, resolved before the chdir
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    results = run_benchmark(args.enemies, args.projectiles, args.ticks, args.warmup,
+                            args.backend, args.swept, args.render, args.seed, args.alloc_ticks)
+
+    for key, value in results.items():
+        print(f"{key:>28}: {value:.3f}" if isinstance(value, float) else f"{key:>28}: {value}")
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.max_p99_ms is not None and results['p99_ms'] > args.max_p99_ms:
+        print(f"p99 frame time {results['p99_ms']:.3f} ms exceeds budget of {args.max_p99_ms:.3f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,47 +1,89 @@
 import pygame  # [library import] - pygame: main game library for sprites, surfaces, rects, etc.
 import os      # [library import] - os: for file path operations
 import math    # [library import] - math: for potential math operations (not used directly here)
-
-# [class] - NPC enemy sprite, handles animation, health, and collision
-class Blue(pygame.sprite.Sprite):
-    """blue class representing an NPC opponent."""
-
-    # [constructor] - initializes all state, loads sprites, sets up animation and health
-    def __init__(self, projectile_manager, position=(300, 300)):
-        """Initialize the blue sprite with image and starting position."""
-        super().__init__()
-
+import functools  # [library import] - functools: binds per-frame streaming callbacks
+from systems.asset_cache import load_image  # [function import] - load_image: shared, process-wide surface cache
+from systems.ecs import world as shared_world, BLUE  # [ecs import] - component storage and the blue archetype
+from systems.animation import LOOP  # [constant import] - clip playback mode
+from systems.enemy_spawner import enemy_types, EnemyType  # [registry import] - shared per-type art
+from systems.asset_streamer import asset_streamer  # [streamer import] - background frame loading
+from systems.timers import timers as shared_timers, ticks_for  # [timer import] - ends the damage flash
+
+# [constants] - animation timing (ms of simulation time)
+FRAME_MS = 200        # [constant] - per frame, idle and damage clips
+DAMAGE_MS = 500       # [constant] - how long the damage flash lasts after the latest hit
+DAMAGE_TICKS = ticks_for(DAMAGE_MS / 1000)  # [constant] - the flash timer's delay on the timer wheel
+SCALED_SIZE = (64, 64)  # [constant] - size every frame is scaled to
+# [constant] - frame list attribute -> (clip name, file pattern), two frames each, for streamed loading
+FRAME_FILES = {
+    'left_idle_sprites': ('idle_left', 'left_idle_{}.png'),
+    'right_idle_sprites': ('idle_right', 'right_idle_{}.png'),
+    'damage_left_sprites': ('damage_left', 'damage_left_{}.png'),
+    'damage_right_sprites': ('damage_right', 'damage_right_{}.png'),
+}
+
+# [flyweight class] - Frames and clip ids shared by every Blue
+class BlueArt:
+    """The blue enemy's frames, loaded and scaled once per process, and the clips built from them."""
+
+    # [constructor] - loads every frame
+    def __init__(self):
+        """Load the blue frames (or fallback sprites), or stream them in behind fallbacks if the streamer runs."""
         # [attribute] - tuple, size to scale all sprite images to
-        self.scaled_size = (64, 64)
-        # [attribute] - reference to projectile manager for interaction
-        self.projectile_manager = projectile_manager
-
-        # [method call] - loads all sprite images and animation frames
-        self._load_sprites()
-
-        # [attribute] - pygame.Rect, main sprite rectangle for positioning
-        self.rect = self.image.get_rect()
-        self.rect.center = position
-
-        # [attribute] - pygame.Rect, hitbox for collision (smaller than sprite)
-        self.hitbox = pygame.Rect(0, 0, self.scaled_size[0] * 0.8, self.scaled_size[1] * 0.8)
-        self.hitbox.center = self.rect.center
-
-        # [method call] - sets up animation state and timers
-        self._setup_animation()
-
-        # [attribute] - int, health points
-        self.health = 100
-        # [attribute] - bool, whether currently in damage state
-        self.is_damaged = False
-        # [attribute] - int, time when last damaged
-        self.damage_timer = 0
-        # [attribute] - int, duration of damage animation in ms
-        self.damage_duration = 500  # milliseconds
+        self.scaled_size = SCALED_SIZE
+        # [attribute] - ClipLibrary -> {clip name: clip id}
+        self._clip_ids = {}
+        # [attribute] - id(ClipLibrary) -> ClipLibrary, for swapping streamed frames into defined clips
+        self._libraries = {}
+        if asset_streamer.running:
+            # [placeholder] - drawn until every frame of a clip has arrived
+            self._create_fallback_sprites()
+            self._stream_sprites()
+        else:
+            # [method call] - loads all sprite images and animation frames
+            self._load_sprites()
+
+    # [public method] - clip ids in a library, defined on first request
+    def clips(self, library):
+        """Return {'idle_left', 'idle_right', 'damage_left', 'damage_right': clip id} in library."""
+        ids = self._clip_ids.get(id(library))
+        if ids is None:
+            ids = {
+                'idle_left': library.define('blue/idle_left', self.left_idle_sprites, FRAME_MS, LOOP),
+                'idle_right': library.define('blue/idle_right', self.right_idle_sprites, FRAME_MS, LOOP),
+                # [damage flash] - loops until the Blue's flash timer switches back to idle
+                'damage_left': library.define('blue/damage_left', self.damage_left_sprites, FRAME_MS, LOOP),
+                'damage_right': library.define('blue/damage_right', self.damage_right_sprites, FRAME_MS, LOOP),
+            }
+            self._clip_ids[id(library)] = ids
+            self._libraries[id(library)] = library
+        return ids
+
+    # [helper method] - queues every frame on the asset streamer
+    def _stream_sprites(self):
+        """Request all blue frames; each animation swaps in once both of its frames are loaded."""
+        base_dir = os.path.join(os.path.dirname(__file__), '../assets/sprites/enemies/blue')
+        for attribute, (clip, pattern) in FRAME_FILES.items():
+            frames = [None, None]
+            for index in range(len(frames)):
+                path = os.path.join(base_dir, pattern.format(index + 1))
+                asset_streamer.request(path, self.scaled_size,
+                                       callback=functools.partial(self._frame_streamed, attribute, clip, frames,
+                                                                  index, path))
+
+    # [callback] - one streamed frame arrived (main thread, from AssetStreamer.pump)
+    def _frame_streamed(self, attribute, clip, frames, index, path, surface):
+        """Store a frame; when its animation is complete, replace the list and the clips built from it."""
+        frames[index] = load_image(path, self.scaled_size)  # [reference] - cache hit, held like a synchronous load
+        if any(frame is None for frame in frames):
+            return
+        setattr(self, attribute, frames)
+        for key, ids in self._clip_ids.items():
+            self._libraries[key].replace_frames(ids[clip], frames)
 
     # [helper method] - loads all sprite images and animation frames
     def _load_sprites(self):
-        """Load all sprite animations for the blue."""
+        """Load all sprite animations for the blue type."""
         try:
             # [attribute] - list of left idle animation frames
             self.left_idle_sprites = []
@@ -57,10 +99,8 @@ class Blue(pygame.sprite.Sprite):
             # [method call] - loads damage animation frames
             self._load_damage_animations()
 
-            # [attribute] - current animation frame list
-            self.current_animation = self.left_idle_sprites
-            # [attribute] - current image to display
-            self.image = self.current_animation[0]
+            if not self.left_idle_sprites:
+                raise pygame.error("no idle frames could be loaded")
 
         except pygame.error as e:
             print(f"Error loading blue image: {e}")
@@ -76,20 +116,18 @@ class Blue(pygame.sprite.Sprite):
         for i in range(1, 3):
             path = os.path.join(base_dir, f'../assets/sprites/enemies/blue/left_idle_{i}.png')
             try:
-                original = pygame.image.load(path).convert_alpha()
-                scaled = pygame.transform.scale(original, self.scaled_size)
+                scaled = load_image(path, self.scaled_size)
                 self.left_idle_sprites.append(scaled)
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading left idle frame {i}: {e}")
 
         # [loop] - loads right idle frames
         for i in range(1, 3):
             path = os.path.join(base_dir, f'../assets/sprites/enemies/blue/right_idle_{i}.png')
             try:
-                original = pygame.image.load(path).convert_alpha()
-                scaled = pygame.transform.scale(original, self.scaled_size)
+                scaled = load_image(path, self.scaled_size)
                 self.right_idle_sprites.append(scaled)
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading right idle frame {i}: {e}")
 
     # [helper method] - loads damage animation frames for both directions
@@ -101,83 +139,130 @@ class Blue(pygame.sprite.Sprite):
         for i in range(1, 3):
             path = os.path.join(base_dir, f'../assets/sprites/enemies/blue/damage_left_{i}.png')
             try:
-                original = pygame.image.load(path).convert_alpha()
-                scaled = pygame.transform.scale(original, self.scaled_size)
+                scaled = load_image(path, self.scaled_size)
                 self.damage_left_sprites.append(scaled)
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading left damage frame {i}: {e}")
 
         # [loop] - loads right damage frames
         for i in range(1, 3):
             path = os.path.join(base_dir, f'../assets/sprites/enemies/blue/damage_right_{i}.png')
             try:
-                original = pygame.image.load(path).convert_alpha()
-                scaled = pygame.transform.scale(original, self.scaled_size)
+                scaled = load_image(path, self.scaled_size)
                 self.damage_right_sprites.append(scaled)
-            except pygame.error as e:
+            except (pygame.error, FileNotFoundError) as e:
                 print(f"Error loading right damage frame {i}: {e}")
 
     # [fallback method] - creates a simple colored surface if sprite images fail to load
     def _create_fallback_sprites(self):
-        """Create a simple fallback sprite if images can't be loaded."""
+        """Create a simple fallback sprite if images can't be loaded (one surface shared by every clip)."""
         surface = pygame.Surface(self.scaled_size, pygame.SRCALPHA)
         pygame.draw.rect(surface, (255, 0, 0), (0, 0, self.scaled_size[0], self.scaled_size[1]))
         pygame.draw.line(surface, (0, 0, 0), (0, 0), (self.scaled_size[0], self.scaled_size[1]), 2)
         pygame.draw.line(surface, (0, 0, 0), (0, self.scaled_size[1]), (self.scaled_size[0], 0), 2)
 
-        self.image = surface
-        self.left_idle_sprites = [surface.copy()]
-        self.right_idle_sprites = [surface.copy()]
-        self.damage_left_sprites = [surface.copy()]
-        self.damage_right_sprites = [surface.copy()]
-        self.current_animation = self.left_idle_sprites
-
-    # [helper method] - sets up animation state and timers
-    def _setup_animation(self):
-        """Initialize animation timers and counters."""
-        # [attribute] - current animation frame index
-        self.current_sprite = 0
-        # [attribute] - timer for animation frame switching
-        self.animation_timer = 0
-        # [attribute] - delay between animation frames (ms)
-        self.animation_delay = 200  # milliseconds
-        # [attribute] - last time animation was updated
-        self.last_update = pygame.time.get_ticks()
+        self.left_idle_sprites = [surface]
+        self.right_idle_sprites = [surface]
+        self.damage_left_sprites = [surface]
+        self.damage_right_sprites = [surface]
+
+
+# [class] - NPC enemy sprite; its animation, health and damage state live in the ECS world
+class Blue(pygame.sprite.Sprite):
+    """blue class representing an NPC opponent.
+
+    The sprite is a view of one BLUE entity: World.step() advances it together
+    with every other entity and writes rect, hitbox and image back. Frames come
+    from the shared BlueArt, so a new Blue loads nothing.
+    """
+
+    # [constructor] - sets up rects and spawns the backing entity
+    def __init__(self, projectile_manager, position=(300, 300), world=None, timers=None):
+        """Initialize the blue sprite at position in world (default: the shared world), timing effects on timers."""
+        super().__init__()
+
+        # [attribute] - reference to projectile manager for interaction
+        self.projectile_manager = projectile_manager
+        # [attribute] - World holding this blue's components
+        self.world = world if world is not None else shared_world
+        # [attribute] - TimerWheel the damage flash is scheduled on (default: the shared wheel)
+        self.timers = timers if timers is not None else shared_timers
+        # [attribute] - pending Timer that ends the damage flash (None when not flashing)
+        self.flash = None
         # [attribute] - direction the sprite is facing
         self.facing_left = True
 
-    # [public method] - applies damage, triggers damage animation, checks for defeat
-    def take_damage(self, amount):
-        """Handle taking damage and trigger damage animation."""
-        self.health -= amount
-        self.is_damaged = True
-        self.damage_timer = pygame.time.get_ticks()
-
-        # Switch to damage animation based on facing direction
-        self.current_animation = self.damage_left_sprites if self.facing_left else self.damage_right_sprites
-        self.current_sprite = 0
-
-        # Check if defeated
-        if self.health <= 0:
-            self.health = 0
-            # Could trigger death animation or removal here
-
-    # [public method] - updates state every frame (animation, damage, hitbox)
-    def update(self):
-        """Update the blue's state each frame."""
-        current_time = pygame.time.get_ticks()
-
-        # Check if damage animation should end
-        if self.is_damaged and current_time - self.damage_timer > self.damage_duration:
-            self.is_damaged = False
-            # Return to idle animation based on facing direction
-            self.current_animation = self.left_idle_sprites if self.facing_left else self.right_idle_sprites
-
-        # Update hitbox position to follow sprite
+        # [attribute] - {clip name: clip id} of the shared blue clips
+        self.clip_ids = enemy_types.art('blue').clips(self.world.clips)
+        # [attribute] - current image to display
+        self.image = self.world.clips.frame(self.clip_ids['idle_left'], 0)
+
+        # [attribute] - pygame.Rect, main sprite rectangle for positioning
+        self.rect = self.image.get_rect()
+        # [attribute] - pygame.Rect, hitbox for collision (smaller than sprite)
+        self.hitbox = pygame.Rect(0, 0, BLUE.hitbox_size[0], BLUE.hitbox_size[1])
+        # [attribute] - entity id of the backing BLUE entity (None while pooled)
+        self.entity = None
+        self.respawn(position)
+
+    # [public method] - (re)creates the backing entity
+    def respawn(self, position):
+        """Place this blue at position with full health, as a fresh entity in its world."""
+        self.rect.center = position
         self.hitbox.center = self.rect.center
+        self.entity = self.world.spawn(BLUE, position, view=self,
+                                       clip=self.clip_ids['idle_left' if self.facing_left else 'idle_right'])
+
+    # [public method] - frees the backing entity (the sprite object can be reused)
+    def despawn(self):
+        """Remove this blue's entity from its world."""
+        if self.flash is not None:
+            self.flash.cancel()
+            self.flash = None
+        if self.entity is not None:
+            self.world.destroy(self.entity)
+            self.entity = None
+
+    # [property] - health points, stored in the world
+    @property
+    def health(self):
+        return int(self.world.health[self.world.row(self.entity)])
+
+    @health.setter
+    def health(self, value):
+        self.world.health[self.world.row(self.entity)] = value
+
+    # [property] - whether the damage animation is playing
+    @property
+    def is_damaged(self):
+        clip = self.world.anim_clip[self.world.row(self.entity)]
+        return clip == self.clip_ids['damage_left'] or clip == self.clip_ids['damage_right']
+
+    # [property] - current animation frame index
+    @property
+    def current_sprite(self):
+        return int(self.world.anim_frame[self.world.row(self.entity)])
 
-        # Update animation frame
-        self._update_animation()
+    # [public method] - applies damage, triggers damage animation, checks for defeat
+    def take_damage(self, amount):
+        """Handle taking damage, trigger the damage animation and return the health left (it stops at 0).
+
+        Called once per tick with the summed damage of every hit, by the DamagePipeline.
+        """
+        health = self.world.damage(self.entity, amount)
+        # Play the damage clip from its first frame; a timer returns to idle DAMAGE_TICKS after the last hit
+        self.world.play(self.entity, self.clip_ids['damage_left' if self.facing_left else 'damage_right'])
+        if self.flash is not None:
+            self.flash.cancel()
+        self.flash = self.timers.schedule(DAMAGE_TICKS, self._end_flash)
+        # Could trigger death animation or removal here
+        return health
+
+    # [timer callback] - the damage flash is over
+    def _end_flash(self):
+        """Switch back to the idle clip (runs only when the flash timer expires; nothing polls it)."""
+        self.flash = None
+        self.world.play(self.entity, self.clip_ids['idle_left' if self.facing_left else 'idle_right'])
 
     # [public method] - checks if a projectile collides with the hitbox
     def check_projectile_collision(self, projectile):
@@ -186,19 +271,11 @@ class Blue(pygame.sprite.Sprite):
             return True
         return False
 
-    # [helper method] - advances animation frame if enough time has passed
-    def _update_animation(self):
-        """Update animation frames."""
-        now = pygame.time.get_ticks()
-        self.animation_timer += now - self.last_update
-        self.last_update = now
+    # [public method] - draws the hitbox for debugging
+    def draw_hitbox(self, screen, offset=(0, 0)):
+        """Draw the hitbox (shifted by -offset, the camera position) for debugging purposes and return the area drawn."""
+        return pygame.draw.rect(screen, (255, 0, 0), self.hitbox.move(-offset[0], -offset[1]), 1)
 
-        if self.animation_timer >= self.animation_delay:
-            self.animation_timer = 0
-            self.current_sprite = (self.current_sprite + 1) % len(self.current_animation)
-            self.image = self.current_animation[self.current_sprite]
 
-    # [public method] - draws the hitbox for debugging
-    def draw_hitbox(self, screen):
-        """Draw the hitbox for debugging purposes."""
-        pygame.draw.rect(screen, (255, 0, 0), self.hitbox, 1)
+# [registration] - lets EnemySpawner create blues by name; the art loads on the first spawn
+enemy_types.register(EnemyType('blue', Blue, BlueArt))
@@ -4,6 +4,16 @@ import pygame  # [IMPORT] pygame library for game development
 import os      # [IMPORT] os module for file path operations
 from systems.projectile_manager import ProjectileManager  # [IMPORT] ProjectileManager for handling projectiles
 import math    # [IMPORT] math module for mathematical operations
+import functools  # [IMPORT] functools: binds per-frame streaming callbacks
+from systems.asset_cache import load_image  # [IMPORT] load_image: shared, process-wide surface cache
+from systems.game_loop import FIXED_DT  # [IMPORT] FIXED_DT: default simulation step in seconds
+from systems.ecs import world as shared_world, PLAYER  # [IMPORT] ECS world and the player archetype
+from systems.animation import LOOP  # [IMPORT] LOOP: clip playback mode
+from systems.input_source import live_input, BUTTON_RIGHT, KEY_FIRE  # [IMPORT] per-tick input state (live, recorded or replayed)
+from systems.navigation import navigation  # [IMPORT] shared flow fields for obstacle-aware movement
+from systems.asset_streamer import asset_streamer, PRIORITY_HIGH  # [IMPORT] background frame loading
+
+FRAME_MS = 167  # [CONSTANT] Animation frame duration (ms of simulation time)
 
 # [COMMENT] Player Module
 # [COMMENT] This class is used in:
@@ -14,21 +24,35 @@ import math    # [IMPORT] math module for mathematical operations
 class Player(pygame.sprite.Sprite):  # [CLASS] Player
     """Player class representing the main character controlled by the user."""
     
-    def __init__(self, projectile_manager):  # [METHOD] __init__
-        """Initialize the player sprite with image and starting position."""
+    def __init__(self, projectile_manager, input_source=None, world=None, navigator=None):  # [METHOD] __init__
+        """Initialize the player sprite with image and starting position, reading input_source (default: live devices).
+
+        Position, velocity and animation live in world (default: the shared
+        world); World.step() moves and animates the player after update()
+        has steered it along navigator's flow field (default: the shared one).
+        """
         # [CALL] super().__init__() - Initialize parent Sprite class
         super().__init__()
         
-        # [CALL] self._setup_debug_info() - Print debug info
+        # [CALL] self._setup_debug_info() - Set up asset paths
         self._setup_debug_info()
         
         # [ATTRIBUTE] projectile_manager: stores the projectile manager instance
         self.projectile_manager = projectile_manager
+        # [ATTRIBUTE] input: source sampled once per simulation tick by the game loop
+        self.input = input_source if input_source is not None else live_input
+        # [ATTRIBUTE] world: ECS world holding the player's components
+        self.world = world if world is not None else shared_world
+        # [ATTRIBUTE] navigator: FlowFieldCache shared by every unit sent to the same destination
+        self.navigator = navigator if navigator is not None else navigation
         # [ATTRIBUTE] scaled_size: tuple for sprite scaling
         self.scaled_size = (64, 64)
         
-        # [CALL] self._load_sprites() - Load all player sprites and animations
-        self._load_sprites()
+        # [CALL] Load all player sprites and animations (placeholders while the streamer fetches them)
+        if asset_streamer.running:
+            self._create_fallback_sprites()
+        else:
+            self._load_sprites()
         
         # [ATTRIBUTE] rect: pygame.Rect for player position and collision
         self.rect = self.image.get_rect()
@@ -43,12 +67,14 @@ class Player(pygame.sprite.Sprite):  # [CLASS] Player
         # [CALL] self._setup_shooting() - Initialize shooting state
         self._setup_shooting()
 
+        # [CALL] self._stream_sprites() - Swap the real frames in as they arrive
+        if asset_streamer.running:
+            self._stream_sprites()
+
     def _setup_debug_info(self):  # [METHOD] _setup_debug_info
         """Setup debug information and paths."""
         # [ATTRIBUTE] base_dir: base directory of this file
         self.base_dir = os.path.dirname(__file__)
-        print(f"Current directory: {os.getcwd()}")  # [DEBUG] Print current working directory
-        print(f"Base directory: {self.base_dir}")   # [DEBUG] Print base directory
 
     def _load_sprites(self):  # [METHOD] _load_sprites
         """Load all sprite animations for the player."""
@@ -76,9 +102,7 @@ class Player(pygame.sprite.Sprite):  # [CLASS] Player
     def _load_base_image(self):  # [METHOD] _load_base_image
         """Load and scale the base player image."""
         idle_path = os.path.join(self.base_dir, '../assets/sprites/player/left_idle_1.png')  # [PATH] Idle sprite path
-        print(f"Loading idle sprite from: {idle_path}")  # [DEBUG] Print path
-        original_image = pygame.image.load(idle_path).convert_alpha()  # [LOAD] Load image
-        self.image = pygame.transform.scale(original_image, self.scaled_size)  # [SCALE] Scale image
+        self.image = load_image(idle_path, self.scaled_size)  # [LOAD] Load and scale image (cached)
 
     def _load_idle_animations(self):  # [METHOD] _load_idle_animations
         """Load idle animation frames."""
@@ -90,17 +114,13 @@ class Player(pygame.sprite.Sprite):  # [CLASS] Player
         # [LOOP] Load left idle frames
         for frame in ['left_idle_1.png', 'left_idle_2.png']:
             path = os.path.join(self.base_dir, f'../assets/sprites/player/{frame}')  # [PATH] Left idle frame path
-            print(f"Loading left idle frame from: {path}")  # [DEBUG] Print path
-            original = pygame.image.load(path).convert_alpha()  # [LOAD] Load image
-            scaled = pygame.transform.scale(original, self.scaled_size)  # [SCALE] Scale image
+            scaled = load_image(path, self.scaled_size)  # [LOAD] Load and scale image (cached)
             self.left_idle_sprites.append(scaled)  # [APPEND] Add to left idle sprites
         
         # [LOOP] Load right idle frames
         for frame in ['right_idle_1.png', 'right_idle_2.png']:
             path = os.path.join(self.base_dir, f'../assets/sprites/player/{frame}')  # [PATH] Right idle frame path
-            print(f"Loading right idle frame from: {path}")  # [DEBUG] Print path
-            original = pygame.image.load(path).convert_alpha()  # [LOAD] Load image
-            scaled = pygame.transform.scale(original, self.scaled_size)  # [SCALE] Scale image
+            scaled = load_image(path, self.scaled_size)  # [LOAD] Load and scale image (cached)
             self.right_idle_sprites.append(scaled)  # [APPEND] Add to right idle sprites
             
         # [ASSIGN] Set default idle sprites to left
@@ -119,11 +139,11 @@ class Player(pygame.sprite.Sprite):  # [CLASS] Player
                 print(f"Warning: Right movement sprite {i} not found at {right_path}")  # [DEBUG] Warn missing right
             
             try:
-                left = pygame.image.load(left_path).convert_alpha()  # [LOAD] Load left
-                right = pygame.image.load(right_path).convert_alpha()  # [LOAD] Load right
+                left = load_image(left_path, self.scaled_size)  # [LOAD] Load and scale left (cached)
+                right = load_image(right_path, self.scaled_size)  # [LOAD] Load and scale right (cached)
                 
-                self.left_move_sprites.append(pygame.transform.scale(left, self.scaled_size))  # [APPEND] Left move
-                self.right_move_sprites.append(pygame.transform.scale(right, self.scaled_size))  # [APPEND] Right move
+                self.left_move_sprites.append(left)  # [APPEND] Left move
+                self.right_move_sprites.append(right)  # [APPEND] Right move
             except (pygame.error, FileNotFoundError) as e:  # [EXCEPTION] Loading error
                 print(f"Error loading movement sprite: {e}")  # [DEBUG] Print error
                 self._create_fallback_movement_sprite(i, left_path)  # [CALL] Fallback
@@ -140,103 +160,135 @@ class Player(pygame.sprite.Sprite):  # [CLASS] Player
         self.image = pygame.Surface(self.scaled_size)  # [CREATE] Fallback image
         self.image.fill((255, 0, 0))  # [COLOR] Red
         self.idle_sprites = [self.image, self.image]  # [ASSIGN] Fallback idle
+        self.left_idle_sprites = self.idle_sprites     # [ASSIGN] Fallback left idle
+        self.right_idle_sprites = self.idle_sprites    # [ASSIGN] Fallback right idle
         self.left_move_sprites = [self.image] * 3     # [ASSIGN] Fallback left move
         self.right_move_sprites = [self.image] * 3    # [ASSIGN] Fallback right move
 
+    def _stream_sprites(self):  # [METHOD] _stream_sprites
+        """Request the player frames from the asset streamer; each clip leaves its placeholder once all its frames arrive."""
+        animations = (
+            ('left_idle_sprites', self.left_idle_clip, ['left_idle_1.png', 'left_idle_2.png']),
+            ('right_idle_sprites', self.right_idle_clip, ['right_idle_1.png', 'right_idle_2.png']),
+            ('left_move_sprites', self.left_move_clip, [f'left_move_{i}.png' for i in range(1, 4)]),
+            ('right_move_sprites', self.right_move_clip, [f'move_right_{i}.png' for i in range(1, 4)]),
+        )
+        for attribute, clip, files in animations:  # [LOOP] One request per frame, completed per clip
+            frames = [None] * len(files)
+            for index, frame in enumerate(files):
+                path = os.path.join(self.base_dir, f'../assets/sprites/player/{frame}')  # [PATH] Frame path
+                callback = functools.partial(self._frame_streamed, attribute, clip, frames, index, path)
+                asset_streamer.request(path, self.scaled_size, priority=PRIORITY_HIGH, callback=callback)
+
+    def _frame_streamed(self, attribute, clip, frames, index, path, surface):  # [METHOD] _frame_streamed
+        """Store one streamed frame; when the clip's last frame is in, replace the placeholder clip."""
+        frames[index] = load_image(path, self.scaled_size)  # [LOAD] Cache hit; holds the frame like a synchronous load
+        if any(frame is None for frame in frames):
+            return
+        setattr(self, attribute, frames)  # [ASSIGN] Real frames
+        if attribute == 'left_idle_sprites':
+            self.idle_sprites = frames    # [ASSIGN] Default idle follows left idle
+        self.world.clips.replace_frames(clip, frames)
+
     def _setup_animation(self):  # [METHOD] _setup_animation
         """Setup animation timers and initial state."""
-        self.current_sprite = 0  # [ATTRIBUTE] Current animation frame index
-        self.animation_timer = 0  # [ATTRIBUTE] Animation timer
-        self.animation_delay = 167  # [ATTRIBUTE] Animation frame delay (ms)
-        self.last_update = pygame.time.get_ticks()  # [ATTRIBUTE] Last update time
         self.facing_left = True  # [ATTRIBUTE] Facing direction
-        self.current_animation = self.left_idle_sprites  # [ATTRIBUTE] Current animation list
+        # [ATTRIBUTE] Ids of the shared player clips (defined by the first player, reused afterwards)
+        clips = self.world.clips
+        self.left_idle_clip = clips.define('player/idle_left', self.left_idle_sprites, FRAME_MS, LOOP)
+        self.right_idle_clip = clips.define('player/idle_right', self.right_idle_sprites, FRAME_MS, LOOP)
+        self.left_move_clip = clips.define('player/move_left', self.left_move_sprites, FRAME_MS, LOOP)
+        self.right_move_clip = clips.define('player/move_right', self.right_move_sprites, FRAME_MS, LOOP)
         
-        self.image = self.current_animation[self.current_sprite]  # [ASSIGN] Initial image
+        self.image = self.left_idle_sprites[0]  # [ASSIGN] Initial image
         self.rect = self.image.get_rect()  # [ASSIGN] Update rect
         self.rect.center = (500, 500)      # [ASSIGN] Initial position
+        # [ATTRIBUTE] entity: id of the backing PLAYER entity
+        self.entity = self.world.spawn(PLAYER, self.rect.center, view=self, clip=self.left_idle_clip)
+
+    @property
+    def current_sprite(self):  # [PROPERTY] current_sprite
+        """Current animation frame index."""
+        return int(self.world.anim_frame[self.world.row(self.entity)])
 
     def _setup_movement(self):  # [METHOD] _setup_movement
         """Setup movement related attributes."""
         self.target_pos = None  # [ATTRIBUTE] Target position for movement
-        self.speed = 5          # [ATTRIBUTE] Movement speed
+        self.speed = 300        # [ATTRIBUTE] Movement speed (pixels per second)
 
     def _setup_shooting(self):  # [METHOD] _setup_shooting
         """Setup shooting related attributes."""
         self.can_shoot = True         # [ATTRIBUTE] Can shoot flag
         self.projectile_range = 500   # [ATTRIBUTE] Projectile range
+        self.projectile_speed = 600   # [ATTRIBUTE] Projectile speed (pixels per second)
 
     # def set_destination(self, pos):  # [METHOD] set_destination (commented)
     #     """Set new destination for the player to move to."""
     #     self.target_pos = pos
 
-    def update(self):  # [METHOD] update
-        """Update player state and handle input."""
-        self._handle_input()      # [CALL] Handle input
-        self._handle_movement()   # [CALL] Handle movement
-        self._handle_shooting()   # [CALL] Handle shooting
-        self._update_animation()  # [CALL] Update animation
+    def update(self, dt=FIXED_DT):  # [METHOD] update
+        """Handle input and steer the player for the next simulation step of dt seconds."""
+        self._handle_input()        # [CALL] Handle input
+        self._handle_movement(dt)   # [CALL] Handle movement
+        self._handle_shooting()     # [CALL] Handle shooting
 
     def _handle_input(self):  # [METHOD] _handle_input
         """Handle mouse input for movement."""
-        mouse_buttons = pygame.mouse.get_pressed()  # [INPUT] Mouse buttons
-        if mouse_buttons[2]:  # [CHECK] Right click
-            self.target_pos = pygame.mouse.get_pos()  # [ASSIGN] Set target position
+        state = self.input.state  # [INPUT] This tick's sampled input
+        if state.buttons & BUTTON_RIGHT:  # [CHECK] Right click
+            self.target_pos = state.mouse_pos  # [ASSIGN] Set target position
 
-    def _handle_movement(self):  # [METHOD] _handle_movement
-        """Handle player movement logic."""
+    def _handle_movement(self, dt):  # [METHOD] _handle_movement
+        """Set the player's velocity toward target_pos for a step of dt seconds, steering around obstacles."""
+        row = self.world.row(self.entity)  # [LOOKUP] Player's row in the world arrays
+        velocity = self.world.velocity[row]
         if not self.target_pos:  # [CHECK] No target
+            velocity[:] = 0.0    # [ASSIGN] Stand still
             return
             
-        dx = self.target_pos[0] - self.rect.centerx  # [CALC] X distance
-        dy = self.target_pos[1] - self.rect.centery  # [CALC] Y distance
+        x, y = self.world.position[row]              # [LOOKUP] Current centre
+        dx = self.target_pos[0] - x                  # [CALC] X distance
+        dy = self.target_pos[1] - y                  # [CALC] Y distance
         distance = math.sqrt(dx * dx + dy * dy)      # [CALC] Euclidean distance
+        step = self.speed * dt                       # [CALC] Distance covered this step
         
-        if distance > self.speed:  # [CHECK] Need to move
-            move_x = (dx / distance) * self.speed  # [CALC] X movement
-            move_y = (dy / distance) * self.speed  # [CALC] Y movement
+        if distance > step:  # [CHECK] Need to move
+            field = self.navigator.field(self.target_pos)  # [LOOKUP] Shared field (built once per destination)
+            ux, uy = field.steer(x, y, self.target_pos)    # [LOOKUP] O(1) direction around obstacles
+            if not (ux or uy):  # [CHECK] Destination unreachable from here
+                velocity[:] = 0.0
+                self.target_pos = None
+                self.world.play(self.entity, self.left_idle_clip if self.facing_left else self.right_idle_clip, restart=False)  # [ANIMATION] Idle
+                return
+            velocity[:] = (ux * self.speed, uy * self.speed)  # [ASSIGN] Full speed along the field
             
-            self.rect.x += move_x  # [MOVE] Update x
-            self.rect.y += move_y  # [MOVE] Update y
-            
-            if move_x < 0:  # [CHECK] Moving left
-                self.current_animation = self.left_move_sprites  # [ANIMATION] Left move
+            if ux < 0:  # [CHECK] Moving left
+                self.world.play(self.entity, self.left_move_clip, restart=False)  # [ANIMATION] Left move
                 self.facing_left = True
-            else:           # [CHECK] Moving right
-                self.current_animation = self.right_move_sprites  # [ANIMATION] Right move
+            else:       # [CHECK] Moving right
+                self.world.play(self.entity, self.right_move_clip, restart=False)  # [ANIMATION] Right move
                 self.facing_left = False
         else:
-            self.rect.center = self.target_pos  # [ASSIGN] Snap to target
+            velocity[:] = (dx / dt, dy / dt)    # [ASSIGN] Land exactly on the target this step
             self.target_pos = None              # [RESET] Clear target
-            self.current_animation = self.left_idle_sprites if self.facing_left else self.right_idle_sprites  # [ANIMATION] Idle
+            self.world.play(self.entity, self.left_idle_clip if self.facing_left else self.right_idle_clip, restart=False)  # [ANIMATION] Idle
 
     def _handle_shooting(self):  # [METHOD] _handle_shooting
         """Handle projectile firing logic."""
-        keys = pygame.key.get_pressed()  # [INPUT] Keyboard state
-        if not keys[pygame.K_SPACE]:     # [CHECK] Space not pressed
+        state = self.input.state  # [INPUT] This tick's sampled input
+        if not state.buttons & KEY_FIRE:  # [CHECK] Space not pressed
             self.can_shoot = True        # [RESET] Can shoot again
-        elif keys[pygame.K_SPACE] and self.can_shoot:  # [CHECK] Space just pressed
+        elif self.can_shoot:  # [CHECK] Space just pressed
             self.projectile_manager.fire_projectile(   # [CALL] Fire projectile
                 name='basic',
                 damage=10,
-                speed=10,
+                speed=self.projectile_speed,
                 range=self.projectile_range,
                 p_source=self,
-                p_target=pygame.mouse.get_pos()
+                p_target=state.mouse_pos
             )
             self.can_shoot = False  # [RESET] Prevent shooting until released
 
-    def _update_animation(self):  # [METHOD] _update_animation
-        """Update animation frames."""
-        now = pygame.time.get_ticks()  # [TIME] Current time
-        self.animation_timer += now - self.last_update  # [TIMER] Update timer
-        self.last_update = now
-        
-        if self.animation_timer >= self.animation_delay:  # [CHECK] Advance frame
-            self.animation_timer = 0
-            self.current_sprite = (self.current_sprite + 1) % len(self.current_animation)  # [FRAME] Next frame
-            self.image = self.current_animation[self.current_sprite]  # [ASSIGN] Update image
-
     # def set_projectile_range(self, new_range):  # [METHOD] set_projectile_range (commented)
     #     """Adjust the range of projectiles."""
     #     self.projectile_range = new_range
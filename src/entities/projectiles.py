@@ -1,36 +1,60 @@
 import pygame
 import os
 import math
+from systems.asset_cache import load_image, release_image
+from systems.rotation_cache import rotation_cache, ANGLE_STEPS
+
+# Sprite shared by every projectile; the asset cache keeps a single scaled copy
+PROJECTILE_IMG_PATH = os.path.join(os.path.dirname(__file__), '../assets/sprites/player/projectile_sub.png')
+PROJECTILE_SIZE = (16, 16)  # Adjust size as needed
+PROJECTILE_HEADING = -90.0  # The sprite art points up (screen degrees, clockwise from +x)
 
 class Projectile:
-    def __init__(self, name, damage, speed, range, p_source, p_target):
+    _load_error_reported = False  # Only report a missing sprite once, not on every shot
+    _fallback_image = None  # Red square shared by every projectile when the sprite is missing
+
+    def __init__(self, name=None, damage=0, speed=0, range=0, p_source=None, p_target=None):
+        self.active = False  # Pooled projectiles stay allocated while inactive
+
+        try:
+            # Load projectile image through the shared cache (decoded and scaled once per process)
+            self.image = load_image(PROJECTILE_IMG_PATH, PROJECTILE_SIZE)
+            self._owns_image = True
+        except (pygame.error, FileNotFoundError) as e:
+            if not Projectile._load_error_reported:
+                print(f"Error loading projectile image: {e}")
+                print(f"Attempted to load from: {PROJECTILE_IMG_PATH}")
+                Projectile._load_error_reported = True
+            # Create a default surface if image fails to load
+            if Projectile._fallback_image is None:
+                Projectile._fallback_image = pygame.Surface(PROJECTILE_SIZE)
+                Projectile._fallback_image.fill((255, 0, 0))  # Red rectangle as fallback
+            self.image = Projectile._fallback_image
+            self._owns_image = False
+
+        # The sprite pre-rotated to ANGLE_STEPS headings (rendered once per process, shared by every projectile)
+        self.rotations = rotation_cache.get(self.image, ANGLE_STEPS, PROJECTILE_HEADING)
+        
+        # Rect and velocity are allocated once and reused every time the projectile is spawned
+        self.rect = self.image.get_rect()
+        self.velocity = pygame.math.Vector2()
+        # Shift from rect.topleft to where the rotated image is drawn
+        self.draw_offset = (0, 0)
+
+        if p_source is not None:
+            self.spawn(name, damage, speed, range, p_source, p_target)
+
+    def spawn(self, name, damage, speed, range, p_source, p_target):
+        """(Re)initialize this projectile in place without allocating new objects."""
         self.name = name
         self.damage = damage
         self.speed = speed
         self.range = range
         self.p_source = p_source
         self.p_target = p_target
+        self.active = True
 
-        try:
-            # Load projectile image
-            projectile_img_path = os.path.join(os.path.dirname(__file__), '../assets/sprites/player/projectile_sub.png')
-            if not os.path.exists(projectile_img_path):
-                print(f"Warning: Projectile image not found at {projectile_img_path}")
-                raise FileNotFoundError
-                
-            self.image = pygame.image.load(projectile_img_path).convert_alpha()
-            # Scale the image to a smaller size
-            self.image = pygame.transform.scale(self.image, (16, 16))  # Adjust size as needed
-            
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"Error loading projectile image: {e}")
-            print(f"Attempted to load from: {projectile_img_path}")
-            # Create a default surface if image fails to load
-            self.image = pygame.Surface((16, 16))
-            self.image.fill((255, 0, 0))  # Red rectangle as fallback
-        
-        # Set up the rect and position it at the source's center
-        self.rect = self.image.get_rect()
+        # Position it at the source's center
         self.rect.center = p_source.rect.center
         
         # Calculate velocity based on target position
@@ -42,5 +66,24 @@ class Projectile:
         dx = target_x - self.rect.centerx
         dy = target_y - self.rect.centery
         distance = math.hypot(dx, dy)
-        self.velocity = pygame.math.Vector2(dx/distance * speed if distance > 0 else 0, 
-                                          dy/distance * speed if distance > 0 else 0)
+        if distance > 0:
+            self.velocity.update(dx / distance * speed, dy / distance * speed)
+        else:
+            self.velocity.update(0, 0)
+
+        # Face the direction of travel: nearest precomputed heading, chosen once per shot
+        bucket = self.rotations.bucket(self.velocity.x, self.velocity.y)
+        self.image = self.rotations.images[bucket]
+        self.draw_offset = self.rotations.offset_pairs[bucket]
+
+    def despawn(self):
+        """Mark this projectile inactive and drop references to its source and target."""
+        self.active = False
+        self.p_source = None
+        self.p_target = None
+
+    def release(self):
+        """Release the cached sprite reference held by this projectile."""
+        if self._owns_image:
+            release_image(PROJECTILE_IMG_PATH, PROJECTILE_SIZE)
+            self._owns_image = False
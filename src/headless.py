@@ -0,0 +1,163 @@
+import os
+import sys
+import random
+import argparse
+import pygame
+from systems.projectile_manager import create_projectile_manager
+from systems.game_loop import FIXED_DT, draw_interpolated
+from systems.asset_bundle import load_sprite_atlas
+from systems.asset_cache import asset_cache
+from systems.input_source import InputState, InputReplayer
+from systems.ecs import World
+from systems.enemy_spawner import EnemySpawner
+from systems.ai import AIScheduler
+from systems.timers import TimerWheel
+from systems.damage import DamagePipeline
+from entities.player import Player
+import entities.blue  # Registers the 'blue' enemy type
+
+"""headless runs the game simulation without a window, as fast as possible, from scripted input"""
+
+WORLD_SIZE = (1000, 1000)  # Same window size as the windowed game (the simulated world is camera.WORLD_RECT)
+
+
+def init_headless_display(size=WORLD_SIZE):
+    """Initialize pygame on the SDL dummy video driver and return an off-screen display surface."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # No window, no GPU; works on a plain Linux box
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode(size)  # Needed so convert_alpha() has a pixel format to convert to
+
+
+def patrol_script(ticks, fire_every=10, move_every=90, seed=0):
+    """Build a scripted input timeline: {tick: [(action, (x, y)), ...]} with moves and shots."""
+    rng = random.Random(seed)
+    script = {}
+    for tick in range(ticks):
+        actions = []
+        if tick % move_every == 0:
+            actions.append(('move', (rng.randint(100, 900), rng.randint(100, 900))))
+        if tick % fire_every == 0:
+            actions.append(('fire', (rng.randint(0, WORLD_SIZE[0] - 1), rng.randint(0, WORLD_SIZE[1] - 1))))
+        if actions:
+            script[tick] = actions
+    return script
+
+
+class _IdleInput:
+    """Input source for scripted runs: nothing held, mouse at the origin."""
+
+    def __init__(self):
+        self.state = InputState()
+        self.tick = 0
+        self.finished = False
+
+    def sample(self):
+        self.tick += 1
+        return self.state
+
+
+class HeadlessGame:
+    """The windowed game's world (player, enemies, projectiles) stepped without a window."""
+
+    def __init__(self, enemies=1, backend='objects', swept=False, render=False, seed=0, input_source=None, ai_workers=None):
+        self.screen = init_headless_display()  # Pixel format for convert_alpha(), and the render target
+        self.render = render  # Also draw into the off-screen surface, to include render cost
+        self.rng = random.Random(seed)
+        random.seed(seed)
+        # Scripted runs leave the input idle; a replayed recording drives the player like the windowed game's devices
+        self.input = input_source if input_source is not None else _IdleInput()
+
+        atlas = load_sprite_atlas()
+        if atlas is not None:
+            asset_cache.attach_atlas(atlas)
+
+        self.damage = DamagePipeline()  # Hits of this game, resolved once per tick
+        # Default bounds are the whole world, as in the windowed game, so replays cull projectiles identically
+        self.projectile_manager = create_projectile_manager(backend, swept=swept, damage_pipeline=self.damage)
+        self.world = World(enemies + 1)  # Each game gets its own entity storage
+        self.timers = TimerWheel()  # ... and its own timers, advanced with its ticks
+        self.player = Player(self.projectile_manager, self.input, self.world)
+
+        self.all_sprites = pygame.sprite.Group(self.player)
+        self.spawner = EnemySpawner(self.projectile_manager, self.world, groups=(self.all_sprites,), timers=self.timers)
+        positions = [(500, 200)] + [(self.rng.randint(50, 950), self.rng.randint(50, 950)) for _ in range(enemies - 1)]
+        # Dead enemies are never reaped here, so benchmark workloads keep a constant target count
+        self.enemies = self.spawner.spawn_wave('blue', enemies, positions=positions[:enemies])
+        # Enemies stand still unless AI is requested (0 workers = decided inline, as in recorded sessions)
+        self.ai = AIScheduler(self.world, workers=ai_workers) if ai_workers is not None else None
+        self.tick = 0
+
+    def apply(self, action, pos):
+        """Apply one scripted input action the way the player's mouse/keyboard handlers would."""
+        if action == 'move':
+            self.player.target_pos = pos
+        elif action == 'fire':
+            self.projectile_manager.fire_projectile(
+                name='basic',
+                damage=10,
+                speed=self.player.projectile_speed,
+                range=self.player.projectile_range,
+                p_source=self.player,
+                p_target=pos
+            )
+        else:
+            raise ValueError(f"Unknown scripted action: {action}")
+
+    def step(self, actions=()):
+        """Apply this tick's actions and advance the simulation by one fixed step."""
+        for action, pos in actions:
+            self.apply(action, pos)
+        self.input.sample()
+        self.timers.advance()
+        self.player.update(FIXED_DT)
+        if self.ai is not None:
+            self.ai.step()
+        self.world.step(FIXED_DT)
+        self.projectile_manager.update_projectiles(FIXED_DT)
+        self.damage.resolve()
+        if self.render:
+            self.screen.fill((0, 0, 0))
+            draw_interpolated(self.screen, self.all_sprites)
+            self.projectile_manager.draw_projectiles(self.screen)
+        self.tick += 1
+
+    def run(self, ticks, script=None):
+        """Step the simulation ticks times as fast as possible, following script if given."""
+        script = script or {}
+        for _ in range(ticks):
+            self.step(script.get(self.tick, ()))
+
+    def close(self):
+        """Stop the AI workers, if any."""
+        if self.ai is not None:
+            self.ai.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the simulation headless from a scripted input timeline.")
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--enemies', type=int, default=1)
+    parser.add_argument('--backend', choices=('objects', 'numpy'), default='objects')
+    parser.add_argument('--swept', action='store_true')
+    parser.add_argument('--render', action='store_true')
+    parser.add_argument('--replay', help="input log recorded with main.py --record; runs every recorded tick instead of the patrol script")
+    parser.add_argument('--ai-workers', type=int, help="run enemy AI with this many worker processes (0 = inline); replays always decide inline")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        replay = InputReplayer(args.replay)
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        game = HeadlessGame(args.enemies, args.backend, args.swept, args.render, replay.seed, replay, ai_workers=0)
+        game.run(len(replay))
+    else:
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        game = HeadlessGame(args.enemies, args.backend, args.swept, args.render, ai_workers=args.ai_workers)
+        game.run(args.ticks, patrol_script(args.ticks))
+    print(f"Simulated {game.tick} ticks; live projectiles: {len(game.projectile_manager)}")
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,26 @@
 import pygame
 import sys
 import os
+import random
 from systems.projectile_manager import ProjectileManager
 from entities.player import Player
-from entities.blue import Blue  # Add import for Blue
-import logging
+import entities.blue  # Registers the 'blue' enemy type with the spawner
 from systems.debug import DebugSystem as DS
+from systems.game_loop import FixedTimestep, FIXED_DT, record_positions, draw_interpolated
+from systems.asset_bundle import load_sprite_atlas
+from systems.asset_cache import asset_cache
+from systems.asset_streamer import asset_streamer, PRIORITY_HIGH
+from entities.projectiles import PROJECTILE_IMG_PATH, PROJECTILE_SIZE
+from systems.dirty_renderer import DirtyRectRenderer
+from systems.profiler import profiler
+from systems.input_source import live_input, InputRecorder, InputReplayer, EventDispatcher
+from systems.ecs import world
+from systems.enemy_spawner import EnemySpawner
+from systems.camera import Camera
+from systems.ai import AIScheduler
+from systems.telemetry import telemetry
+from systems.timers import timers
+from systems.damage import damage_pipeline
 
 
 # def setup_logging():
@@ -15,12 +30,30 @@ from systems.debug import DebugSystem as DS
 #         format='%(asctime)s - %(levelname)s - %(message)s'
 #     )
 
+# Telemetry channels written once per frame while recording
+PLAYER_X = telemetry.gauge('player.x')
+PLAYER_Y = telemetry.gauge('player.y')
+BLUE_X = telemetry.gauge('blue.x')
+BLUE_Y = telemetry.gauge('blue.y')
+LIVE_PROJECTILES = telemetry.gauge('projectiles.live')
+TRACE_WRITTEN = telemetry.event('profiler.trace_written', ('events',))
+DAMAGE_DEALT = telemetry.counter('damage.dealt')
+HITS = telemetry.counter('damage.hits')
+
+
+def log_damage(slots, amounts):
+    """Damage pipeline tap: total hits and damage per tick into telemetry counters."""
+    if telemetry.enabled:
+        telemetry.add(HITS, slots.size)
+        telemetry.add(DAMAGE_DEALT, float(amounts.sum()))
+
 """main executes all moodules and initializes an instance of the game"""
     
 def main():
     
     # Initialization - Setup working directory and initialize pygame
     
+    launch_dir = os.getcwd()  # [BUILT-IN] os module method - command-line paths are relative to where the game was started
     base_path = os.path.dirname(os.path.abspath(__file__)) # "getter" (retreives file path)
     os.chdir(base_path)  # [BUILT-IN] os module method - "setter" (sets working directory to src/) 
     pygame.init()  # [EXTERNAL] pygame module method
@@ -29,68 +62,175 @@ def main():
     # Sets the display
     screen = pygame.display.set_mode((1000, 1000))  # [EXTERNAL] pygame.display method - "setter" (sets display mode)
     clock = pygame.time.Clock()  # [EXTERNAL] pygame.time method
+    # Redraw and push only regions that changed when started with --dirty-rects (helps software rendering)
+    renderer = DirtyRectRenderer(screen, enabled='--dirty-rects' in sys.argv)  # [CUSTOM] systems.dirty_renderer.DirtyRectRenderer instance
+    # The world is larger than the window; the camera follows the player and decides what gets drawn
+    camera = Camera(screen.get_size())  # [CUSTOM] systems.camera.Camera instance
+    live_input.camera = camera  # [CUSTOM] systems.input_source.LiveInput.camera attribute - mouse positions become world positions
+
+    # Map the baked sprite bundle (or pack the PNGs into a sheet if it is stale) so entities load sub-rects of it
+    atlas = load_sprite_atlas()  # [CUSTOM] systems.asset_bundle.load_sprite_atlas function
+    if atlas is not None:
+        asset_cache.attach_atlas(atlas)  # [CUSTOM] systems.asset_cache.AssetCache.attach_atlas method
+
+    # Decode images off the main thread; entities show fallback sprites until their frames are swapped in
+    asset_streamer.start()  # [CUSTOM] systems.asset_streamer.AssetStreamer.start method - decode threads
+    asset_streamer.preload([(PROJECTILE_IMG_PATH, PROJECTILE_SIZE)], PRIORITY_HIGH)  # [CUSTOM] systems.asset_streamer.AssetStreamer.preload method - ready before the first shot
+
+    # Input is sampled once per simulation tick; --record PATH logs it, --replay PATH plays a log back instead of the devices
+    seed = 0  # [LOCAL] RNG seed; a replay restores the seed its recording ran with
+    input_source = live_input  # [CUSTOM] systems.input_source.LiveInput instance
+    if '--replay' in sys.argv[:-1]:
+        input_source = InputReplayer(os.path.join(launch_dir, sys.argv[sys.argv.index('--replay') + 1]))  # [CUSTOM] systems.input_source.InputReplayer instance
+        seed = input_source.seed
+    elif '--record' in sys.argv[:-1]:
+        input_source = InputRecorder(live_input, os.path.join(launch_dir, sys.argv[sys.argv.index('--record') + 1]), seed)  # [CUSTOM] systems.input_source.InputRecorder instance
+    random.seed(seed)  # [BUILT-IN] random module method - same seed + same input = same session
 
     # Initialize managers first
     projectile_manager = ProjectileManager()  # [CUSTOM] systems.projectile_manager.ProjectileManager instance
     
     # Initialize the player with the projectile manager
-    player = Player(projectile_manager)  # [CUSTOM] entities.player.Player instance
-    
-    # Initialize the blue with the projectile manager
-    blue_enemy = Blue(projectile_manager, position=(500, 200))  # [CUSTOM] entities.blue.Blue instance
+    player = Player(projectile_manager, input_source)  # [CUSTOM] entities.player.Player instance
     
-    # Register blue as a target for projectiles
-    projectile_manager.add_target(blue_enemy)  # [CUSTOM] systems.projectile_manager.ProjectileManager.add_target method - "setter" (adds target to projectile manager)
-
     # Add player to the sprite group
     all_sprites = pygame.sprite.Group()  # [EXTERNAL] pygame.sprite method
     all_sprites.add(player)  # [EXTERNAL] pygame.sprite.Group.add method - "setter" (adds sprite to group)
-    all_sprites.add(blue_enemy)  # [EXTERNAL] pygame.sprite.Group.add method - "setter" (adds sprite to group)
+
+    # Spawn the blue; the spawner registers it as a projectile target and adds it to the sprite group
+    spawner = EnemySpawner(projectile_manager, groups=(all_sprites,))  # [CUSTOM] systems.enemy_spawner.EnemySpawner instance
+    blue_enemy = spawner.spawn('blue', (500, 200))  # [CUSTOM] systems.enemy_spawner.EnemySpawner.spawn method - entities.blue.Blue instance
+
+    # Enemy AI runs in a worker pool (--ai-workers N, default 2); recording and replaying decide inline so sessions reproduce
+    ai_workers = int(sys.argv[sys.argv.index('--ai-workers') + 1]) if '--ai-workers' in sys.argv[:-1] else 2
+    if input_source is not live_input:
+        ai_workers = 0
+    ai = AIScheduler(world, workers=ai_workers)  # [CUSTOM] systems.ai.AIScheduler instance
 
     debug_system = DS()  # [CUSTOM] systems.debug.DebugSystem instance
+    timestep = FixedTimestep()  # [CUSTOM] systems.game_loop.FixedTimestep instance - fixed-dt accumulator
+
+    # Record every profiled scope as a Chrome trace when started with --profile-trace PATH
+    trace_path = None
+    if '--profile-trace' in sys.argv[:-1]:
+        trace_path = os.path.join(launch_dir, sys.argv[sys.argv.index('--profile-trace') + 1])
+        profiler.toggle()  # [CUSTOM] systems.profiler.Profiler.toggle method - tracing needs collection on
+        profiler.start_trace()  # [CUSTOM] systems.profiler.Profiler.start_trace method
+
+    # Event routing: device events feed live_input, key presses run bindings, other types run handlers
+    def quit_game(event=None):
+        nonlocal running
+        running = False
+
+    dispatcher = EventDispatcher(live_input)  # [CUSTOM] systems.input_source.EventDispatcher instance
+    dispatcher.on(pygame.QUIT, quit_game)  # Window close button clicked
+    dispatcher.on(pygame.VIDEOEXPOSE, lambda event: renderer.invalidate())  # Window was uncovered - repaint everything
+    dispatcher.on(pygame.WINDOWEXPOSED, lambda event: renderer.invalidate())
+    dispatcher.bind(pygame.K_ESCAPE, quit_game)  # Game exits if escape is pressed
+    dispatcher.bind(pygame.K_d, debug_system.toggle)  # Press 'D' to toggle debug mode
+    dispatcher.bind(pygame.K_h, debug_system.toggle_hitboxes)  # Press 'H' to show hitboxes
+    dispatcher.bind(pygame.K_p, lambda: debug_system.toggle_profiler(profiler))  # Press 'P' to show the frame profiler
+    dispatcher.allow()  # [CUSTOM] systems.input_source.EventDispatcher.allow method - SDL drops every other event type
+    # Space fires and Q/W/E/R are held-key bits in each tick's input state (systems.input_source.KEY_BITS)
+
+    # Stream counters, gauges and events to a JSONL file when started with --telemetry PATH
+    if '--telemetry' in sys.argv[:-1]:
+        telemetry.start(os.path.join(launch_dir, sys.argv[sys.argv.index('--telemetry') + 1]))  # [CUSTOM] systems.telemetry.Telemetry.start method - background flush thread
+        damage_pipeline.tap(log_damage)  # [CUSTOM] systems.damage.DamagePipeline.tap method - reads each tick's hits in place
 
     # Main game loop
     running = True
+    frame_time = 0.0  # [LOCAL] seconds of real time since the previous frame
     while running:
-        # Handle events
-        for event in pygame.event.get():  # [EXTERNAL] pygame.event method - "getter" (gets all events)
-            # Window close button clicked
-            if event.type == pygame.QUIT:  # System event
-                running = False
-            
-            # Game exits if escape is pressed
-            if event.type == pygame.KEYDOWN:  # Keyboard event
-                if event.key == pygame.K_ESCAPE:  # Specific key check
-                    running = False
-                if event.key == pygame.K_d:  # Press 'D' to toggle debug mode
-                    debug_system.toggle()  # [CUSTOM] systems.debug.DebugSystem.toggle method - "setter" (toggles debug mode)
-                if event.key == pygame.K_h:  # Press 'H' to show hitboxes
-                    debug_system.toggle_hitboxes()  # [CUSTOM] systems.debug.DebugSystem.toggle_hitboxes method - "setter" (toggles hitbox visibility)
-
-        # Update all game objects
-        all_sprites.update()  # [EXTERNAL] pygame.sprite.Group.update method
-        projectile_manager.update_projectiles()  # [CUSTOM] systems.projectile_manager.ProjectileManager.update_projectiles method
-
-        # Render everything
-        screen.fill((0, 0, 0))  # [EXTERNAL] pygame.Surface.fill method - "setter" (sets screen color)
-        all_sprites.draw(screen)  # [EXTERNAL] pygame.sprite.Group.draw method
-        projectile_manager.draw_projectiles(screen)  # [CUSTOM] systems.projectile_manager.ProjectileManager.draw_projectiles method
+        profiler.begin_frame()  # [CUSTOM] systems.profiler.Profiler.begin_frame method - no-op unless profiling
+
+        # Handle events: one pass over the filtered queue, routed through the tables set up above
+        profiler.begin('events')
+        dispatcher.dispatch()  # [CUSTOM] systems.input_source.EventDispatcher.dispatch method - device state, key bindings, handlers
+        profiler.end('events')
+
+        # Swap in images the streamer finished decoding (safe point: nothing is being simulated or drawn)
+        profiler.begin('assets')
+        asset_streamer.pump()  # [CUSTOM] systems.asset_streamer.AssetStreamer.pump method - convert, cache, run callbacks
+        profiler.end('assets')
+
+        # Update all game objects in fixed simulation steps, however long the last frame took
+        for _ in range(timestep.begin_frame(frame_time)):  # [CUSTOM] systems.game_loop.FixedTimestep.begin_frame method
+            record_positions(all_sprites)  # [CUSTOM] systems.game_loop.record_positions - previous state for interpolation
+            input_source.sample()  # [CUSTOM] systems.input_source sample method - this tick's mouse/keys (live or replayed)
+            timers.advance()  # [CUSTOM] systems.timers.TimerWheel.advance method - runs cooldowns and effects due this tick
+            profiler.begin('sprites')
+            player.update(FIXED_DT)  # [CUSTOM] entities.player.Player.update method - input and steering
+            ai.step()  # [CUSTOM] systems.ai.AIScheduler.step method - applies finished enemy decisions, sends a new snapshot
+            world.step(FIXED_DT)  # [CUSTOM] systems.ecs.World.step method - batched movement, damage, animation and hitbox sync
+            profiler.end('sprites')
+            profiler.begin('projectiles')
+            projectile_manager.update_projectiles(FIXED_DT)  # [CUSTOM] systems.projectile_manager.ProjectileManager.update_projectiles method
+            damage_pipeline.resolve()  # [CUSTOM] systems.damage.DamagePipeline.resolve method - one take_damage per enemy hit this tick
+            profiler.end('projectiles')
+            spawner.reap()  # [CUSTOM] systems.enemy_spawner.EnemySpawner.reap method - pools enemies whose health reached 0
+        if input_source.finished:  # A replay ends when its recorded ticks run out
+            running = False
+        alpha = timestep.alpha  # [CUSTOM] systems.game_loop.FixedTimestep.alpha - fraction of the next step already elapsed
+
+        # Render what the camera sees, interpolated between the last two simulation states (off-screen entities keep simulating)
+        profiler.begin('draw')
+        camera.follow(player, alpha)  # [CUSTOM] systems.camera.Camera.follow method - centre on where the player is drawn
+        renderer.begin_frame()  # [CUSTOM] systems.dirty_renderer.DirtyRectRenderer.begin_frame method - clears last frame's regions
+        visible = camera.visible(world)  # [CUSTOM] systems.camera.Camera.visible method - views overlapping the viewport
+        draw_interpolated(renderer, visible, alpha, camera.offset)  # [CUSTOM] systems.game_loop.draw_interpolated function
+        projectile_manager.draw_projectiles(renderer, alpha, camera)  # [CUSTOM] systems.projectile_manager.ProjectileManager.draw_projectiles method
         
         # Draw hitboxes when debug mode is enabled
         if debug_system.show_hitboxes:  # [CUSTOM] systems.debug.DebugSystem.show_hitboxes attribute - "getter" (gets hitbox visibility state)
-            blue_enemy.draw_hitbox(screen)  # [CUSTOM] entities.blue.Blue.draw_hitbox method
+            for enemy in spawner.active:  # [CUSTOM] systems.enemy_spawner.EnemySpawner.active attribute - live enemies
+                if camera.rect.colliderect(enemy.hitbox):
+                    renderer.mark(enemy.draw_hitbox(screen, camera.offset))  # [CUSTOM] entities.blue.Blue.draw_hitbox method
         
+        profiler.end('draw')
+
         # Render debug info at the end
-        debug_system.render_debug_info(screen, player, clock)  # [CUSTOM] systems.debug.DebugSystem.render_debug_info method
-        
-        pygame.display.flip()  # [EXTERNAL] pygame.display method - "setter" (updates the full display)
+        profiler.begin('debug')
+        debug_system.render_debug_info(renderer, player, clock)  # [CUSTOM] systems.debug.DebugSystem.render_debug_info method
+        debug_system.render_health(renderer, projectile_manager.targets, camera)  # [CUSTOM] systems.debug.DebugSystem.render_health method
+        debug_system.render_profiler(renderer, profiler)  # [CUSTOM] systems.debug.DebugSystem.render_profiler method - graph of previous frames
+        profiler.end('debug')
+
+        profiler.begin('present')
+        renderer.present()  # [CUSTOM] systems.dirty_renderer.DirtyRectRenderer.present method - updates dirty regions (or flips)
+        profiler.end('present')
+
+        # Per-frame counts shown under the profiler graph
+        profiler.count('projectiles', len(projectile_manager))  # [CUSTOM] systems.profiler.Profiler.count method
+        profiler.count('targets', len(projectile_manager.targets))
+        profiler.count('collision tests', projectile_manager.collision_tests)
+        profiler.count('drawn sprites', len(visible))
+        profiler.count('streaming assets', len(asset_streamer))
+        profiler.end_frame()  # [CUSTOM] systems.profiler.Profiler.end_frame method - the frame-rate wait is not counted
+
+        # Cap the frame rate; the measured frame time feeds the next frame's simulation steps
+        frame_time = clock.tick(60) / 1000.0  # [EXTERNAL] pygame.time.Clock.tick method - "setter" (sets frame rate)
+
+        # Telemetry gauges instead of per-frame logging; formatted and written by the flush thread only when recording
+        if telemetry.enabled:  # [CUSTOM] systems.telemetry.Telemetry.enabled attribute - skipped entirely when off
+            telemetry.set(PLAYER_X, player.rect.centerx)  # [CUSTOM] systems.telemetry.Telemetry.set method
+            telemetry.set(PLAYER_Y, player.rect.centery)
+            telemetry.set(BLUE_X, blue_enemy.rect.centerx)
+            telemetry.set(BLUE_Y, blue_enemy.rect.centery)
+            telemetry.set(LIVE_PROJECTILES, len(projectile_manager))
+            telemetry.sample()  # [CUSTOM] systems.telemetry.Telemetry.sample method - changed gauges/counters into the ring
+
+    if trace_path is not None:
+        events = profiler.dump_trace(trace_path)  # [CUSTOM] systems.profiler.Profiler.dump_trace method - open in chrome://tracing or Perfetto
+        if telemetry.enabled:
+            telemetry.emit(TRACE_WRITTEN, events)  # [CUSTOM] systems.telemetry.Telemetry.emit method - status as an event, not a print
 
-        # Cap the frame rate
-        clock.tick(60)  # [EXTERNAL] pygame.time.Clock.tick method - "setter" (sets frame rate)
+    telemetry.stop()  # [CUSTOM] systems.telemetry.Telemetry.stop method - writes what is left in the ring
+    ai.close()  # [CUSTOM] systems.ai.AIScheduler.close method - stops the workers and frees the shared snapshots
+    asset_streamer.stop()  # [CUSTOM] systems.asset_streamer.AssetStreamer.stop method - joins the decode threads
 
-        # Instead of print statements, use logging
-        logging.debug(f"Player position: {player.rect.center}")  # [BUILT-IN] logging module method - "getter" (gets player position)
-        logging.debug(f"blue position: {blue_enemy.rect.center}")  # [BUILT-IN] logging module method - "getter" (gets blue position)
+    if input_source is not live_input:
+        input_source.close()  # [CUSTOM] systems.input_source close method - flushes a recording
 
     # Clean up properly
     pygame.quit()  # [EXTERNAL] pygame module method
@@ -0,0 +1,218 @@
+import multiprocessing   # [library import] - multiprocessing: worker pool outside the GIL
+from multiprocessing import shared_memory  # [library import] - snapshot/command exchange without pickling arrays
+import numpy as np       # [library import] - numpy: views over the shared buffers and vectorized decisions
+from systems.ecs import POSITION, HEALTH, FACTION_PLAYER, FACTION_ENEMY  # [ecs import] - rows the snapshot reads
+
+# [constants] - decision tuning (world pixels, pixels per second)
+ENGAGE_RANGE = 700       # [constant] - enemies farther than this from the player idle
+KITE_MAX = 380           # [constant] - beyond this, close in
+KITE_MIN = 240           # [constant] - inside this, back off
+ENEMY_SPEED = 120        # [constant] - speed of every AI-driven move
+
+# [constants] - command kinds in the command buffer
+CMD_NONE = 0             # [command] - leave the entity as it is
+CMD_MOVE = 1             # [command] - set the entity's velocity
+
+# [constants] - buffer layout
+HEADER_FIELDS = 4        # [layout] - tick, enemy count, player x, player y
+BUFFERS = 2              # [layout] - one snapshot is filled while the other is being decided on
+
+
+# [buffer class] - One snapshot plus the commands decided from it, in a single shared memory block
+class AIBuffer:
+    """Header, enemy ids/positions/health and the command arrays, as NumPy views over shared memory."""
+
+    # [constructor] - creates (name=None) or attaches to a block
+    def __init__(self, capacity: int, name: str = None) -> None:
+        """Create a block for capacity enemies, or attach to the existing block called name."""
+        self.capacity = capacity
+        size = 8 * HEADER_FIELDS + capacity * (8 + 8 * 2 + 4 + 1 + 4 * 2)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)  # [ownership] - only the creator unlinks
+        buf = self.shm.buf
+        offset = 0
+
+        def view(shape, dtype):
+            nonlocal offset
+            array = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+            offset += array.nbytes
+            return array
+
+        # [snapshot] - written by the main thread, read-only for workers
+        self.header = view((HEADER_FIELDS,), np.float64)
+        self.entity = view((capacity,), np.int64)
+        self.position = view((capacity, 2), np.float64)
+        self.health = view((capacity,), np.int32)
+        # [commands] - each worker writes only the rows of its slice
+        self.command = view((capacity,), np.int8)
+        self.velocity = view((capacity, 2), np.float32)
+
+    # [property] - the shared block's name, passed to workers
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    # [public method] - releases the mapping (and the block, for its creator)
+    def close(self, unlink: bool = False) -> None:
+        """Drop the NumPy views and close the mapping; unlink=True also frees the block."""
+        self.header = self.entity = self.position = self.health = self.command = self.velocity = None
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+# [decision function] - the enemy brain, vectorized over a slice of the snapshot
+def decide(buffer: AIBuffer, start: int, stop: int) -> None:
+    """Fill the commands of rows [start, stop): close in, back off or circle to stay at kiting range of the player."""
+    player = buffer.header[2:4]
+    offset = player - buffer.position[start:stop]
+    distance = np.hypot(offset[:, 0], offset[:, 1])
+    toward = offset / np.maximum(distance, 1e-9)[:, None]
+    # [circle] - perpendicular to the player direction, alternating sides by entity id
+    side = np.where(buffer.entity[start:stop] % 2 == 0, 1.0, -1.0)[:, None]
+    direction = np.where((distance > KITE_MAX)[:, None], toward,
+                         np.where((distance < KITE_MIN)[:, None], -toward, toward[:, ::-1] * [-1.0, 1.0] * side))
+    active = (distance <= ENGAGE_RANGE) & (buffer.health[start:stop] > 0)
+    buffer.velocity[start:stop] = np.where(active[:, None], direction * ENEMY_SPEED, 0.0)
+    buffer.command[start:stop] = CMD_MOVE
+
+
+# [worker state] - buffers attached once per worker process
+_attached = {}
+
+
+# [worker function] - runs in a pool process
+def _decide_slice(name: str, capacity: int, start: int, stop: int) -> int:
+    """Attach to the shared buffer called name (once per process), decide rows [start, stop) and return the row count."""
+    buffer = _attached.get(name)
+    if buffer is None:
+        buffer = _attached[name] = AIBuffer(capacity, name)
+    decide(buffer, start, stop)
+    return stop - start
+
+
+# [scheduler class] - Snapshots the world, farms decisions out, applies the results
+class AIScheduler:
+    """Run enemy AI in a process pool from shared-memory snapshots of a World.
+
+    Every interval ticks, step() copies the enemy rows into a free buffer and
+    submits one job per slice. Finished buffers are applied on the main thread
+    at the start of a later step, so decisions usually land a tick late. The
+    call never waits: if every buffer is still busy the snapshot is skipped
+    and enemies keep following their last commands. With workers=0 decisions
+    are computed inline in the same step (deterministic, for recording and
+    replays).
+    """
+
+    # [constructor] - allocates the buffers and starts the pool
+    def __init__(self, world, workers: int = 2, interval: int = 1, capacity: int = 1024) -> None:
+        """Initialize a scheduler for world's enemies using workers processes (0 = inline)."""
+        self.world = world
+        self.workers = workers          # [attribute] - pool size; 0 runs decide() on the main thread
+        self.interval = interval        # [attribute] - ticks between snapshots
+        self.capacity = capacity        # [attribute] - most enemies one snapshot holds
+        self.tick = 0                   # [attribute] - steps run so far
+        self.buffers = [AIBuffer(capacity) for _ in range(BUFFERS if workers else 1)]
+        self._jobs = [None] * len(self.buffers)  # [attribute] - buffer index -> pending AsyncResults (None = free)
+        self._pool = multiprocessing.get_context('spawn').Pool(workers) if workers else None
+        # [stats]
+        self.submitted = 0              # [attribute] - snapshots sent to the pool (or decided inline)
+        self.applied = 0                # [attribute] - command buffers applied
+        self.skipped = 0                # [attribute] - snapshots skipped because every buffer was busy
+        self.latency = 0                # [attribute] - ticks between the last applied snapshot and its application
+        self.truncated = 0              # [attribute] - enemies left out of the last snapshot (over capacity)
+
+    # [public method] - one simulation tick of AI
+    def step(self) -> None:
+        """Apply finished decisions, then snapshot the world if one is due and a buffer is free."""
+        self._collect()
+        if self.tick % self.interval == 0:
+            index = self._free_buffer()
+            if index is None:
+                self.skipped += 1  # [graceful degradation] - workers are behind; keep the last commands
+            else:
+                self._submit(index)
+        self.tick += 1
+
+    # [helper method] - index of a buffer nobody is reading
+    def _free_buffer(self):
+        for index, job in enumerate(self._jobs):
+            if job is None:
+                return index
+        return None
+
+    # [helper method] - writes a snapshot and hands it to the workers
+    def _submit(self, index: int) -> None:
+        world = self.world
+        buffer = self.buffers[index]
+        enemies = world.select(POSITION | HEALTH, faction=FACTION_ENEMY)
+        players = world.select(POSITION, faction=FACTION_PLAYER)
+        count = min(enemies.size, self.capacity)
+        self.truncated = enemies.size - count
+        enemies = enemies[:count]
+        player = world.position[players[0]] if players.size else (0.0, 0.0)
+        buffer.header[:] = (self.tick, count, player[0], player[1])
+        buffer.entity[:count] = world.entity[enemies]
+        buffer.position[:count] = world.position[enemies]
+        buffer.health[:count] = world.health[enemies]
+        buffer.command[:count] = CMD_NONE
+        self.submitted += 1
+        if self._pool is None:
+            decide(buffer, 0, count)
+            self._apply(buffer)
+            return
+        # [slices] - one contiguous range of rows per worker
+        bounds = np.linspace(0, count, self.workers + 1).astype(int)
+        self._jobs[index] = [self._pool.apply_async(_decide_slice, (buffer.name, self.capacity, int(start), int(stop)))
+                             for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    # [helper method] - applies every buffer whose slices are all done, oldest snapshot first
+    def _collect(self) -> None:
+        done = [index for index, job in enumerate(self._jobs)
+                if job is not None and all(result.ready() for result in job)]
+        done.sort(key=lambda index: self.buffers[index].header[0])
+        for index in done:
+            for result in self._jobs[index]:
+                result.get()  # [errors] - re-raise a worker exception on the main thread
+            self._apply(self.buffers[index])
+            self._jobs[index] = None
+
+    # [helper method] - writes decided velocities into the world
+    def _apply(self, buffer: AIBuffer) -> None:
+        world = self.world
+        count = int(buffer.header[1])
+        velocity = world.velocity
+        moves = np.flatnonzero(buffer.command[:count] == CMD_MOVE)
+        for entity, vx, vy in zip(buffer.entity[moves].tolist(), buffer.velocity[moves, 0].tolist(),
+                                  buffer.velocity[moves, 1].tolist()):
+            try:
+                row = world.row(entity)
+            except KeyError:  # [stale] - the enemy died since the snapshot
+                continue
+            velocity[row] = (vx, vy)
+        self.applied += 1
+        self.latency = self.tick - int(buffer.header[0])
+
+    # [public method] - stops the pool and frees the shared memory
+    def close(self) -> None:
+        """Terminate the workers and release every buffer."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        for buffer in self.buffers:
+            buffer.close(unlink=True)
+        self.buffers = []
+
+    # [public method] - returns scheduler counters for debugging
+    def stats(self) -> dict:
+        """Return submitted, applied and skipped snapshot counts plus the last latency in ticks."""
+        return {
+            'submitted': self.submitted,
+            'applied': self.applied,
+            'skipped': self.skipped,
+            'latency': self.latency,
+            'truncated': self.truncated,
+        }
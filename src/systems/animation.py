@@ -0,0 +1,83 @@
+import numpy as np   # [library import] - numpy: per-clip lookup arrays used by the batched animation system
+
+# [constants] - what a clip does after its last frame
+LOOP = 0     # [mode] - wrap to the first frame
+ONCE = 1     # [mode] - hold the last frame
+
+
+# [clip class] - One immutable animation shared by every entity that plays it
+class AnimationClip:
+    """Frames and timing of an animation; never modified after definition."""
+    __slots__ = ('id', 'name', 'frames', 'frame_ms', 'mode')
+
+    # [constructor] - freezes the frame list into a tuple
+    def __init__(self, clip_id: int, name: str, frames, frame_ms: float, mode: int):
+        """Initialize a clip showing each of frames for frame_ms, then looping or holding per mode."""
+        self.id = clip_id                 # [attribute] - index into the library's lookup arrays
+        self.name = name                  # [attribute] - e.g. 'blue/damage_left'
+        self.frames = tuple(frames)       # [attribute] - frame Surfaces in play order
+        self.frame_ms = frame_ms          # [attribute] - ms each frame is shown
+        self.mode = mode                  # [attribute] - LOOP or ONCE
+
+
+# [library class] - Registry of clips by name with flat arrays for vectorized playback
+class ClipLibrary:
+    """Define each clip once by name; entities refer to clips by id and keep only a playhead."""
+
+    # [constructor] - empty registry and lookup arrays
+    def __init__(self) -> None:
+        """Initialize an empty library."""
+        self.clips = []            # [attribute] - clip id -> AnimationClip
+        self._by_name = {}         # [attribute] - name -> clip id
+        self.frame_ms = np.zeros(0, dtype=np.float64)      # [array] - clip id -> ms per frame
+        self.length = np.zeros(0, dtype=np.int32)          # [array] - clip id -> frame count
+        self.mode = np.zeros(0, dtype=np.int8)             # [array] - clip id -> LOOP / ONCE
+        self.revision = 0          # [attribute] - bumped whenever a clip's frames are replaced
+
+    # [public method] - registers a clip, or returns the existing one with that name
+    def define(self, name: str, frames, frame_ms: float, mode: int = LOOP) -> int:
+        """Return the id of clip name, defining it from frames on first use."""
+        clip_id = self._by_name.get(name)
+        if clip_id is not None:
+            return clip_id
+        clip_id = len(self.clips)
+        self.clips.append(AnimationClip(clip_id, name, frames, frame_ms, mode))
+        self._by_name[name] = clip_id
+        self.frame_ms = np.append(self.frame_ms, frame_ms)
+        self.length = np.append(self.length, np.int32(max(1, len(frames))))
+        self.mode = np.append(self.mode, np.int8(mode))
+        return clip_id
+
+    # [public method] - swaps a clip's frames (placeholder -> streamed art)
+    def replace_frames(self, clip_id: int, frames) -> None:
+        """Replace the frames of clip clip_id, keeping its id and timing; worlds resync on the next step."""
+        old = self.clips[clip_id]
+        self.clips[clip_id] = AnimationClip(clip_id, old.name, frames, old.frame_ms, old.mode)
+        self.length[clip_id] = max(1, len(frames))
+        self.revision += 1
+
+    # [public method] - looks up a clip id by name
+    def get(self, name: str):
+        """Return the id of clip name, or None if it has not been defined."""
+        return self._by_name.get(name)
+
+    # [public method] - a frame of a clip
+    def frame(self, clip_id: int, index: int):
+        """Return frame index of clip clip_id."""
+        return self.clips[clip_id].frames[index]
+
+    # [vectorized helper] - frames for many playheads at one timestamp
+    def advance(self, clip: np.ndarray, start: np.ndarray, now: float):
+        """Return the frame index of every (clip, start) playhead at now."""
+        elapsed = now - start
+        length = self.length[clip]
+        frame = (elapsed // self.frame_ms[clip]).astype(np.int32)
+        return np.where(self.mode[clip] == LOOP, frame % length, np.minimum(frame, length - 1))
+
+    # [dunder method] - number of clips
+    def __len__(self) -> int:
+        return len(self.clips)
+
+
+# [module instance] - clips shared by every world and entity
+clip_library = ClipLibrary()
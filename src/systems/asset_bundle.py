@@ -0,0 +1,142 @@
+import os            # [library import] - os: paths
+import sys           # [library import] - sys: byte order of the baked pixel data
+import json          # [library import] - json: bundle manifest
+import mmap          # [library import] - mmap: bundle pixels are mapped, not read
+import struct        # [library import] - struct: fixed-size bundle header
+import hashlib       # [library import] - hashlib: content hash of the source sprites
+import pygame        # [library import] - pygame: frombuffer surfaces
+from systems import atlas as atlas_module  # [module import] - sprite tree, draw sizes and the sheet packer
+
+# [constants] - bundle location and layout
+BUNDLE_PATH = os.path.normpath(os.path.join(os.path.dirname(__file__), '../assets/bundle/sprites.bundle'))
+BUNDLE_MAGIC = b'MEMBNDL1'           # [constant] - identifies the file format and its version
+HEADER = struct.Struct('<8sI')       # [constant] - magic, manifest length in bytes
+DATA_ALIGN = 16                      # [constant] - pixel blobs start on this byte boundary
+# [constant] - bytes in the order of a native ARGB8888 surface, so frombuffer output needs no conversion
+PIXEL_FORMAT = 'BGRA' if sys.byteorder == 'little' else 'ARGB'
+
+
+# [public function] - hash of everything that determines the baked pixels
+def content_hash(root: str = atlas_module.SPRITE_ROOT) -> str:
+    """Return a SHA-256 over every source sprite's bytes, its draw size and the bundle format."""
+    digest = hashlib.sha256(BUNDLE_MAGIC + PIXEL_FORMAT.encode())
+    for name in atlas_module.collect_sprites(root):
+        size = atlas_module.FRAME_SIZES.get(name, atlas_module.DEFAULT_FRAME_SIZE)
+        digest.update(f"{name}:{size[0]}x{size[1]}:".encode())
+        with open(os.path.join(root, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+# [public function] - cheap fingerprint of the source sprites, compared at every startup
+def source_stats(root: str = atlas_module.SPRITE_ROOT) -> dict:
+    """Return {name: [size in bytes, mtime in ns]} for every source sprite (stat only, no reads)."""
+    stats = {}
+    for name in atlas_module.collect_sprites(root):
+        info = os.stat(os.path.join(root, name))
+        stats[name] = [info.st_size, info.st_mtime_ns]
+    return stats
+
+
+# [public function] - the bake step
+def bake_bundle(root: str = atlas_module.SPRITE_ROOT, path: str = BUNDLE_PATH) -> dict:
+    """Write pre-scaled, pre-packed sheet pixels plus a manifest to a single bundle file; return the manifest."""
+    sheet, rects, _ = atlas_module.render_sheet(root)
+    pixels = pygame.image.tobytes(sheet, PIXEL_FORMAT)
+    manifest = {
+        'content_hash': content_hash(root),
+        'sources': source_stats(root),
+        'pixel_format': PIXEL_FORMAT,
+        'sheet': {'size': list(sheet.get_size()), 'length': len(pixels)},
+        'frames': {name: list(rect) for name, rect in rects.items()},
+    }
+    manifest_bytes = json.dumps(manifest, separators=(',', ':')).encode()
+    # [alignment] - pad the manifest so the pixel data starts on a DATA_ALIGN boundary
+    manifest_bytes += b' ' * (-(HEADER.size + len(manifest_bytes)) % DATA_ALIGN)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(BUNDLE_MAGIC, len(manifest_bytes)))
+        f.write(manifest_bytes)
+        f.write(pixels)
+    return manifest
+
+
+# [public function] - maps a bundle and builds an atlas straight from its bytes
+def load_bundle(root: str = atlas_module.SPRITE_ROOT, path: str = BUNDLE_PATH, verify: bool = False):
+    """Return a SpriteAtlas backed by the memory-mapped bundle, or None if it is missing or stale.
+
+    Staleness is judged from the size and mtime of each source sprite;
+    verify=True also re-hashes their contents (slow, for checking a bake).
+    A file that is not a readable bundle (bad magic, truncated, corrupt
+    manifest) raises ValueError or OSError instead, so callers can tell the two apart.
+    """
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None
+    with f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        magic, manifest_length = HEADER.unpack_from(mapped, 0)
+        if magic != BUNDLE_MAGIC:
+            raise ValueError(f"{path} is not an asset bundle (bad magic)")
+        if HEADER.size + manifest_length > len(mapped):
+            raise ValueError(f"{path} is truncated (manifest cut short)")
+        manifest = json.loads(mapped[HEADER.size:HEADER.size + manifest_length])
+        info = manifest['sheet']
+        start = HEADER.size + manifest_length
+        if start + info['length'] > len(mapped):
+            raise ValueError(f"{path} is truncated (sheet cut short)")
+    except (KeyError, TypeError, struct.error) as e:
+        mapped.close()
+        raise ValueError(f"{path} has a corrupt header or manifest: {e!r}") from e
+    except ValueError:
+        mapped.close()
+        raise
+    if (manifest.get('pixel_format') != PIXEL_FORMAT or manifest.get('sources') != source_stats(root)
+            or (verify and manifest.get('content_hash') != content_hash(root))):
+        mapped.close()
+        return None
+
+    buffer = memoryview(mapped)[start:start + info['length']]
+    sheet = pygame.image.frombuffer(buffer, tuple(info['size']), PIXEL_FORMAT)  # [no decode] - pixels used in place
+    display = pygame.display.get_surface()
+    if display is not None and sheet.get_masks() != pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks():
+        sheet = sheet.convert_alpha()  # [fallback] - only copy if the display format differs from the baked one
+
+    frames = {name: pygame.Rect(rect) for name, rect in manifest['frames'].items()}
+    bundle_atlas = atlas_module.SpriteAtlas(sheet, frames, root)
+    bundle_atlas.mapping = (mapped, buffer)  # [lifetime] - the surface borrows these bytes; keep them alive
+    return bundle_atlas
+
+
+# [public function] - used at startup: bundle first, then the PNG atlas / per-file loaders
+def load_sprite_atlas(root: str = atlas_module.SPRITE_ROOT, path: str = BUNDLE_PATH):
+    """Return the bundle-backed atlas if it matches the sprites on disk, else the built PNG atlas (or None)."""
+    try:
+        bundle_atlas = load_bundle(root, path)
+    except (pygame.error, OSError, ValueError, KeyError) as e:
+        print(f"Asset bundle unreadable, falling back to image loading: {e}")
+        return atlas_module.load_atlas(root)
+    if bundle_atlas is not None:
+        return bundle_atlas
+    if os.path.exists(path):
+        print("Asset bundle is stale; run `python -m systems.asset_bundle` from src/ to re-bake it")
+    return atlas_module.load_atlas(root)
+
+
+if __name__ == "__main__":
+    # [bake step] - run from src/ as `python -m systems.asset_bundle` (--verify checks the existing bundle instead)
+    if '--verify' in sys.argv[1:]:
+        pygame.display.init()
+        try:
+            ok = load_bundle(verify=True) is not None
+        except (pygame.error, OSError, ValueError, KeyError) as e:
+            print(f"{BUNDLE_PATH} is unreadable: {e}")
+            sys.exit(1)
+        print(f"{BUNDLE_PATH} {'matches' if ok else 'does not match'} the sprite contents")
+        sys.exit(0 if ok else 1)
+    baked = bake_bundle()
+    print(f"Baked {len(baked['frames'])} frames ({baked['sheet']['size']} sheet) into {BUNDLE_PATH}")
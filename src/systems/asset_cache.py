@@ -0,0 +1,150 @@
+import os            # [library import] - os: used to normalise asset paths into cache keys
+from collections import OrderedDict  # [library import] - OrderedDict: keeps entries in LRU order
+import pygame        # [library import] - pygame: image loading, conversion and scaling
+
+# [constants] - conversion flags that form part of a cache key
+CONVERT_NONE = 0     # [flag] - keep the surface exactly as decoded
+CONVERT = 1          # [flag] - Surface.convert() to the display format
+CONVERT_ALPHA = 2    # [flag] - Surface.convert_alpha() to the display format with per-pixel alpha
+
+
+# [cache class] - Process-wide store of decoded, converted and scaled surfaces
+class AssetCache:
+    """Cache surfaces keyed by (path, size, flags) with reference counting and LRU eviction."""
+
+    # [constructor] - sets up the entry table, refcounts and failure memo
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize an empty cache holding at most max_entries unreferenced surfaces."""
+        self.max_entries = max_entries  # [attribute] - soft cap; only unreferenced entries are evicted
+        self._entries = OrderedDict()   # [attribute] - key -> Surface, oldest use first
+        self._refcounts = {}            # [attribute] - key -> number of holders that acquired it
+        self._failures = {}             # [attribute] - key -> exception from a failed load, so misses stay cheap
+        self.atlas = None               # [attribute] - optional SpriteAtlas consulted before the disk
+        self.hits = 0                   # [attribute] - lookups served from memory
+        self.misses = 0                 # [attribute] - lookups that had to decode from disk
+
+    # [static helper] - builds the canonical key for an asset request
+    @staticmethod
+    def make_key(path: str, size=None, flags: int = CONVERT_ALPHA) -> tuple:
+        """Return the cache key for a path, optional target size and conversion flags."""
+        return (os.path.normpath(os.path.abspath(path)), tuple(size) if size else None, flags)
+
+    # [public method] - returns a surface and takes a reference on it
+    def acquire(self, path: str, size=None, flags: int = CONVERT_ALPHA) -> pygame.Surface:
+        """Return the cached surface for the request, loading it once on first use."""
+        key = self.make_key(path, size, flags)
+        surface = self._entries.get(key)
+        if surface is None:
+            surface = self._load(key)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)  # [LRU] - mark as most recently used
+        self._refcounts[key] = self._refcounts.get(key, 0) + 1
+        return surface
+
+    # [public method] - drops a reference taken by acquire()
+    def release(self, path: str, size=None, flags: int = CONVERT_ALPHA) -> None:
+        """Release one reference; unreferenced entries become eligible for eviction."""
+        key = self.make_key(path, size, flags)
+        count = self._refcounts.get(key, 0) - 1
+        if count > 0:
+            self._refcounts[key] = count
+        else:
+            self._refcounts.pop(key, None)
+            self._evict()
+
+    # [public method] - lookup without taking a reference
+    def peek(self, path: str, size=None, flags: int = CONVERT_ALPHA):
+        """Return the cached surface for the request, or None if it is not loaded."""
+        return self._entries.get(self.make_key(path, size, flags))
+
+    # [public method] - seeds the cache with a surface produced elsewhere
+    def insert(self, key: tuple, surface: pygame.Surface) -> None:
+        """Store an already prepared surface under a key built by make_key()."""
+        self._entries[key] = surface
+        self._entries.move_to_end(key)
+        self._failures.pop(key, None)
+        self._evict()
+
+    # [public method] - records a load that failed elsewhere
+    def fail(self, key: tuple, error: Exception) -> None:
+        """Remember that the asset for key could not be loaded, so acquire() re-raises error without touching disk."""
+        self._failures[key] = error
+
+    # [public method] - serves matching requests from a packed sprite sheet
+    def attach_atlas(self, atlas) -> None:
+        """Use atlas subsurfaces for sprites it contains at the requested size."""
+        self.atlas = atlas
+        self.clear()
+
+    # [public method] - drops every unreferenced entry and failure record
+    def clear(self) -> None:
+        """Forget all unreferenced surfaces and remembered load failures."""
+        for key in [k for k in self._entries if k not in self._refcounts]:
+            del self._entries[key]
+        self._failures.clear()
+
+    # [public method] - returns cache counters for debugging
+    def stats(self) -> dict:
+        """Return entry, reference and hit/miss counts."""
+        return {
+            'entries': len(self._entries),
+            'referenced': len(self._refcounts),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+    # [helper method] - decodes, converts and scales a surface for a key
+    def _load(self, key: tuple) -> pygame.Surface:
+        """Load the asset for key from disk, or re-raise a remembered failure."""
+        if key in self._failures:
+            raise self._failures[key]
+        self.misses += 1
+        path, size, flags = key
+        if self.atlas is not None and flags == CONVERT_ALPHA:
+            surface = self.atlas.lookup(path, size)
+            if surface is not None:
+                self.insert(key, surface)  # [atlas hit] - subsurface of the sheet, no decode or scale
+                return surface
+        try:
+            surface = pygame.image.load(path)
+            if flags == CONVERT_ALPHA:
+                surface = surface.convert_alpha()
+            elif flags == CONVERT:
+                surface = surface.convert()
+            if size is not None and surface.get_size() != size:
+                surface = pygame.transform.scale(surface, size)
+        except (pygame.error, FileNotFoundError) as e:
+            self._failures[key] = e  # [memo] - later requests fail fast instead of hitting disk
+            raise
+        self.insert(key, surface)
+        return surface
+
+    # [helper method] - trims unreferenced entries beyond max_entries, oldest first
+    def _evict(self) -> None:
+        """Evict least recently used unreferenced entries until under the cap."""
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        for key in list(self._entries):
+            if excess <= 0:
+                break
+            if key not in self._refcounts:
+                del self._entries[key]
+                excess -= 1
+
+
+# [module instance] - the shared cache used by every entity loader
+asset_cache = AssetCache()
+
+
+# [public function] - convenience wrapper around the shared cache
+def load_image(path: str, size=None, flags: int = CONVERT_ALPHA) -> pygame.Surface:
+    """Acquire a surface from the shared asset cache."""
+    return asset_cache.acquire(path, size, flags)
+
+
+# [public function] - convenience wrapper around the shared cache
+def release_image(path: str, size=None, flags: int = CONVERT_ALPHA) -> None:
+    """Release a surface previously acquired with load_image()."""
+    asset_cache.release(path, size, flags)
@@ -0,0 +1,164 @@
+import itertools     # [library import] - itertools: tie-breaking sequence numbers for the priority queue
+import queue         # [library import] - queue: requests in, decoded surfaces out
+import threading     # [library import] - threading: decode workers
+import time          # [library import] - time: per-frame swap budget
+import pygame        # [library import] - pygame: image decoding, scaling and display conversion
+from systems.asset_cache import asset_cache, CONVERT, CONVERT_ALPHA  # [cache import] - where streamed surfaces end up
+
+# [constants] - request priorities (lower is served first)
+PRIORITY_HIGH = 0    # [priority] - needed this frame (e.g. the player)
+PRIORITY_NORMAL = 1  # [priority] - a newly spawned entity's art
+PRIORITY_LOW = 2     # [priority] - manifest preloads
+
+# [constants] - defaults
+WORKERS = 2          # [constant] - decode threads
+PUMP_BUDGET_MS = 2.0 # [constant] - most main-thread time pump() spends converting per frame
+
+
+# [streamer class] - Decodes images on worker threads and hands them to the main thread
+class AssetStreamer:
+    """Asynchronous front end to an AssetCache.
+
+    Worker threads decode and scale PNGs in priority order. pump(), called
+    by the main loop at a safe point between frames, converts the results to
+    the display format (which must happen on the main thread), stores them
+    in the cache and runs the completion callbacks. Entities draw their
+    fallback sprites until their callbacks swap the real frames in.
+    """
+
+    # [constructor] - queues only; threads start with start()
+    def __init__(self, cache=None, workers: int = WORKERS) -> None:
+        """Initialize a streamer filling cache (default: the shared asset cache) with workers threads."""
+        self.cache = cache if cache is not None else asset_cache  # [attribute] - receives finished surfaces
+        self.workers = workers
+        self._requests = queue.PriorityQueue()  # [attribute] - (priority, sequence, key) waiting for a worker
+        self._finished = queue.SimpleQueue()    # [attribute] - (key, surface, error) waiting for pump()
+        self._pending = {}                      # [attribute] - key -> callbacks, for requests in flight
+        self._sequence = itertools.count()      # [attribute] - FIFO order within one priority
+        self._threads = []
+        self.loaded = 0                         # [attribute] - surfaces delivered by pump()
+        self.failed = 0                         # [attribute] - requests whose file could not be decoded
+
+    # [property] - whether requests are being served
+    @property
+    def running(self) -> bool:
+        return bool(self._threads)
+
+    # [public method] - starts the decode threads
+    def start(self) -> None:
+        """Start the worker threads (no-op if already running)."""
+        if self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'asset-stream-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # [public method] - stops the decode threads
+    def stop(self) -> None:
+        """Let the workers finish their current image and exit; queued requests are dropped."""
+        for _ in self._threads:
+            self._requests.put((-1, next(self._sequence), None))  # [sentinel] - jumps the queue
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    # [public method] - asks for one surface
+    def request(self, path: str, size=None, flags: int = CONVERT_ALPHA, priority: int = PRIORITY_NORMAL,
+                callback=None):
+        """Return the surface if it is already available (running callback too), else queue it and return None.
+
+        callback(surface) runs on the main thread, from pump(), once the surface is in the cache.
+        Requests that fail never call back; the cache remembers the failure.
+        """
+        cache = self.cache
+        key = cache.make_key(path, size, flags)
+        surface = cache.peek(path, size, flags)
+        if surface is None and cache.atlas is not None and flags == CONVERT_ALPHA:
+            surface = cache.atlas.lookup(key[0], key[1])  # [atlas hit] - a subsurface, nothing to decode
+            if surface is not None:
+                cache.insert(key, surface)
+        if surface is not None:
+            if callback is not None:
+                callback(surface)
+            return surface
+        callbacks = self._pending.get(key)
+        if callbacks is None:
+            self._pending[key] = callbacks = []
+            self._requests.put((priority, next(self._sequence), key))
+        elif priority < PRIORITY_LOW:
+            # [reprioritize] - queue again; whichever copy finishes first wins, the other is ignored
+            self._requests.put((priority, next(self._sequence), key))
+        if callback is not None:
+            callbacks.append(callback)
+        return None
+
+    # [public method] - queues a list of assets
+    def preload(self, manifest, priority: int = PRIORITY_LOW, callback=None) -> int:
+        """Request every entry of manifest (paths or (path, size) pairs); return how many were not yet loaded."""
+        queued = 0
+        for entry in manifest:
+            path, size = (entry, None) if isinstance(entry, str) else entry
+            if self.request(path, size, priority=priority, callback=callback) is None:
+                queued += 1
+        return queued
+
+    # [public method] - number of requests not yet delivered
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    # [public method] - main-thread swap point
+    def pump(self, budget_ms: float = PUMP_BUDGET_MS) -> int:
+        """Convert and cache finished surfaces and run their callbacks, for at most budget_ms; return how many."""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        delivered = 0
+        finished = self._finished
+        while not finished.empty():
+            key, surface, error = finished.get_nowait()
+            callbacks = self._pending.pop(key, None)
+            if callbacks is None:
+                continue  # [duplicate] - a reprioritized copy already delivered this key
+            if error is not None:
+                self.cache.fail(key, error)
+                self.failed += 1
+            else:
+                flags = key[2]
+                if flags == CONVERT_ALPHA:
+                    surface = surface.convert_alpha()
+                elif flags == CONVERT:
+                    surface = surface.convert()
+                self.cache.insert(key, surface)
+                self.loaded += 1
+                delivered += 1
+                for callback in callbacks:
+                    callback(surface)
+            if time.perf_counter() >= deadline:
+                break  # [budget] - the rest waits for the next frame
+        return delivered
+
+    # [helper method] - worker thread loop: decode and scale, never touch the display
+    def _work(self) -> None:
+        requests = self._requests
+        finished = self._finished
+        while True:
+            _, _, key = requests.get()
+            if key is None:
+                return
+            path, size, _ = key
+            try:
+                surface = pygame.image.load(path)
+                if size is not None and surface.get_size() != size:
+                    surface = pygame.transform.scale(surface, size)
+            except (pygame.error, FileNotFoundError) as e:
+                finished.put((key, None, e))
+            else:
+                finished.put((key, surface, None))
+
+    # [public method] - returns streamer counters for debugging
+    def stats(self) -> dict:
+        """Return pending, loaded and failed counts."""
+        return {'pending': len(self._pending), 'loaded': self.loaded, 'failed': self.failed}
+
+
+# [module instance] - the streamer entities use when it is running (the windowed game starts it)
+asset_streamer = AssetStreamer()
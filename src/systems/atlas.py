@@ -0,0 +1,169 @@
+import os            # [library import] - os: walking the sprite tree and building paths
+import json          # [library import] - json: frame index stored next to the sheet
+import pygame        # [library import] - pygame: image loading, scaling and the sheet surface
+
+# [constants] - where sprites come from and where the packed sheet goes (a build directory outside src/)
+SPRITE_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), '../assets/sprites'))
+ATLAS_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '../../build/atlas'))
+SHEET_NAME = 'sprites.png'     # [constant] - packed sheet image
+INDEX_NAME = 'sprites.json'    # [constant] - frame index (name -> rect) and source mtimes
+SHEET_WIDTH = 1024             # [constant] - shelf packer row width
+PADDING = 1                    # [constant] - transparent gap between frames
+
+# [constants] - frames are baked at the size the game draws them; everything else is 64x64
+DEFAULT_FRAME_SIZE = (64, 64)
+FRAME_SIZES = {
+    'player/projectile_sub.png': (16, 16),
+}
+
+# [constant] - the sprites the game loads (relative to SPRITE_ROOT); nothing else is packed
+GAME_SPRITES = (
+    'enemies/blue/damage_left_1.png', 'enemies/blue/damage_left_2.png',
+    'enemies/blue/damage_right_1.png', 'enemies/blue/damage_right_2.png',
+    'enemies/blue/left_idle_1.png', 'enemies/blue/left_idle_2.png',
+    'enemies/blue/right_idle_1.png', 'enemies/blue/right_idle_2.png',
+    'player/left_idle_1.png', 'player/left_idle_2.png',
+    'player/right_idle_1.png', 'player/right_idle_2.png',
+    'player/left_move_1.png', 'player/left_move_2.png', 'player/left_move_3.png',
+    'player/move_right_1.png', 'player/move_right_2.png', 'player/move_right_3.png',
+    'player/projectile_sub.png',
+)
+
+
+# [public function] - the game's sprites that exist under the root, as '/'-separated relative names
+def collect_sprites(root: str = SPRITE_ROOT, names=GAME_SPRITES) -> dict:
+    """Return {relative name: modification time} for every sprite in names found under root."""
+    sources = {}
+    for name in names:
+        path = os.path.join(root, *name.split('/'))
+        if os.path.isfile(path):
+            sources[name] = os.path.getmtime(path)
+    return dict(sorted(sources.items()))
+
+
+# [public function] - shelf packer: tallest frames first, left to right, wrapping rows
+def pack(sizes: dict, width: int = SHEET_WIDTH, padding: int = PADDING):
+    """Return ({name: Rect}, (sheet_width, sheet_height)) for frames of the given sizes."""
+    rects = {}
+    x = y = shelf_height = 0
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        rects[name] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return rects, (width, y + shelf_height)
+
+
+# [atlas class] - One packed sheet plus its frame index
+class SpriteAtlas:
+    """A sprite sheet whose frames are handed out as subsurfaces sharing the sheet's pixels."""
+
+    # [constructor] - wraps a sheet surface and a name -> Rect index
+    def __init__(self, sheet: pygame.Surface, frames: dict, root: str = SPRITE_ROOT) -> None:
+        """Initialize from a sheet and its frame rects."""
+        self.sheet = sheet        # [attribute] - the packed sheet surface
+        self.frames = frames      # [attribute] - frame name -> pygame.Rect within the sheet
+        self.root = root          # [attribute] - sprite root that frame names are relative to
+        self._subsurfaces = {}    # [attribute] - frame name -> subsurface, created on first use
+
+    # [class method] - reads a previously built sheet and index from disk
+    @classmethod
+    def load(cls, out_dir: str = ATLAS_DIR, root: str = SPRITE_ROOT):
+        """Load the sheet (decoding a single image) and its frame index."""
+        with open(os.path.join(out_dir, INDEX_NAME)) as f:
+            index = json.load(f)
+        sheet = pygame.image.load(os.path.join(out_dir, index['sheet']))
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        frames = {name: pygame.Rect(rect) for name, rect in index['frames'].items()}
+        return cls(sheet, frames, root)
+
+    # [public method] - returns a frame by name
+    def frame(self, name: str) -> pygame.Surface:
+        """Return the subsurface for a frame name (raises KeyError if it is not in the atlas)."""
+        surface = self._subsurfaces.get(name)
+        if surface is None:
+            surface = self.sheet.subsurface(self.frames[name])
+            self._subsurfaces[name] = surface
+        return surface
+
+    # [public method] - maps a sprite file path and draw size to a frame, if the atlas has it
+    def lookup(self, path: str, size=None):
+        """Return the frame for a file under the sprite root at the requested size, or None."""
+        name = os.path.relpath(os.path.normpath(os.path.abspath(path)), self.root).replace(os.sep, '/')
+        rect = self.frames.get(name)
+        if rect is None or (size is not None and rect.size != tuple(size)):
+            return None
+        return self.frame(name)
+
+
+# [public function] - scales and packs every sprite into an in-memory sheet
+def render_sheet(root: str = SPRITE_ROOT):
+    """Return (sheet surface, {name: Rect}, {name: mtime}) for the game's sprites under root."""
+    sources = collect_sprites(root)
+    images = {}
+    for name in sources:
+        image = pygame.image.load(os.path.join(root, name))
+        size = FRAME_SIZES.get(name, DEFAULT_FRAME_SIZE)
+        if image.get_size() != size:
+            image = pygame.transform.scale(image, size)
+        images[name] = image
+
+    rects, sheet_size = pack({name: image.get_size() for name, image in images.items()})
+    sheet = pygame.Surface(sheet_size, pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    for name, image in images.items():
+        # [exact copy] - RGBA_MAX onto a cleared sheet copies pixels and alpha without blending
+        sheet.blit(image, rects[name], special_flags=pygame.BLEND_RGBA_MAX)
+    return sheet, rects, sources
+
+
+# [public function] - the atlas build step
+def build_atlas(root: str = SPRITE_ROOT, out_dir: str = ATLAS_DIR) -> SpriteAtlas:
+    """Scale the game's sprites to their draw size, pack them into one sheet and write sheet + index."""
+    sheet, rects, sources = render_sheet(root)
+    os.makedirs(out_dir, exist_ok=True)
+    pygame.image.save(sheet, os.path.join(out_dir, SHEET_NAME))
+    with open(os.path.join(out_dir, INDEX_NAME), 'w') as f:
+        json.dump({
+            'sheet': SHEET_NAME,
+            'size': list(sheet.get_size()),
+            'sources': sources,
+            'frames': {name: list(rect) for name, rect in rects.items()},
+        }, f, indent=1)
+    return SpriteAtlas.load(out_dir, root)
+
+
+# [public function] - checks whether the sheet on disk still matches the sprite tree
+def is_stale(root: str = SPRITE_ROOT, out_dir: str = ATLAS_DIR) -> bool:
+    """True if the atlas is missing or any game sprite was added, removed or modified since it was built."""
+    try:
+        with open(os.path.join(out_dir, INDEX_NAME)) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return True
+    return index.get('sources') != collect_sprites(root)
+
+
+# [public function] - used at startup: the sheet built by the build step, if it is current
+def load_atlas(root: str = SPRITE_ROOT, out_dir: str = ATLAS_DIR):
+    """Return the SpriteAtlas written by build_atlas(), or None if it is missing or stale (callers load files)."""
+    if not os.path.exists(os.path.join(out_dir, INDEX_NAME)):
+        return None
+    try:
+        if is_stale(root, out_dir):
+            print("Sprite atlas is stale; run `python -m systems.atlas` from src/ to rebuild it")
+            return None
+        return SpriteAtlas.load(out_dir, root)
+    except (pygame.error, OSError, ValueError, KeyError) as e:
+        print(f"Sprite atlas unavailable, loading sprites individually: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    # [build step] - run from src/ as `python -m systems.atlas`
+    atlas = build_atlas()
+    print(f"Packed {len(atlas.frames)} frames into {atlas.sheet.get_size()} sheet at {ATLAS_DIR}")
@@ -0,0 +1,75 @@
+import pygame   # [library import] - pygame: Rect type used for bounds
+
+
+# [constants] - hashing of integer cell coordinates into a single dict key
+ROW_STRIDE = 1 << 20  # [constant] - spreads cell x so (cx, cy) pairs rarely share a key
+
+
+# [record class] - A target whose collision capability was resolved once when it was registered
+class Collider:
+    """Bound collision callable, hit box and damage slot of a projectile target."""
+    __slots__ = ('target', 'box', 'check', 'slot')
+
+    def __init__(self, target, slot: int = -1):
+        self.target = target                                  # [attribute] - the registered target
+        box = getattr(target, 'hitbox', None)
+        self.box = box if box is not None else target.rect    # [attribute] - Rect kept up to date by the target
+        self.check = target.check_projectile_collision        # [attribute] - bound narrowphase test
+        self.slot = slot                                      # [attribute] - DamagePipeline slot hits are recorded under
+
+
+# [broadphase class] - Uniform-grid spatial hash over axis-aligned rects
+class SpatialHash:
+    """Bucket objects by the grid cells their rect covers so queries only see nearby objects.
+
+    Keys are hashed cell coordinates, so unrelated far-apart cells can share a
+    bucket; callers must still run an exact narrowphase test on candidates.
+    """
+
+    # [constructor] - sets cell size and the bucket table
+    def __init__(self, cell_size: int = 64) -> None:
+        """Initialize an empty hash with square cells of cell_size pixels."""
+        self.cell_size = cell_size  # [attribute] - width and height of one grid cell
+        self._cells = {}            # [attribute] - hashed cell key -> list of entries
+        self._spare = []            # [attribute] - emptied bucket lists reused on the next rebuild
+
+    # [public method] - empties every bucket, keeping the lists for reuse
+    def clear(self) -> None:
+        """Remove all entries."""
+        for bucket in self._cells.values():
+            bucket.clear()
+            self._spare.append(bucket)
+        self._cells.clear()
+
+    # [public method] - adds an entry to every cell its rect overlaps
+    def insert(self, entry, rect: pygame.Rect) -> None:
+        """Insert entry under each cell covered by rect."""
+        size = self.cell_size
+        cells = self._cells
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                key = cx * ROW_STRIDE + cy
+                bucket = cells.get(key)
+                if bucket is None:
+                    bucket = self._spare.pop() if self._spare else []
+                    cells[key] = bucket
+                bucket.append(entry)
+
+    # [public method] - collects entries sharing a cell with rect
+    def query(self, rect: pygame.Rect, out: list) -> list:
+        """Fill out with the unique entries whose cells overlap rect and return it."""
+        out.clear()
+        size = self.cell_size
+        cells = self._cells
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                bucket = cells.get(cx * ROW_STRIDE + cy)
+                if bucket:
+                    for entry in bucket:
+                        if entry not in out:  # [dedup] - entries spanning several cells appear once
+                            out.append(entry)
+        return out
+
+    # [dunder method] - number of occupied cells
+    def __len__(self) -> int:
+        return len(self._cells)
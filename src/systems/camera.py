@@ -0,0 +1,66 @@
+import pygame   # [library import] - pygame: Rect math for the viewport and world bounds
+import numpy as np   # [library import] - numpy: vectorized visibility test over the world's position arrays
+from systems.game_loop import lerp_topleft  # [function import] - the interpolated position sprites are drawn at
+
+# [constants] - world space
+WORLD_SIZE = (2000, 2000)                 # [constant] - playfield size in world pixels (larger than the window)
+WORLD_RECT = pygame.Rect((0, 0), WORLD_SIZE)  # [constant] - simulation bounds; projectiles leaving it are culled
+CULL_MARGIN = 64                          # [constant] - pixels around the view still drawn (sprites moving in)
+
+
+# [camera class] - Maps world coordinates to the window and decides what is visible
+class Camera:
+    """A window-sized view into the world that follows a sprite.
+
+    Everything is simulated in world coordinates; only drawing subtracts the
+    camera offset, and only rows whose rect overlaps the view are drawn.
+    """
+
+    # [constructor] - a viewport of the window's size at the world origin
+    def __init__(self, viewport_size, world_rect: pygame.Rect = WORLD_RECT) -> None:
+        """Initialize a camera showing viewport_size pixels of world_rect."""
+        self.rect = pygame.Rect((0, 0), viewport_size)   # [attribute] - visible area in world coordinates
+        self.world_rect = world_rect                     # [attribute] - the camera never shows outside this
+        self.cull_rect = self.rect.inflate(CULL_MARGIN * 2, CULL_MARGIN * 2)  # [attribute] - view plus margin
+
+    # [property] - world -> screen translation
+    @property
+    def offset(self):
+        """Top-left of the view in world coordinates (subtract it to get screen coordinates)."""
+        return self.rect.topleft
+
+    # [public method] - centres the view on a sprite where it is drawn this frame
+    def follow(self, sprite, alpha: float = 1.0) -> None:
+        """Centre the view on sprite's interpolated position, clamped to the world."""
+        x, y = lerp_topleft(sprite, alpha)
+        self.rect.center = (int(x) + sprite.rect.width // 2, int(y) + sprite.rect.height // 2)
+        self.rect.clamp_ip(self.world_rect)
+        self.cull_rect.center = self.rect.center
+
+    # [public method] - window position to world position
+    def to_world(self, pos):
+        """Return the world coordinates of window position pos."""
+        return pos[0] + self.rect.x, pos[1] + self.rect.y
+
+    # [public method] - world position to window position
+    def to_screen(self, pos):
+        """Return the window coordinates of world position pos."""
+        return pos[0] - self.rect.x, pos[1] - self.rect.y
+
+    # [public method] - views of the world's entities that overlap the view
+    def visible(self, world) -> list:
+        """Return the views of world's live entities whose rect overlaps the view (plus margin), oldest entity first."""
+        n = world.count
+        if n == 0:
+            return []
+        view = self.cull_rect
+        half = world.size[:n] / 2
+        position = world.position[:n]
+        low = position - half
+        high = position + half
+        rows = np.flatnonzero((high[:, 0] > view.left) & (low[:, 0] < view.right) &
+                              (high[:, 1] > view.top) & (low[:, 1] < view.bottom))
+        # [draw order] - by entity id, since swap-remove despawns reorder rows and would flip overlaps between frames
+        rows = rows[np.argsort(world.entity[rows], kind='stable')]
+        views = world.views
+        return [views[row] for row in rows.tolist() if views[row] is not None]
@@ -0,0 +1,136 @@
+import numpy as np   # [library import] - numpy: preallocated hit columns and per-target aggregation
+
+
+# [pipeline class] - Collects hits during a tick and applies them per target in one pass
+class DamagePipeline:
+    """Per-tick hit buffer, aggregated per target and resolved once.
+
+    Projectile managers record hits with hit() / hit_many() instead of
+    calling take_damage() themselves. resolve(), called once per simulation
+    tick after every damage source has run, then does the following:
+    - applies resistances and modifiers to the whole buffer;
+    - shows the buffer to the taps;
+    - sums the damage per target, calls take_damage() once per target hit
+      (so there is one animation transition and one health update);
+    - runs the on-hit and on-kill hooks.
+    Hits live in preallocated columns, and taps receive views of them, so a
+    steady-state tick allocates nothing per hit.
+    """
+
+    # [constructor] - preallocates the hit columns
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize an empty pipeline with room for capacity hits per tick (it grows if needed)."""
+        self.capacity = capacity
+        self.count = 0                                          # [attribute] - hits buffered this tick
+        self.hit_slot = np.zeros(capacity, dtype=np.int32)      # [array] - target slot of each hit
+        self.hit_amount = np.zeros(capacity, dtype=np.float64)  # [array] - damage of each hit
+        self.targets = []              # [attribute] - slot -> target (anything with take_damage(amount) -> health)
+        self._slots = {}               # [attribute] - target -> slot
+        self.resistance = np.ones(0, dtype=np.float64)          # [array] - slot -> damage multiplier
+        self.modifiers = []            # [attribute] - fn(slots, amounts), may scale amounts in place
+        self.taps = []                 # [attribute] - fn(slots, amounts), read-only views of the resolved hits
+        self.on_hit = []               # [attribute] - fn(target, damage, hits), once per target per tick
+        self.on_kill = []              # [attribute] - fn(target), when a tick's damage takes health to 0
+        self.resolved = 0              # [attribute] - hits resolved so far
+        self.applied = 0               # [attribute] - take_damage() calls made so far
+
+    # [public method] - assigns a target its slot
+    def register(self, target) -> int:
+        """Return the slot of target, assigning one on first use."""
+        slot = self._slots.get(target)
+        if slot is None:
+            slot = self._slots[target] = len(self.targets)
+            self.targets.append(target)
+            self.resistance = np.append(self.resistance, 1.0)
+        return slot
+
+    # [public method] - per-target damage multiplier
+    def set_resistance(self, target, multiplier: float) -> None:
+        """Scale every hit on target by multiplier (0.5 halves damage, 0 makes it immune)."""
+        self.resistance[self.register(target)] = multiplier
+
+    # [public method] - subscribes a combat-log style reader
+    def tap(self, listener) -> None:
+        """Call listener(slots, amounts) with each tick's hits, after modifiers, before they are applied."""
+        self.taps.append(listener)
+
+    # [public method] - records one hit
+    def hit(self, slot: int, amount: float) -> None:
+        """Buffer amount of damage on the target in slot."""
+        i = self.count
+        if i >= self.capacity:
+            self._grow(i + 1)
+        self.hit_slot[i] = slot
+        self.hit_amount[i] = amount
+        self.count = i + 1
+
+    # [public method] - records many hits at once
+    def hit_many(self, slots, amounts) -> None:
+        """Buffer a batch of hits; slots and amounts are arrays (or a scalar slot for one target) of equal length."""
+        amounts = np.asarray(amounts)
+        n = amounts.size
+        if n == 0:
+            return
+        i = self.count
+        if i + n > self.capacity:
+            self._grow(i + n)
+        self.hit_slot[i:i + n] = slots
+        self.hit_amount[i:i + n] = amounts
+        self.count = i + n
+
+    # [helper method] - enlarges the columns (only when a tick has more hits than ever before)
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, self.capacity * 2)
+        self.hit_slot = np.resize(self.hit_slot, capacity)
+        self.hit_amount = np.resize(self.hit_amount, capacity)
+        self.capacity = capacity
+
+    # [public method] - the single resolution pass
+    def resolve(self) -> int:
+        """Apply this tick's buffered hits, one take_damage() per target, and return how many targets were hit."""
+        n = self.count
+        if n == 0:
+            return 0
+        self.count = 0
+        slots = self.hit_slot[:n]
+        amounts = self.hit_amount[:n]
+        amounts *= self.resistance[slots]
+        for modifier in self.modifiers:
+            modifier(slots, amounts)
+        for listener in self.taps:
+            listener(slots, amounts)
+        # [aggregate] - total damage and hit count per target
+        size = len(self.targets)
+        totals = np.bincount(slots, weights=amounts, minlength=size)
+        hits = np.bincount(slots, minlength=size)
+        targets = self.targets
+        on_hit = self.on_hit
+        on_kill = self.on_kill
+        struck = np.flatnonzero(hits)
+        for slot, total, count in zip(struck.tolist(), totals[struck].tolist(), hits[struck].tolist()):
+            target = targets[slot]
+            alive = not on_kill or target.health > 0
+            health = target.take_damage(int(round(total)))
+            for hook in on_hit:
+                hook(target, total, count)
+            if alive and on_kill and health == 0:
+                for hook in on_kill:
+                    hook(target)
+        self.resolved += n
+        self.applied += struck.size
+        return struck.size
+
+    # [public method] - drops buffered hits without applying them
+    def clear(self) -> None:
+        """Forget this tick's hits."""
+        self.count = 0
+
+    # [public method] - returns pipeline counters for debugging
+    def stats(self) -> dict:
+        """Return buffered, resolved and applied counts."""
+        return {'buffered': self.count, 'resolved': self.resolved, 'applied': self.applied,
+                'targets': len(self.targets)}
+
+
+# [module instance] - damage of the windowed game, resolved once per simulation tick
+damage_pipeline = DamagePipeline()
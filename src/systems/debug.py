@@ -1,15 +1,31 @@
 import pygame
 import logging
+from systems.text_cache import text_cache
+
+# Profiler graph layout
+PROFILER_POS = (10, 110)          # Top-left of the profiler panel, below the debug text
+PROFILER_GRAPH_HEIGHT = 100       # Pixels for PROFILER_GRAPH_MS of frame time
+PROFILER_GRAPH_MS = 33.3          # Frame time at the top of the graph (two 60 FPS frames)
+FRAME_BUDGET_MS = 1000.0 / 60     # Grey budget line
+DEBUG_TEXT_SIZE = 36              # Debug info lines
+PROFILER_TEXT_SIZE = 20           # Profiler summary lines and health readouts
+HEALTH_COLOR = (255, 80, 80)
+SCOPE_COLORS = [(80, 160, 255), (255, 160, 60), (120, 220, 120), (220, 100, 220),
+                (240, 220, 80), (100, 220, 220), (200, 120, 90), (160, 160, 160)]
 
 class DebugSystem:
     def __init__(self):
-        # Create font object for debug text
-        self.debug_font = pygame.font.Font(None, 36)
-        # None = default system font, 36 = size in pixels
+        # Text goes through the shared cache: labels are rendered once, values are drawn from glyphs
+        self.text = text_cache
 
         # Initialize state flags
         self.enabled = False
         self.show_hitboxes = False
+        self.show_profiler = False
+
+        # Profiler graph: scrolled one pixel per frame so only the newest column is drawn
+        self._graph = None
+        self._graph_frame = 0
         
     # def setup_logging(self):
     #     logging.basicConfig(
@@ -23,17 +39,85 @@ class DebugSystem:
         
     def toggle_hitboxes(self):
         self.show_hitboxes = not self.show_hitboxes
+
+    def toggle_profiler(self, profiler):
+        self.show_profiler = not self.show_profiler
+        # A trace being recorded needs collection to stay on; then P only shows or hides the overlay
+        if profiler.enabled != self.show_profiler and not profiler.tracing:
+            profiler.toggle()
     
     def render_debug_info(self, screen, player, clock):
         if not self.enabled:
             return
             
         debug_info = [
-            f"Player pos: {player.rect.center}",
-            f"Current sprite: {player.current_sprite}",
-            f"FPS: {clock.get_fps():.1f}"
+            ("Player pos: ", f"({player.rect.centerx}, {player.rect.centery})"),
+            ("Current sprite: ", str(player.current_sprite)),
+            ("FPS: ", f"{clock.get_fps():.1f}")
         ]
         
-        for i, text in enumerate(debug_info):
-            debug_surface = self.debug_font.render(text, True, (255, 255, 255))
-            screen.blit(debug_surface, (10, 10 + (i * 30))) 
\ No newline at end of file
+        for i, (label, value) in enumerate(debug_info):
+            self.text.draw_field(screen, label, value, (10, 10 + (i * 30)), size=DEBUG_TEXT_SIZE)
+
+    def render_health(self, screen, targets, camera=None):
+        """Draw each target's health above its sprite while debug mode is on (only targets in camera's view)."""
+        if not self.enabled:
+            return
+        glyphs = self.text.glyphs(HEALTH_COLOR, PROFILER_TEXT_SIZE)
+        ox, oy = camera.offset if camera is not None else (0, 0)
+        for target in targets:
+            if camera is not None and not camera.rect.colliderect(target.rect):
+                continue
+            health = getattr(target, 'health', None)
+            if health is not None:
+                glyphs.draw(screen, str(health), (target.rect.left - ox, target.rect.top - glyphs.height - oy))
+
+    def render_profiler(self, screen, profiler):
+        """Draw the stacked per-scope frame-time graph with p99/worst markers, averages and counters."""
+        if not self.show_profiler or not profiler.enabled:
+            return
+
+        width = profiler.history
+        height = PROFILER_GRAPH_HEIGHT
+        if self._graph is None or self._graph.get_width() != width:
+            self._graph = pygame.Surface((width, height))
+            self._graph_frame = max(0, profiler.frame_index - width)
+        self._graph_frame = max(self._graph_frame, profiler.frame_index - width)
+        scale = height / PROFILER_GRAPH_MS
+
+        # Append a column per newly completed frame, stacking scopes bottom-up
+        while self._graph_frame < profiler.frame_index:
+            slot = self._graph_frame % width
+            self._graph.scroll(-1, 0)
+            self._graph.fill((20, 20, 20), (width - 1, 0, 1, height))
+            y = height
+            for i, name in enumerate(profiler.scope_names):
+                bar = profiler.scope_history[name][slot] * scale
+                if bar > 0:
+                    top = max(0, y - bar)
+                    self._graph.fill(SCOPE_COLORS[i % len(SCOPE_COLORS)], (width - 1, top, 1, max(1, y - top)))
+                    y = top
+            self._graph_frame += 1
+
+        summary = profiler.summary()
+        panel = pygame.Surface((width, height))
+        panel.blit(self._graph, (0, 0))
+        budget_y = height - FRAME_BUDGET_MS * scale
+        pygame.draw.line(panel, (90, 90, 90), (0, budget_y), (width, budget_y))
+        p99_y = max(0, height - summary['p99_ms'] * scale)
+        pygame.draw.line(panel, (255, 255, 0), (0, p99_y), (width, p99_y))
+        worst_x = width - 1 - summary['worst_age']
+        pygame.draw.line(panel, (255, 0, 0), (worst_x, 0), (worst_x, 6))
+        screen.blit(panel, PROFILER_POS)
+
+        lines = [("frame avg/p99/worst: ",
+                  f"{summary['avg_ms']:.2f} / {summary['p99_ms']:.2f} / {summary['worst_ms']:.2f}", (255, 255, 255))]
+        for i, name in enumerate(profiler.scope_names):
+            lines.append((f"{name}: ", f"{summary['scopes'].get(name, 0.0):.2f}", SCOPE_COLORS[i % len(SCOPE_COLORS)]))
+        for name, value in profiler.counters.items():
+            lines.append((f"{name}: ", str(value), (200, 200, 200)))
+
+        x, y = PROFILER_POS[0], PROFILER_POS[1] + height + 4
+        for label, value, color in lines:
+            self.text.draw_field(screen, label, value, (x, y), color, PROFILER_TEXT_SIZE)
+            y += 16
@@ -0,0 +1,84 @@
+import pygame   # [library import] - pygame: surfaces, rects and partial display updates
+
+# [constant] - once this share of the screen is dirty, a full flip is cheaper than many small updates
+FULL_UPDATE_FRACTION = 0.5
+
+
+# [renderer class] - Tracks what was drawn so only changed regions are cleared and pushed
+class DirtyRectRenderer:
+    """Drop-in drawing target that clears and updates only the regions touched this or last frame.
+
+    Exposes blit() and fblits() like a Surface, so existing draw helpers can
+    draw through it. With enabled=False it behaves like the plain full-screen
+    fill() + flip() loop.
+    """
+
+    # [constructor] - wraps the display surface
+    def __init__(self, surface: pygame.Surface, background=(0, 0, 0), enabled: bool = True) -> None:
+        """Initialize a renderer drawing to surface over a solid background colour."""
+        self.surface = surface          # [attribute] - display surface everything is drawn to
+        self.background = background    # [attribute] - colour used to clear stale regions
+        self.enabled = enabled          # [attribute] - False = full clear and flip every frame
+        self._previous = []             # [attribute] - rects drawn last frame (to be cleared this frame)
+        self._current = []              # [attribute] - rects drawn so far this frame
+        self._full_redraw = True        # [attribute] - first frame (or after a resize) must push everything
+        self._screen_area = surface.get_width() * surface.get_height()
+        self.last_update_count = 0      # [attribute] - rects pushed by the last present(); 0 after a flip
+
+    # [public method] - clears what is about to be redrawn
+    def begin_frame(self) -> None:
+        """Erase last frame's sprites (or the whole screen when disabled or on the first frame)."""
+        if not self.enabled or self._full_redraw:
+            self.surface.fill(self.background)
+            return
+        fill = self.surface.fill
+        background = self.background
+        for rect in self._previous:
+            fill(background, rect)
+
+    # [public method] - Surface.blit that records the touched region
+    def blit(self, image, dest, area=None, special_flags=0) -> pygame.Rect:
+        """Blit to the display surface and mark the result dirty."""
+        rect = self.surface.blit(image, dest, area, special_flags)
+        if self.enabled:
+            self._current.append(rect)
+        return rect
+
+    # [public method] - Surface.fblits that records the touched regions
+    def fblits(self, blit_sequence) -> None:
+        """Batch-blit a layer; in dirty mode uses blits(doreturn) so every rect is recorded."""
+        if self.enabled:
+            self._current.extend(self.surface.blits(blit_sequence, doreturn=True))
+        else:
+            self.surface.fblits(blit_sequence)
+
+    # [public method] - records a region drawn directly on the surface (e.g. pygame.draw calls)
+    def mark(self, rect) -> None:
+        """Mark a rect drawn outside blit()/fblits() as dirty."""
+        if self.enabled and rect is not None:
+            self._current.append(pygame.Rect(rect))
+
+    # [public method] - pushes dirty regions to the display
+    def present(self) -> None:
+        """Update only last + current frame regions, or flip when that is cheaper."""
+        if not self.enabled or self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+            self.last_update_count = 0
+        else:
+            dirty = self._previous
+            dirty.extend(self._current)
+            if sum(r.width * r.height for r in dirty) > self._screen_area * FULL_UPDATE_FRACTION:
+                pygame.display.flip()
+                self.last_update_count = 0
+            else:
+                pygame.display.update(dirty)
+                self.last_update_count = len(dirty)
+        # [swap] - this frame's rects are next frame's stale regions; reuse the old list
+        self._previous, self._current = self._current, self._previous
+        self._current.clear()
+
+    # [public method] - forces the next frame to redraw and push the whole screen
+    def invalidate(self) -> None:
+        """Request a full clear and flip on the next frame (e.g. after the window was exposed)."""
+        self._full_redraw = True
@@ -0,0 +1,223 @@
+import numpy as np   # [library import] - numpy: dense per-component arrays
+from systems.game_loop import FIXED_DT  # [constant import] - FIXED_DT: default simulation step in seconds
+from systems.animation import ClipLibrary, clip_library  # [animation import] - shared clip definitions
+
+# [constants] - component bits stored in World.mask
+POSITION = 1
+VELOCITY = 2
+HITBOX = 4
+ANIMATION = 8
+HEALTH = 16
+FACTION = 32
+
+# [constants] - values of the faction component
+FACTION_PLAYER = 0
+FACTION_ENEMY = 1
+
+
+# [archetype class] - Which components an entity kind has and their starting values
+class Archetype:
+    """Component set and defaults shared by every entity of one kind."""
+
+    # [constructor] - stores the component bits and defaults
+    def __init__(self, name: str, components: int, size=(64, 64), hitbox_scale: float = 1.0, health: int = 0,
+                 faction: int = FACTION_ENEMY) -> None:
+        """Initialize an archetype; sizes are in pixels (animation timing lives in its clips)."""
+        self.name = name                        # [attribute] - for debugging and stats
+        self.components = components            # [attribute] - bit set of component flags
+        self.size = size                        # [attribute] - sprite rect size
+        self.hitbox_size = (int(size[0] * hitbox_scale), int(size[1] * hitbox_scale))  # [attribute] - hitbox rect size
+        self.health = health                    # [attribute] - starting health
+        self.faction = faction                  # [attribute] - FACTION_* value
+
+
+# [archetypes] - the game's entity kinds (projectiles keep their own SoA storage in the projectile managers)
+PLAYER = Archetype('player', POSITION | VELOCITY | ANIMATION | FACTION, faction=FACTION_PLAYER)
+BLUE = Archetype('blue', POSITION | VELOCITY | HITBOX | ANIMATION | HEALTH | FACTION,
+                 hitbox_scale=0.8, health=100, faction=FACTION_ENEMY)
+
+
+# [world class] - Dense component storage plus the systems that update it in batches
+class World:
+    """Entities stored as rows of packed component arrays, updated by a few vectorized systems per step.
+
+    Live entities occupy the prefix [0:count] of every array; destroying one
+    swaps the last row into its place. Each entity may have a view (a sprite
+    object); rows that moved or changed frame are written back to it once per
+    step, so drawing and collision code keep working with pygame Rects.
+    Animation is a playhead of (clip id, start time) into a shared ClipLibrary.
+    """
+
+    # [constructor] - allocates every component array once
+    def __init__(self, capacity: int = 256, clips: ClipLibrary = None) -> None:
+        """Initialize storage for capacity entities (it grows if more are spawned) playing clips from clips."""
+        self.capacity = 0
+        self.count = 0              # [attribute] - number of live entities (prefix length)
+        self._next_id = 0           # [attribute] - next entity id handed out
+        self._index = {}            # [attribute] - entity id -> row
+        self.clips = clips if clips is not None else clip_library  # [attribute] - shared clip definitions
+        self.time_ms = 0.0          # [attribute] - simulation time; the one timestamp animation reads per step
+        self._clips_revision = self.clips.revision  # [attribute] - library revision the views were synced against
+        self._allocate(capacity)
+
+    # [helper method] - (re)allocates every array, keeping the live prefix
+    def _allocate(self, capacity: int) -> None:
+        n = self.count
+
+        def grow(old, shape, dtype, fill=0):
+            new = np.full((capacity,) + shape, fill, dtype=dtype)
+            if old is not None:
+                new[:n] = old[:n]
+            return new
+
+        self.entity = grow(getattr(self, 'entity', None), (), np.int64, -1)          # [array] - entity id per row
+        self.mask = grow(getattr(self, 'mask', None), (), np.uint8)                  # [array] - component bits
+        self.position = grow(getattr(self, 'position', None), (2,), np.float64)      # [array] - centre position
+        self.velocity = grow(getattr(self, 'velocity', None), (2,), np.float64)      # [array] - pixels per second
+        self.size = grow(getattr(self, 'size', None), (2,), np.int32)                # [array] - sprite rect size
+        self.hitbox_size = grow(getattr(self, 'hitbox_size', None), (2,), np.int32)  # [array] - hitbox rect size
+        self.anim_clip = grow(getattr(self, 'anim_clip', None), (), np.int32)        # [array] - playhead: clip id
+        self.anim_start = grow(getattr(self, 'anim_start', None), (), np.float64)    # [array] - playhead: start ms
+        self.anim_frame = grow(getattr(self, 'anim_frame', None), (), np.int32)      # [array] - frame shown last sync
+        self.health = grow(getattr(self, 'health', None), (), np.int32)              # [array] - health points
+        self.faction = grow(getattr(self, 'faction', None), (), np.int8)             # [array] - FACTION_* value
+        self.dirty = grow(getattr(self, 'dirty', None), (), bool)                    # [array] - view needs a sync
+        views = [None] * capacity
+        views[:n] = getattr(self, 'views', [])[:n]
+        self.views = views                                                           # [list] - view object per row
+        self.capacity = capacity
+
+    # [public method] - creates an entity from an archetype
+    def spawn(self, archetype: Archetype, position, view=None, clip: int = 0) -> int:
+        """Append an entity of archetype centred at position, playing clip from now, and return its id."""
+        if self.count >= self.capacity:
+            self._allocate(max(16, self.capacity * 2))
+        i = self.count
+        entity = self._next_id
+        self._next_id += 1
+        self._index[entity] = i
+
+        self.entity[i] = entity
+        self.mask[i] = archetype.components
+        self.position[i] = position
+        self.velocity[i] = (0.0, 0.0)
+        self.size[i] = archetype.size
+        self.hitbox_size[i] = archetype.hitbox_size
+        self.anim_clip[i] = clip
+        self.anim_start[i] = self.time_ms
+        self.anim_frame[i] = 0
+        self.health[i] = archetype.health
+        self.faction[i] = archetype.faction
+        self.dirty[i] = True
+        self.views[i] = view
+        self.count = i + 1
+        return entity
+
+    # [public method] - removes an entity with a swap from the end
+    def destroy(self, entity: int) -> None:
+        """Remove entity; the last row moves into its place (order is not preserved)."""
+        i = self._index.pop(entity)
+        last = self.count - 1
+        if i != last:
+            for column in (self.entity, self.mask, self.position, self.velocity, self.size, self.hitbox_size,
+                           self.anim_clip, self.anim_start, self.anim_frame, self.health, self.faction, self.dirty):
+                column[i] = column[last]
+            self.views[i] = self.views[last]
+            self._index[int(self.entity[i])] = i
+        self.views[last] = None
+        self.entity[last] = -1
+        self.count = last
+
+    # [public method] - row of an entity
+    def row(self, entity: int) -> int:
+        """Return the current array row of entity."""
+        return self._index[entity]
+
+    # [public method] - rows matching a component set (and optionally a faction)
+    def select(self, components: int, faction: int = None) -> np.ndarray:
+        """Return the rows of live entities having every bit in components."""
+        n = self.count
+        match = (self.mask[:n] & components) == components
+        if faction is not None:
+            match &= self.faction[:n] == faction
+        return np.flatnonzero(match)
+
+    # [public method] - switches the clip an entity is playing
+    def play(self, entity: int, clip: int, restart: bool = True) -> None:
+        """Play clip on entity from its first frame, or (restart=False) keep the running playhead's timing."""
+        i = self._index[entity]
+        if restart:
+            self.anim_start[i] = self.time_ms
+        elif self.anim_clip[i] == clip:
+            return
+        self.anim_clip[i] = clip
+        self.dirty[i] = True
+
+    # [public method] - reduces health
+    def damage(self, entity: int, amount: int) -> int:
+        """Subtract amount from entity's health, clamped at 0, and return the new health."""
+        i = self._index[entity]
+        health = max(0, int(self.health[i]) - amount)
+        self.health[i] = health
+        return health
+
+    # [system] - integrates velocity
+    def movement_system(self, dt: float) -> None:
+        """Advance every entity's position by velocity * dt and mark moving entities for a view sync."""
+        n = self.count
+        velocity = self.velocity[:n]
+        self.position[:n] += velocity * dt
+        self.dirty[:n] |= velocity.any(axis=1)
+
+    # [system] - advances every playhead from one timestamp
+    def animation_system(self) -> None:
+        """Resolve each playhead's frame at time_ms."""
+        n = self.count
+        if n == 0:
+            return
+        frame = self.clips.advance(self.anim_clip[:n], self.anim_start[:n], self.time_ms)
+        self.dirty[:n] |= frame != self.anim_frame[:n]
+        if self.clips.revision != self._clips_revision:
+            self._clips_revision = self.clips.revision
+            self.dirty[:n] = True  # [swapped frames] - every view may be showing a replaced surface
+        self.anim_frame[:n] = frame
+
+    # [system] - writes positions, hitboxes and frames back to the views
+    def sync_views(self) -> None:
+        """Copy the rect, hitbox and current frame of every changed row to its view (hitboxes follow the sprite centre)."""
+        rows = np.flatnonzero(self.dirty[:self.count])
+        if rows.size == 0:
+            return
+        self.dirty[rows] = False
+        size = self.size[rows]
+        topleft = (self.position[rows] - size / 2).astype(np.int32)
+        centre = topleft + size // 2  # [pygame rounding] - matches Rect.center of an integer rect
+        hitbox = centre - self.hitbox_size[rows] // 2
+        clips = self.clips.clips
+        views = self.views
+        for row, (x, y), (hx, hy), clip, frame in zip(rows.tolist(), topleft.tolist(), hitbox.tolist(),
+                                                      self.anim_clip[rows].tolist(), self.anim_frame[rows].tolist()):
+            view = views[row]
+            if view is None:
+                continue
+            view.rect.topleft = (x, y)
+            box = getattr(view, 'hitbox', None)
+            if box is not None:
+                box.topleft = (hx, hy)  # [in place] - colliders keep a reference to this Rect
+            view.image = clips[clip].frames[frame]
+
+    # [public method] - runs every system for one simulation step
+    def step(self, dt: float = FIXED_DT) -> None:
+        """Advance the world by one step of dt seconds and update the views."""
+        self.time_ms += dt * 1000
+        self.movement_system(dt)
+        self.animation_system()
+        self.sync_views()
+
+    # [dunder method] - live entity count
+    def __len__(self) -> int:
+        return self.count
+
+
+# [module instance] - the world the windowed game's entities live in
+world = World()
@@ -0,0 +1,146 @@
+import random        # [library import] - random: spawn-point jitter
+
+
+# [type class] - One kind of enemy: its class plus art that is loaded once and shared
+class EnemyType:
+    """Enemy class and a factory for its art; the art (frames and clip ids) is built on first use only."""
+
+    # [constructor] - stores the class and the art factory
+    def __init__(self, name: str, enemy_class, art_factory) -> None:
+        """Initialize a type whose instances are enemy_class and whose shared art comes from art_factory()."""
+        self.name = name                  # [attribute] - registry key, e.g. 'blue'
+        self.enemy_class = enemy_class    # [attribute] - constructed as enemy_class(projectile_manager, position, world, timers)
+        self.art_factory = art_factory    # [attribute] - callable returning the shared art object
+        self._art = None                  # [attribute] - art built by the first request
+
+    # [property] - the shared art, loaded on first access
+    @property
+    def art(self):
+        if self._art is None:
+            self._art = self.art_factory()
+        return self._art
+
+
+# [registry class] - Enemy types by name
+class EnemyRegistry:
+    """Maps enemy type names to EnemyType entries; entity modules register themselves on import."""
+
+    # [constructor] - empty registry
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._types = {}  # [attribute] - name -> EnemyType
+
+    # [public method] - adds a type
+    def register(self, enemy_type: EnemyType) -> EnemyType:
+        """Register enemy_type under its name and return it."""
+        self._types[enemy_type.name] = enemy_type
+        return enemy_type
+
+    # [public method] - looks up a type
+    def get(self, name: str) -> EnemyType:
+        """Return the type registered as name (raises KeyError if unknown)."""
+        return self._types[name]
+
+    # [public method] - shared art of a type
+    def art(self, name: str):
+        """Return the shared art of type name, loading it the first time."""
+        return self._types[name].art
+
+    # [dunder method] - registered type names
+    def __contains__(self, name: str) -> bool:
+        return name in self._types
+
+
+# [spawner class] - Creates, recycles and tracks live enemies
+class EnemySpawner:
+    """Spawn enemies singly, in waves or at named spawn points, reusing dead ones instead of allocating.
+
+    Enemies whose health reaches 0 are taken out of play by reap() and kept in a
+    per-type free list; the next spawn of that type revives one in place.
+    """
+
+    # [constructor] - wires the spawner to the projectile targets, world and sprite groups
+    def __init__(self, projectile_manager, world=None, groups=(), registry=None, timers=None) -> None:
+        """Initialize a spawner adding enemies to projectile_manager's targets and to groups."""
+        self.projectile_manager = projectile_manager  # [attribute] - enemies are registered as its targets
+        self.world = world                  # [attribute] - ECS world (None = the enemies' default world)
+        self.timers = timers                # [attribute] - TimerWheel for enemy effects (None = the shared wheel)
+        self.groups = groups                # [attribute] - sprite groups live enemies belong to (e.g. draw group)
+        self.registry = registry if registry is not None else enemy_types  # [attribute] - enemy type lookup
+        self.active = []                    # [attribute] - live enemies
+        self.spawn_points = {}              # [attribute] - name -> list of (x, y)
+        self._free = {}                     # [attribute] - type name -> dead enemies ready for reuse
+        self.created = 0                    # [attribute] - enemies constructed
+        self.reused = 0                     # [attribute] - spawns served from the free list
+
+    # [public method] - registers a named spawn point
+    def add_spawn_point(self, name: str, position) -> None:
+        """Add position to spawn point group name."""
+        self.spawn_points.setdefault(name, []).append(position)
+
+    # [public method] - spawns one enemy
+    def spawn(self, type_name: str, position):
+        """Spawn an enemy of type_name centred at position (reviving a pooled one if available) and return it."""
+        free = self._free.get(type_name)
+        if free:
+            enemy = free.pop()
+            enemy.respawn(position)
+            self.reused += 1
+        else:
+            enemy = self.registry.get(type_name).enemy_class(self.projectile_manager, position, self.world, self.timers)
+            self.created += 1
+        enemy.type_name = type_name
+        self.active.append(enemy)
+        self.projectile_manager.add_target(enemy)
+        for group in self.groups:
+            group.add(enemy)
+        return enemy
+
+    # [public method] - spawns a wave
+    def spawn_wave(self, type_name: str, count: int, point: str = None, positions=None, jitter: int = 0,
+                   rng: random.Random = None) -> list:
+        """Spawn count enemies at positions, or cycling through spawn point group point, each offset by up to jitter."""
+        if positions is None:
+            positions = self.spawn_points[point]
+        rng = rng if rng is not None else random
+        wave = []
+        for i in range(count):
+            x, y = positions[i % len(positions)]
+            if jitter:
+                x += rng.randint(-jitter, jitter)
+                y += rng.randint(-jitter, jitter)
+            wave.append(self.spawn(type_name, (x, y)))
+        return wave
+
+    # [public method] - retires dead enemies into the free lists
+    def reap(self) -> int:
+        """Take enemies with 0 health out of play and pool them; return how many were reaped."""
+        reaped = 0
+        active = self.active
+        for index in range(len(active) - 1, -1, -1):
+            enemy = active[index]
+            if enemy.health > 0:
+                continue
+            # [swap-remove] - O(1) removal from the live list
+            active[index] = active[-1]
+            active.pop()
+            self.projectile_manager.remove_target(enemy)
+            enemy.kill()      # [pygame] - leave every sprite group
+            enemy.despawn()   # [world] - free the backing entity row
+            self._free.setdefault(enemy.type_name, []).append(enemy)
+            reaped += 1
+        return reaped
+
+    # [public method] - returns spawner counters for debugging
+    def stats(self) -> dict:
+        """Return live, pooled, created and reused counts."""
+        return {
+            'active': len(self.active),
+            'pooled': sum(len(free) for free in self._free.values()),
+            'created': self.created,
+            'reused': self.reused,
+        }
+
+
+# [module instance] - the registry every enemy module registers its type with
+enemy_types = EnemyRegistry()
@@ -0,0 +1,69 @@
+# [constants] - simulation rate shared by every system that advances game state
+SIM_HZ = 60               # [constant] - simulation steps per second
+FIXED_DT = 1.0 / SIM_HZ   # [constant] - seconds of game time advanced by one step
+MAX_STEPS_PER_FRAME = 5   # [constant] - catch-up cap; older backlog is dropped instead of spiralling
+
+
+# [loop class] - Accumulator that turns variable frame times into fixed simulation steps
+class FixedTimestep:
+    """Decide how many fixed-dt steps to run per rendered frame and how far to interpolate."""
+
+    # [constructor] - sets step size, catch-up cap and an empty accumulator
+    def __init__(self, dt: float = FIXED_DT, max_steps: int = MAX_STEPS_PER_FRAME) -> None:
+        """Initialize with a step of dt seconds and at most max_steps steps per frame."""
+        self.dt = dt                  # [attribute] - seconds per simulation step
+        self.max_steps = max_steps    # [attribute] - most steps run for a single frame
+        self.accumulator = 0.0        # [attribute] - real time not yet simulated
+        self.dropped_time = 0.0       # [attribute] - total real time discarded by the catch-up cap
+        self.total_steps = 0          # [attribute] - steps run since creation
+
+    # [public method] - adds a frame's real time and returns the number of steps to run
+    def begin_frame(self, elapsed: float) -> int:
+        """Accumulate elapsed seconds and return how many simulation steps are due."""
+        self.accumulator += elapsed
+        limit = self.dt * self.max_steps
+        if self.accumulator > limit:
+            # [graceful degradation] - simulate at most max_steps and let game time slow down
+            self.dropped_time += self.accumulator - limit
+            self.accumulator = limit
+        steps = int(self.accumulator / self.dt)
+        self.accumulator -= steps * self.dt
+        self.total_steps += steps
+        return steps
+
+    # [property] - fraction of a step between the last simulated state and the next one
+    @property
+    def alpha(self) -> float:
+        """Interpolation factor in [0, 1) for rendering between previous and current states."""
+        return self.accumulator / self.dt
+
+
+# [public function] - remembers where each sprite was before a simulation step
+def record_positions(sprites) -> None:
+    """Store each sprite's rect.topleft as prev_topleft for render interpolation."""
+    for sprite in sprites:
+        sprite.prev_topleft = sprite.rect.topleft
+
+
+# [public function] - draws sprites between their previous and current positions
+def draw_interpolated(screen, sprites, alpha: float = 1.0, offset=(0, 0)) -> None:
+    """Blit each sprite at prev_topleft + alpha * (rect.topleft - prev_topleft) - offset, in one fblits call."""
+    if offset == (0, 0):
+        screen.fblits([(sprite.image, lerp_topleft(sprite, alpha)) for sprite in sprites])
+        return
+    ox, oy = offset
+    blits = []
+    for sprite in sprites:
+        x, y = lerp_topleft(sprite, alpha)
+        blits.append((sprite.image, (x - ox, y - oy)))
+    screen.fblits(blits)
+
+
+# [public function] - interpolated top-left corner of one sprite
+def lerp_topleft(sprite, alpha: float):
+    """Return where sprite is drawn at alpha: between prev_topleft and rect.topleft (rect.topleft if no previous)."""
+    x, y = sprite.rect.topleft
+    prev = getattr(sprite, 'prev_topleft', None)
+    if prev is None or alpha >= 1.0:
+        return x, y
+    return prev[0] + (x - prev[0]) * alpha, prev[1] + (y - prev[1]) * alpha
@@ -0,0 +1,224 @@
+import struct        # [library import] - struct: fixed-size input log header and per-tick records
+import pygame        # [library import] - pygame: mouse and keyboard state
+
+# [constants] - per-tick input log layout
+INPUT_MAGIC = b'MEMINPT1'            # [constant] - identifies the file format and its version
+HEADER = struct.Struct('<8sI')       # [constant] - magic, RNG seed the session ran with
+RECORD = struct.Struct('<hhB')       # [constant] - mouse x, mouse y, button/key bits (5 bytes per tick)
+
+# [constants] - bits of InputState.buttons
+BUTTON_LEFT = 1
+BUTTON_MIDDLE = 2
+BUTTON_RIGHT = 4
+KEY_FIRE = 8         # [flag] - space bar
+KEY_Q = 16           # [flag] - ability keys
+KEY_W = 32
+KEY_E = 64
+KEY_R = 128
+
+# [tables] - device inputs held across ticks, as state bits
+MOUSE_BITS = {1: BUTTON_LEFT, 2: BUTTON_MIDDLE, 3: BUTTON_RIGHT}   # [table] - pygame mouse button -> bit
+KEY_BITS = {pygame.K_SPACE: KEY_FIRE, pygame.K_q: KEY_Q, pygame.K_w: KEY_W, pygame.K_e: KEY_E, pygame.K_r: KEY_R}  # [table] - key -> bit
+# [table] - event types LiveInput folds into its state
+DEVICE_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                           pygame.MOUSEBUTTONUP, pygame.WINDOWFOCUSLOST))
+
+
+# [state class] - Everything the simulation reads from the devices in one tick
+class InputState:
+    """Mouse position plus a bit set of the buttons and keys the game uses."""
+    __slots__ = ('mouse_pos', 'buttons')
+
+    # [constructor] - an idle mouse at the origin
+    def __init__(self, mouse_pos=(0, 0), buttons: int = 0) -> None:
+        """Initialize a state with the given mouse position and button bits."""
+        self.mouse_pos = mouse_pos  # [attribute] - (x, y) in world coordinates
+        self.buttons = buttons      # [attribute] - BUTTON_* / KEY_* bits held this tick
+
+
+# [source class] - Device state assembled from the frame's events
+class LiveInput:
+    """Input source fed by EventDispatcher: mouse motion and button/key events update held bits, sample() copies them.
+
+    Sampling makes no SDL calls, so input costs the same however many
+    entities read the state. Presses are also latched until the next sample,
+    so a click or tap released within the same event batch still shows up
+    as held for one tick.
+    """
+
+    # [constructor] - starts with an idle state until the first events
+    def __init__(self) -> None:
+        """Initialize with an idle state."""
+        self.state = InputState()   # [attribute] - state for the current tick
+        self.camera = None          # [attribute] - Camera translating the window mouse position to world space
+        self.tick = 0               # [attribute] - ticks sampled so far
+        self.finished = False       # [attribute] - live input never runs out
+        self.mouse_pos = (0, 0)     # [attribute] - last window position reported by the mouse
+        self.held = 0               # [attribute] - BUTTON_* / KEY_* bits currently down
+        self.pressed = 0            # [attribute] - bits pressed since the last sample (even if released again)
+
+    # [public method] - folds one device event into the held state
+    def handle_event(self, event) -> None:
+        """Update the mouse position, held bits and latched presses from a mouse or keyboard event."""
+        kind = event.type
+        if kind == pygame.MOUSEMOTION:
+            self.mouse_pos = event.pos
+        elif kind == pygame.KEYDOWN:
+            bit = KEY_BITS.get(event.key, 0)
+            self.held |= bit
+            self.pressed |= bit
+        elif kind == pygame.KEYUP:
+            self.held &= ~KEY_BITS.get(event.key, 0)
+        elif kind == pygame.MOUSEBUTTONDOWN:
+            self.mouse_pos = event.pos
+            bit = MOUSE_BITS.get(event.button, 0)
+            self.held |= bit
+            self.pressed |= bit
+        elif kind == pygame.MOUSEBUTTONUP:
+            self.mouse_pos = event.pos
+            self.held &= ~MOUSE_BITS.get(event.button, 0)
+        elif kind == pygame.WINDOWFOCUSLOST:
+            self.held = 0  # [release] - key-up events are not delivered while unfocused
+
+    # [public method] - captures the devices for the next simulation tick
+    def sample(self) -> InputState:
+        """Copy the held bits, plus presses latched since the last sample, into state and return it."""
+        mouse_pos = self.mouse_pos
+        # [world space] - logs and replays hold world positions, independent of where the camera was
+        self.state.mouse_pos = self.camera.to_world(mouse_pos) if self.camera is not None else mouse_pos
+        self.state.buttons = self.held | self.pressed
+        self.pressed = 0
+        self.tick += 1
+        return self.state
+
+
+# [source class] - Passes another source through while logging every tick
+class InputRecorder:
+    """Input source that forwards another source's samples and appends them to a binary log."""
+
+    # [constructor] - opens the log and writes its header
+    def __init__(self, source, path: str, seed: int = 0) -> None:
+        """Initialize a recorder of source's samples to path for a session seeded with seed."""
+        self.source = source        # [attribute] - where the samples really come from
+        self.seed = seed            # [attribute] - RNG seed stored in the log header
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(INPUT_MAGIC, seed))
+        self.finished = False
+
+    # [property] - the recorded source's current state
+    @property
+    def state(self) -> InputState:
+        return self.source.state
+
+    # [property] - ticks recorded so far
+    @property
+    def tick(self) -> int:
+        return self.source.tick
+
+    # [public method] - samples the wrapped source and logs the result
+    def sample(self) -> InputState:
+        """Sample the wrapped source, append the tick to the log and return the state."""
+        state = self.source.sample()
+        x, y = state.mouse_pos
+        self._file.write(RECORD.pack(x, y, state.buttons))
+        return state
+
+    # [public method] - flushes and closes the log
+    def close(self) -> None:
+        """Close the log file."""
+        self._file.close()
+
+
+# [source class] - Feeds a recorded log back tick by tick
+class InputReplayer:
+    """Input source that returns the states of a recorded log in order."""
+
+    # [constructor] - reads the whole log (a few bytes per tick)
+    def __init__(self, path: str) -> None:
+        """Load the log at path; raises ValueError if it is not an input log."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not an input log")
+        magic, self.seed = HEADER.unpack_from(data, 0)
+        if magic != INPUT_MAGIC:
+            raise ValueError(f"{path} is not an input log")
+        body = data[HEADER.size:]
+        self._records = list(RECORD.iter_unpack(body[:len(body) - len(body) % RECORD.size]))
+        self.state = InputState()   # [attribute] - state for the current tick
+        self.tick = 0               # [attribute] - ticks replayed so far
+        self.finished = not self._records  # [attribute] - True once every recorded tick was returned
+
+    # [public method] - length of the recording
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # [public method] - returns the next recorded tick
+    def sample(self) -> InputState:
+        """Advance to the next recorded tick; after the end the last state is repeated."""
+        if self.tick < len(self._records):
+            x, y, buttons = self._records[self.tick]
+            self.state.mouse_pos = (x, y)
+            self.state.buttons = buttons
+            self.tick += 1
+            self.finished = self.tick >= len(self._records)
+        return self.state
+
+    # [public method] - nothing to release
+    def close(self) -> None:
+        pass
+
+
+# [dispatcher class] - One pass over a filtered event queue per frame
+class EventDispatcher:
+    """Route each frame's SDL events through tables instead of an if-chain.
+
+    Device events update a LiveInput; KEYDOWN events also look up a key
+    binding; any other type looks up a handler. allow() limits the SDL queue
+    to the types that can reach one of these.
+    """
+
+    # [constructor] - empty binding and handler tables
+    def __init__(self, source: LiveInput = None) -> None:
+        """Initialize a dispatcher feeding source (default: the shared live input)."""
+        self.source = source if source is not None else live_input  # [attribute] - receives device events
+        self.bindings = {}   # [attribute] - key -> callback(), run when the key is pressed
+        self.handlers = {}   # [attribute] - event type -> callback(event)
+
+    # [public method] - binds a key press
+    def bind(self, key: int, callback) -> None:
+        """Call callback() whenever key is pressed."""
+        self.bindings[key] = callback
+
+    # [public method] - handles an event type
+    def on(self, event_type: int, callback) -> None:
+        """Call callback(event) for every event of event_type."""
+        self.handlers[event_type] = callback
+
+    # [public method] - filters the SDL queue
+    def allow(self) -> None:
+        """Block every event type except device input and the types with a handler."""
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(DEVICE_EVENTS) + list(self.handlers))
+        self.source.mouse_pos = pygame.mouse.get_pos()  # [start] - position before the first motion event
+
+    # [public method] - drains the queue
+    def dispatch(self) -> None:
+        """Process every pending event."""
+        handle = self.source.handle_event
+        bindings = self.bindings
+        handlers = self.handlers
+        for event in pygame.event.get():
+            kind = event.type
+            handler = handlers.get(kind)
+            if handler is not None:
+                handler(event)
+            if kind in DEVICE_EVENTS:
+                handle(event)
+                if kind == pygame.KEYDOWN:
+                    callback = bindings.get(event.key)
+                    if callback is not None:
+                        callback()
+
+# [module instance] - the device source used when an entity is not given one
+live_input = LiveInput()
@@ -0,0 +1,270 @@
+import math          # [library import] - math: diagonal step cost
+from collections import OrderedDict  # [library import] - OrderedDict: LRU of destination fields
+import numpy as np   # [library import] - numpy: grid-wide integration and flow computations
+from systems.camera import WORLD_SIZE  # [constant import] - WORLD_SIZE: extent of the default grid
+
+# [constants] - grid defaults and neighbour layout
+CELL_SIZE = 25           # [constant] - pixels per navigation cell
+MAX_FIELDS = 16          # [constant] - destination fields kept in the LRU cache
+MAX_CHANGE_LOG = 256     # [constant] - obstacle edits kept for incremental repair; older fields rebuild fully
+LOS_SAMPLES = 2          # [constant] - line-of-sight samples per cell of distance
+UNREACHABLE = np.inf
+# [constant] - (row offset, column offset, step cost) of the 8 neighbours
+NEIGHBOURS = [(-1, 0, 1.0), (1, 0, 1.0), (0, -1, 1.0), (0, 1, 1.0),
+              (-1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (1, 1, math.sqrt(2))]
+
+
+# [grid class] - Walkability over the playfield
+class NavGrid:
+    """Blocked/open cells over a world area, with a log of edits so cached fields can repair themselves."""
+
+    # [constructor] - an open grid covering width x height pixels
+    def __init__(self, width: int = WORLD_SIZE[0], height: int = WORLD_SIZE[1], cell_size: int = CELL_SIZE) -> None:
+        """Initialize an obstacle-free grid."""
+        self.cell_size = cell_size
+        self.cols = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)  # [array] - True where units cannot walk
+        self.version = 0          # [attribute] - number of edits so far
+        self._changes = []        # [attribute] - (version after edit, flat cell indices, blocked) for recent edits
+
+    # [public method] - pixel position to (row, col), clamped to the grid
+    def cell_of(self, x: float, y: float):
+        """Return the (row, col) containing pixel position (x, y)."""
+        col = min(max(int(x // self.cell_size), 0), self.cols - 1)
+        row = min(max(int(y // self.cell_size), 0), self.rows - 1)
+        return row, col
+
+    # [public method] - centre of a cell in pixels
+    def cell_center(self, row: int, col: int):
+        """Return the pixel centre of cell (row, col)."""
+        return (col + 0.5) * self.cell_size, (row + 0.5) * self.cell_size
+
+    # [public method] - blocks or clears every cell a rect touches
+    def set_blocked(self, rect, blocked: bool = True) -> None:
+        """Mark the cells overlapping rect (x, y, w, h in pixels) as blocked or open."""
+        x, y, w, h = rect
+        c0, r0 = max(int(x // self.cell_size), 0), max(int(y // self.cell_size), 0)
+        c1 = min(int((x + w - 1) // self.cell_size), self.cols - 1)
+        r1 = min(int((y + h - 1) // self.cell_size), self.rows - 1)
+        if c1 < c0 or r1 < r0:
+            return
+        region = self.blocked[r0:r1 + 1, c0:c1 + 1]
+        changed = region != blocked
+        if not changed.any():
+            return
+        rows, cols = np.nonzero(changed)
+        region[changed] = blocked
+        self.version += 1
+        self._changes.append((self.version, (rows + r0) * self.cols + (cols + c0), blocked))
+        if len(self._changes) > MAX_CHANGE_LOG:
+            del self._changes[0]
+
+    # [public method] - edits made after a given version
+    def changes_since(self, version: int):
+        """Return [(flat cells, blocked), ...] made after version, or None if the log no longer reaches back that far."""
+        if version == self.version:
+            return []
+        if not self._changes or self._changes[0][0] > version + 1:
+            return None
+        return [(cells, blocked) for v, cells, blocked in self._changes if v > version]
+
+
+# [field class] - Integration and flow field toward one destination cell
+class FlowField:
+    """Cost-to-destination for every cell plus the direction to walk from it.
+
+    Built once per destination by a vectorized wavefront; obstacle edits are
+    repaired incrementally (only cells whose path crossed a new wall are reset).
+    Steering is a constant-time lookup.
+    """
+
+    # [constructor] - computes the field for destination cell (row, col)
+    def __init__(self, grid: NavGrid, destination) -> None:
+        """Initialize the field toward destination (row, col) on grid."""
+        self.grid = grid
+        self.destination = destination   # [attribute] - (row, col)
+        self.goal = grid.cell_center(*destination)  # [attribute] - pixel point units converge on
+        self.version = -1                # [attribute] - grid version the field matches
+        self.rebuild()
+
+    # [public method] - full recomputation
+    def rebuild(self) -> None:
+        """Recompute the integration field, flow directions and line-of-sight mask from scratch."""
+        grid = self.grid
+        if not grid.blocked.any():
+            # [open grid] - the octile distance is the exact 8-neighbour path cost, no wavefront needed
+            row_index, col_index = np.indices((grid.rows, grid.cols))
+            drow = np.abs(row_index - self.destination[0])
+            dcol = np.abs(col_index - self.destination[1])
+            self.cost = np.maximum(drow, dcol) + (math.sqrt(2) - 1) * np.minimum(drow, dcol)
+        else:
+            self.cost = np.full((grid.rows, grid.cols), UNREACHABLE)  # [array] - path cost in cells to destination
+            if not grid.blocked[self.destination]:
+                self.cost[self.destination] = 0.0
+            self._relax()
+        self._build_flow()
+        self.version = grid.version
+
+    # [public method] - brings the field up to date with the grid
+    def sync(self) -> None:
+        """Apply obstacle edits made since the field was built, incrementally when possible."""
+        if self.version == self.grid.version:
+            return
+        changes = self.grid.changes_since(self.version)
+        if changes is None:
+            self.rebuild()
+            return
+        cost = self.cost
+        flat = cost.reshape(-1)
+        newly_blocked = np.zeros(flat.size, dtype=bool)
+        for cells, blocked in changes:
+            newly_blocked[cells] = blocked  # [last edit wins] - a wall added then removed needs no invalidation
+        if newly_blocked.any():
+            # [invalidate] - every cell whose path runs through a new wall loses its cost
+            # (the 8 neighbours too: a new wall can forbid a diagonal step that cut its corner)
+            around = newly_blocked.reshape(cost.shape)
+            padded = np.zeros((cost.shape[0] + 2, cost.shape[1] + 2), dtype=bool)
+            padded[1:-1, 1:-1] = around
+            affected = np.zeros(cost.shape, dtype=bool)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    affected |= padded[1 + dr:cost.shape[0] + 1 + dr, 1 + dc:cost.shape[1] + 1 + dc]
+            affected = affected.reshape(-1)
+            parent = self.parent.copy()
+            while True:
+                grown = affected | affected[parent]
+                if (grown == affected).all():
+                    break
+                affected = grown
+                parent = parent[parent]  # [pointer jumping] - path length halves each round
+            flat[affected] = UNREACHABLE
+        flat[self.grid.blocked.reshape(-1)] = UNREACHABLE
+        if not self.grid.blocked[self.destination]:
+            cost[self.destination] = 0.0
+        # [repair] - the wavefront only needs to refill reset cells and improve around cleared ones
+        self._relax()
+        self._build_flow()
+        self.version = self.grid.version
+
+    # [helper method] - vectorized Bellman-Ford wavefront until costs stop changing
+    def _relax(self) -> None:
+        cost = self.cost
+        open_cells = ~self.grid.blocked
+        rows, cols = cost.shape
+        padded = np.full((rows + 2, cols + 2), UNREACHABLE)
+        # [no corner cutting] - a diagonal step needs both orthogonal neighbours open
+        open_padded = np.zeros((rows + 2, cols + 2), dtype=bool)
+        open_padded[1:-1, 1:-1] = open_cells
+        penalty = []
+        for dr, dc, step in NEIGHBOURS:
+            if dr and dc:
+                ok = open_padded[1 + dr:rows + 1 + dr, 1:-1] & open_padded[1:-1, 1 + dc:cols + 1 + dc]
+                penalty.append(np.where(ok, step, UNREACHABLE))
+            else:
+                penalty.append(step)
+        while True:
+            padded[1:-1, 1:-1] = cost
+            best = cost.copy()
+            for (dr, dc, _), extra in zip(NEIGHBOURS, penalty):
+                np.minimum(best, padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc] + extra, out=best)
+            best[~open_cells] = UNREACHABLE
+            if np.array_equal(best, cost):
+                break
+            cost[...] = best
+
+    # [helper method] - per-cell direction, parent cell and line of sight
+    def _build_flow(self) -> None:
+        grid = self.grid
+        rows, cols = self.cost.shape
+        padded = np.full((rows + 2, cols + 2), UNREACHABLE)
+        padded[1:-1, 1:-1] = self.cost
+        stacked = np.stack([padded[1 + dr:rows + 1 + dr, 1 + dc:cols + 1 + dc] for dr, dc, _ in NEIGHBOURS])
+        choice = stacked.argmin(axis=0)
+        offsets = np.array([(dr, dc) for dr, dc, _ in NEIGHBOURS])
+        reachable = np.isfinite(self.cost) & (self.cost > 0)
+
+        row_index, col_index = np.indices((rows, cols))
+        parent_row = np.clip(row_index + offsets[choice, 0], 0, rows - 1)
+        parent_col = np.clip(col_index + offsets[choice, 1], 0, cols - 1)
+        own = row_index * cols + col_index
+        # [array] - flat index of the next cell on each path (cells off any path point at themselves)
+        self.parent = np.where(reachable, parent_row * cols + parent_col, own).reshape(-1)
+
+        direction = offsets[choice][..., ::-1].astype(np.float64)  # [dx, dy] = [col offset, row offset]
+        direction /= np.maximum(np.hypot(direction[..., 0], direction[..., 1]), 1e-9)[..., None]
+        direction[~reachable] = 0.0
+        self.flow = direction                                     # [array] - (rows, cols, 2) unit steps
+        self.reachable = np.isfinite(self.cost)                   # [array] - a path to the destination exists
+        self.line_of_sight = self._line_of_sight(row_index, col_index)  # [array] - straight walk is unobstructed
+
+    # [helper method] - vectorized straight-line test from every cell centre to the destination
+    def _line_of_sight(self, row_index, col_index) -> np.ndarray:
+        grid = self.grid
+        if not grid.blocked.any():
+            return self.reachable.copy()
+        dest_row, dest_col = self.destination
+        span = int(max(grid.rows, grid.cols) * LOS_SAMPLES) + 1
+        t = np.linspace(0.0, 1.0, span)
+        sample_row = np.rint(row_index[..., None] + (dest_row - row_index)[..., None] * t).astype(np.int32)
+        sample_col = np.rint(col_index[..., None] + (dest_col - col_index)[..., None] * t).astype(np.int32)
+        return ~grid.blocked[sample_row, sample_col].any(axis=-1) & self.reachable
+
+    # [public method] - O(1) steering lookup
+    def steer(self, x: float, y: float, target=None):
+        """Return the unit (dx, dy) to walk from pixel (x, y): straight at target (default: the destination
+        cell centre) when in sight, else along the field.
+
+        Returns (0.0, 0.0) when the destination cannot be reached from there.
+        """
+        row, col = self.grid.cell_of(x, y)
+        if not self.reachable[row, col]:
+            return 0.0, 0.0
+        if self.line_of_sight[row, col]:
+            goal = target if target is not None else self.goal
+            dx = goal[0] - x
+            dy = goal[1] - y
+            distance = math.hypot(dx, dy)
+            return (dx / distance, dy / distance) if distance > 0 else (0.0, 0.0)
+        dx, dy = self.flow[row, col]
+        return float(dx), float(dy)
+
+
+# [cache class] - Flow fields by destination, least recently used evicted first
+class FlowFieldCache:
+    """Shares one FlowField between every unit sent to the same destination cell."""
+
+    # [constructor] - empty cache over a grid
+    def __init__(self, grid: NavGrid = None, max_fields: int = MAX_FIELDS) -> None:
+        """Initialize a cache of up to max_fields fields over grid (default: an open grid over the world)."""
+        self.grid = grid if grid is not None else NavGrid()
+        self.max_fields = max_fields
+        self._fields = OrderedDict()   # [attribute] - (row, col) -> FlowField, oldest use first
+        self.hits = 0                  # [attribute] - requests served by an existing field
+        self.misses = 0                # [attribute] - fields computed
+
+    # [public method] - field toward a pixel destination
+    def field(self, destination) -> FlowField:
+        """Return the up-to-date field toward the cell containing pixel destination (x, y)."""
+        key = self.grid.cell_of(*destination)
+        field = self._fields.get(key)
+        if field is None:
+            self.misses += 1
+            field = FlowField(self.grid, key)
+            self._fields[key] = field
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)  # [LRU] - drop the least recently used destination
+        else:
+            self.hits += 1
+            self._fields.move_to_end(key)
+            field.sync()
+        return field
+
+    # [public method] - returns cache counters for debugging
+    def stats(self) -> dict:
+        """Return field count and hit/miss counts."""
+        return {'fields': len(self._fields), 'hits': self.hits, 'misses': self.misses}
+
+
+# [module instance] - navigation over the windowed game's playfield
+navigation = FlowFieldCache()
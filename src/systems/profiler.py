@@ -0,0 +1,182 @@
+import os            # [library import] - os: process id for trace events
+import json          # [library import] - json: Chrome trace output
+import time          # [library import] - time: perf_counter timestamps
+from array import array  # [library import] - array: fixed-size float ring buffers
+
+# [constants] - history length and trace size limits
+HISTORY_FRAMES = 240       # [constant] - frames kept in the rolling history (4 s at 60 FPS)
+MAX_TRACE_EVENTS = 200000  # [constant] - trace stops recording after this many events
+
+
+# [helper class] - context manager returned by Profiler.scope() while enabled
+class _Scope:
+    __slots__ = ('profiler', 'name')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler.begin(self.name)
+
+    def __exit__(self, *exc):
+        self.profiler.end(self.name)
+
+
+# [helper class] - shared do-nothing context manager returned while disabled
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SCOPE = _NullScope()
+
+
+# [profiler class] - Per-frame timing scopes, counters, rolling history and Chrome trace capture
+class Profiler:
+    """Collect per-scope milliseconds each frame into ring buffers; optionally record a Chrome trace.
+
+    Every public method returns immediately while disabled, so instrumented
+    call sites cost one attribute check.
+    """
+
+    # [constructor] - sets up ring buffers and trace state
+    def __init__(self, history: int = HISTORY_FRAMES, enabled: bool = False) -> None:
+        """Initialize a profiler keeping history frames of timings."""
+        self.enabled = enabled       # [attribute] - master switch checked by every call
+        self.history = history       # [attribute] - ring buffer length in frames
+        self.frame_index = 0         # [attribute] - frames completed since creation
+        self.scope_names = []        # [attribute] - scope names in first-seen order (stable graph colours)
+        self.scope_history = {}      # [attribute] - scope name -> ring of per-frame ms
+        self.frame_history = array('f', [0.0] * history)  # [attribute] - ring of whole-frame ms
+        self.counters = {}           # [attribute] - counter name -> value for the last completed frame
+        self._frame_counters = {}    # [attribute] - counters being set during the current frame
+        self._frame_ms = {}          # [attribute] - scope name -> ms accumulated this frame
+        self._open = {}              # [attribute] - scope name -> start timestamp
+        self._frame_start = None     # [attribute] - timestamp of begin_frame()
+        self.tracing = False         # [attribute] - whether scopes are also appended to the trace
+        self._trace = []             # [attribute] - Chrome trace events
+        self._trace_origin = time.perf_counter()
+
+    # [public method] - toggles collection
+    def toggle(self) -> None:
+        """Switch collection on or off, dropping any half-open scopes."""
+        self.enabled = not self.enabled
+        self._open.clear()
+        self._frame_start = None
+
+    # [public method] - marks the start of a frame
+    def begin_frame(self) -> None:
+        """Mark the start of a frame."""
+        if not self.enabled:
+            return
+        self._frame_start = time.perf_counter()
+
+    # [public method] - closes the frame and writes its timings into the ring buffers
+    def end_frame(self) -> None:
+        """Close the frame and store its timings and counters in the history."""
+        if not self.enabled or self._frame_start is None:
+            return
+        now = time.perf_counter()
+        slot = self.frame_index % self.history
+        self.frame_history[slot] = (now - self._frame_start) * 1000.0
+        for name in self.scope_names:
+            self.scope_history[name][slot] = self._frame_ms.get(name, 0.0)
+        self._frame_ms.clear()
+        self.counters, self._frame_counters = self._frame_counters, self.counters
+        self._frame_counters.clear()
+        if self.tracing:
+            self._add_trace_event('frame', self._frame_start, now)
+        self.frame_index += 1
+
+    # [public method] - starts a timing scope
+    def begin(self, name: str) -> None:
+        """Start timing scope name."""
+        if not self.enabled:
+            return
+        self._open[name] = time.perf_counter()
+
+    # [public method] - ends a timing scope and accumulates it into this frame
+    def end(self, name: str) -> None:
+        """Stop timing scope name and add it to this frame's total for that scope."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        start = self._open.pop(name, None)
+        if start is None:
+            return
+        if name not in self.scope_history:
+            self.scope_names.append(name)
+            self.scope_history[name] = array('f', [0.0] * self.history)
+        self._frame_ms[name] = self._frame_ms.get(name, 0.0) + (now - start) * 1000.0
+        if self.tracing:
+            self._add_trace_event(name, start, now)
+
+    # [public method] - with-statement form of begin()/end()
+    def scope(self, name: str):
+        """Return a context manager timing name (a shared no-op while disabled)."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    # [public method] - records a per-frame count (projectiles, targets, collision tests, ...)
+    def count(self, name: str, value) -> None:
+        """Set counter name for the current frame."""
+        if not self.enabled:
+            return
+        self._frame_counters[name] = value
+
+    # [public method] - summary statistics over the history window
+    def summary(self) -> dict:
+        """Return avg/p99/worst frame ms, the worst frame's age and per-scope average ms."""
+        frames = min(self.frame_index, self.history)
+        if frames == 0:
+            return {'frames': 0, 'avg_ms': 0.0, 'p99_ms': 0.0, 'worst_ms': 0.0, 'worst_age': 0, 'scopes': {}}
+        newest = (self.frame_index - 1) % self.history
+        values = self.frame_history[:frames] if frames < self.history else self.frame_history
+        ordered = sorted(values)
+        worst_slot = max(range(frames), key=values.__getitem__)
+        return {
+            'frames': frames,
+            'avg_ms': sum(ordered) / frames,
+            'p99_ms': ordered[min(frames - 1, int(frames * 0.99))],
+            'worst_ms': ordered[-1],
+            'worst_age': (newest - worst_slot) % self.history,
+            'scopes': {name: sum(self.scope_history[name][:frames]) / frames for name in self.scope_names},
+        }
+
+    # [public method] - begins capturing Chrome trace events
+    def start_trace(self) -> None:
+        """Start recording every scope and frame as a Chrome trace event."""
+        self._trace.clear()
+        self.tracing = True
+
+    # [public method] - writes the captured trace for chrome://tracing or Perfetto
+    def dump_trace(self, path: str) -> int:
+        """Write captured events as Chrome trace JSON to path; return the number of events."""
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self._trace, 'displayTimeUnit': 'ms'}, f)
+        return len(self._trace)
+
+    # [helper method] - appends one complete ("X") event
+    def _add_trace_event(self, name, start, end) -> None:
+        if len(self._trace) >= MAX_TRACE_EVENTS:
+            self.tracing = False
+            return
+        self._trace.append({
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self._trace_origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': os.getpid(),
+            'tid': 0,
+        })
+
+
+# [module instance] - the shared profiler every system reports to
+profiler = Profiler()
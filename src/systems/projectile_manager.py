@@ -1,28 +1,64 @@
 import pygame   # [library import] - pygame: used for display, rects, and blitting
 import math     # [library import] - math: used for distance and range calculations
-from entities.projectiles import Projectile  # [class import] - Projectile: represents a single projectile entity
+from systems.projectile_pool import ProjectilePool  # [class import] - ProjectilePool: reusable, fixed-capacity projectile storage
+from systems.broadphase import SpatialHash, Collider  # [class import] - grid broadphase and resolved target records
+from systems.swept_collision import segment_aabb_toi, NO_HIT  # [function import] - exact time of impact for swept mode
+from systems.game_loop import FIXED_DT  # [constant import] - FIXED_DT: default simulation step in seconds
+from systems.camera import WORLD_RECT  # [constant import] - WORLD_RECT: default projectile bounds
+from systems.damage import damage_pipeline as shared_damage  # [pipeline import] - hits are buffered and resolved per tick
+from systems.telemetry import telemetry  # [telemetry import] - shot events, recorded only while telemetry is on
+
+# [telemetry channels] - shared with the vectorized backend (registration by name is idempotent)
+SHOTS = telemetry.counter('projectile.shots')
+SHOT_FIRED = telemetry.event('projectile.fired', ('target_x', 'target_y'))
+
+
 
 # [manager class] - Handles all projectile logic, including creation, updates, collision, and rendering
 class ProjectileManager:
-    # [constructor] - Initializes projectile and target lists
-    def __init__(self) -> None:
-        """Initialize the Projectile Manager"""
-        self.projectiles = []  # [attribute] - list of active projectiles
+    # [constructor] - Initializes projectile pool and target list
+    def __init__(self, capacity: int = 2048, swept: bool = False, bounds=None, damage_pipeline=None) -> None:
+        """Initialize the Projectile Manager
+
+        With swept=True, hits are found by sweeping each projectile along its
+        path for the frame, so fast projectiles cannot tunnel through hitboxes.
+        Hits go to damage_pipeline (default: the shared one), which the game
+        loop resolves once per tick.
+        """
+        self.swept = swept     # [attribute] - continuous collision mode flag
+        self.damage_pipeline = damage_pipeline if damage_pipeline is not None else shared_damage  # [attribute] - hit buffer
+        self.bounds = bounds if bounds is not None else WORLD_RECT.copy()  # [attribute] - Rect projectiles must stay inside (default: the world)
+        self._sweep_rect = pygame.Rect(0, 0, 0, 0)  # [attribute] - reusable bounds of a projectile's path this step
+        self._dt = FIXED_DT    # [attribute] - length of the last simulation step, used for render interpolation
+        self.pool = ProjectilePool(capacity)   # [attribute] - pooled projectile storage
+        self.projectiles = self.pool.active    # [attribute] - dense list of active projectiles (owned by the pool)
         self.targets = []      # [attribute] - list of potential targets (e.g., enemies, rivals)
+        self._colliders = []   # [attribute] - targets that can actually be hit, resolved in add_target
+        self.broadphase = SpatialHash(cell_size=64)  # [attribute] - rebuilt from target hitboxes every update
+        self._candidates = []  # [attribute] - reusable query result buffer
+        self.collision_tests = 0  # [attribute] - narrowphase tests run during the last update
 
     # [public method] - Adds a new target for collision detection
     def add_target(self, target):
         """Add a target that projectiles can collide with."""
         if target not in self.targets:
             self.targets.append(target)
+            # [capability check] - resolved once here instead of hasattr() per projectile/target pair
+            if hasattr(target, 'check_projectile_collision'):
+                self._colliders.append(Collider(target, self.damage_pipeline.register(target)))
+
+    # [public method] - Removes a target from collision detection
+    def remove_target(self, target):
+        """Stop projectiles from colliding with a target."""
+        if target in self.targets:
+            self.targets.remove(target)
+            self._colliders = [c for c in self._colliders if c.target is not target]
 
     # [public method] - Fires a new projectile from a source to a target
     def fire_projectile(self, name: str, damage: float, speed: float, range: float, p_source: tuple, p_target: tuple):
         """Create and fire a new projectile toward the mouse position"""
-        print(f"Firing projectile: {name} at target: {p_target}")  # [debug] - logs firing event
-        
-        # [object instantiation] - create a new projectile instance
-        new_projectile = Projectile(
+        # [pool operation] - reuse a despawned projectile instead of allocating a new one
+        self.pool.spawn(
             name=name,
             damage=damage,
             speed=speed,
@@ -30,51 +66,148 @@ class ProjectileManager:
             p_source=p_source,
             p_target=p_target
         )
-        
-        # [list operation] - add projectile to active list
-        self.projectiles.append(new_projectile)
-        print(f"Active projectiles: {len(self.projectiles)}")  # [debug] - logs number of projectiles
+        if telemetry.enabled:  # [telemetry] - one attribute read when off
+            telemetry.add(SHOTS)
+            tx, ty = p_target if isinstance(p_target, tuple) else p_target.rect.center
+            telemetry.emit(SHOT_FIRED, tx, ty)
 
     # [public method] - Updates all projectiles: movement, range, collision, and removal
-    def update_projectiles(self):
-        """Update all projectiles (movement and range checks)"""
-        screen_rect = pygame.display.get_surface().get_rect()  # [local variable] - screen bounds for off-screen checks
+    def update_projectiles(self, dt=FIXED_DT):
+        """Advance all projectiles by one simulation step of dt seconds (movement, range, collision)"""
+        self._dt = dt
+        bounds = self.bounds  # [local variable] - world bounds; projectiles leaving them are culled
         
-        for projectile in self.projectiles[:]:  # [iteration] - copy to allow safe removal
-            # [movement] - update projectile position by velocity
-            projectile.rect.x += projectile.velocity.x
-            projectile.rect.y += projectile.velocity.y
+        # [broadphase] - bucket target hitboxes by grid cell
+        broadphase = self.broadphase
+        broadphase.clear()
+        for collider in self._colliders:
+            broadphase.insert(collider, collider.box)
+        candidates = self._candidates
+        damage = self.damage_pipeline  # [local variable] - hits are buffered, applied by damage.resolve()
+        tests = 0
+
+        projectiles = self.projectiles
+        # [iteration] - walk backwards so swap-remove only moves already-processed projectiles
+        for index in range(len(projectiles) - 1, -1, -1):
+            projectile = projectiles[index]
+            rect = projectile.rect
+            start_x = rect.x  # [local variable] - position before moving, used by swept mode
+            start_y = rect.y
+
+            # [movement] - update projectile position by velocity (pixels per second)
+            rect.x += projectile.velocity.x * dt
+            rect.y += projectile.velocity.y * dt
             
-            # [range reduction] - decrease range by distance traveled this frame
-            projectile.range -= math.sqrt(projectile.velocity.x ** 2 + projectile.velocity.y ** 2)
+            # [range reduction] - decrease range by distance traveled this step
+            projectile.range -= math.sqrt(projectile.velocity.x ** 2 + projectile.velocity.y ** 2) * dt
             
-            # [collision detection] - check for collision with any target
+            # [collision detection] - narrowphase only against targets sharing a grid cell
             collision_occurred = False  # [flag] - tracks if collision happened
-            for target in self.targets:
-                if hasattr(target, 'check_projectile_collision'):  # [duck typing] - ensure method exists
-                    if target.check_projectile_collision(projectile):
-                        target.take_damage(projectile.damage)  # [damage trigger] - apply damage to target
-                        self.projectiles.remove(projectile)    # [removal] - remove projectile on hit
+            if broadphase and self.swept:
+                tests += self._sweep_candidates(rect, start_x, start_y, candidates)
+                collider = self._earliest_hit(rect, start_x, start_y, candidates)
+                if collider is not None:
+                    damage.hit(collider.slot, projectile.damage)  # [damage trigger] - first target along the path
+                    self.pool.release_at(index)
+                    continue
+            elif broadphase:
+                for collider in broadphase.query(projectile.rect, candidates):
+                    tests += 1
+                    if collider.check(projectile):
+                        damage.hit(collider.slot, projectile.damage)  # [damage trigger] - buffered until resolve()
+                        self.pool.release_at(index)              # [removal] - O(1) swap-remove on hit
                         collision_occurred = True
                         break
             
             if collision_occurred:
                 continue  # [control flow] - skip further checks if already collided
             
-            # [removal condition] - remove if out of range or off screen
+            # [removal condition] - remove if out of range or out of the world
             if (projectile.range <= 0 or  # [range check] - depleted range
-                not screen_rect.contains(projectile.rect)):  # [screen bounds check]
-                self.projectiles.remove(projectile)
+                not bounds.contains(projectile.rect)):  # [world bounds check]
+                self.pool.release_at(index)
                 continue
 
             # [redundant collision check] - if p_target is a sprite, check direct collision
             if projectile.p_target and not isinstance(projectile.p_target, tuple):
                 if projectile.rect.colliderect(projectile.p_target.rect):
-                    self.projectiles.remove(projectile)
+                    self.pool.release_at(index)
+
+        self.collision_tests = tests
+
+    # [helper method] - broadphase query over the whole path travelled this step
+    def _sweep_candidates(self, rect, start_x, start_y, candidates):
+        """Fill candidates with targets near the swept bounds and return how many were found."""
+        sweep = self._sweep_rect
+        sweep.update(min(start_x, rect.x), min(start_y, rect.y),
+                     abs(rect.x - start_x) + rect.width, abs(rect.y - start_y) + rect.height)
+        return len(self.broadphase.query(sweep, candidates))
+
+    # [helper method] - exact time of impact against each candidate, earliest wins
+    def _earliest_hit(self, rect, start_x, start_y, candidates):
+        """Return the candidate collider the projectile reaches first this step, or None."""
+        half_w = rect.width / 2
+        half_h = rect.height / 2
+        x0 = start_x + half_w
+        y0 = start_y + half_h
+        dx = rect.x - start_x
+        dy = rect.y - start_y
+        best = None
+        best_t = NO_HIT
+        for collider in candidates:
+            box = collider.box
+            t = segment_aabb_toi(x0, y0, dx, dy,
+                                 box.left - half_w, box.top - half_h, box.right + half_w, box.bottom + half_h)
+            if t < best_t:
+                best_t = t
+                best = collider
+        return best
+
+    # [public method] - Returns pool statistics (capacity, live count, high-water mark)
+    def stats(self) -> dict:
+        """Return projectile pool statistics."""
+        return self.pool.stats()
 
     # [public method] - Draws all active projectiles to the screen
-    def draw_projectiles(self, screen):
-        """Draw all active projectiles on the screen"""
-        for projectile in self.projectiles:
-            screen.blit(projectile.image, projectile.rect.topleft)  # [render] - draw projectile at its position
+    def draw_projectiles(self, screen, alpha=1.0, camera=None):
+        """Draw all active projectiles, alpha of the way from their previous to current step position
+
+        With a camera, only projectiles inside its view are drawn, shifted to window coordinates.
+        """
+        projectiles = self.projectiles
+        ox = oy = 0
+        if camera is not None:
+            view = camera.cull_rect
+            projectiles = [projectile for projectile in projectiles if view.colliderect(projectile.rect)]
+            ox, oy = camera.offset
+        # [render] - one batched fblits call for the whole layer; draw_offset centres the rotated image on the rect
+        if alpha >= 1.0 and not (ox or oy):
+            screen.fblits([(projectile.image, (projectile.rect.x + projectile.draw_offset[0],
+                                               projectile.rect.y + projectile.draw_offset[1]))
+                           for projectile in projectiles])
+            return
+        back = (1.0 - alpha) * self._dt if alpha < 1.0 else 0.0  # [interpolation] - seconds to rewind along the velocity
+        screen.fblits([
+            (projectile.image, (projectile.rect.x + projectile.draw_offset[0] - projectile.velocity.x * back - ox,
+                                projectile.rect.y + projectile.draw_offset[1] - projectile.velocity.y * back - oy))
+            for projectile in projectiles
+        ])
+
+    # [dunder method] - live count, shared with the vectorized backend
+    def __len__(self) -> int:
+        return len(self.projectiles)
+
 
+# [factory function] - Picks a projectile simulation backend
+def create_projectile_manager(backend: str = 'objects', capacity: int = None, swept: bool = False, bounds=None,
+                              damage_pipeline=None):
+    """Return a projectile manager for 'objects' (pooled Projectile) or 'numpy' (structure of arrays)."""
+    options = {'swept': swept, 'bounds': bounds, 'damage_pipeline': damage_pipeline}
+    if capacity:
+        options['capacity'] = capacity
+    if backend == 'numpy':
+        from systems.projectile_soa import VectorizedProjectileManager
+        return VectorizedProjectileManager(**options)
+    if backend != 'objects':
+        raise ValueError(f"Unknown projectile backend: {backend}")
+    return ProjectileManager(**options)
@@ -0,0 +1,82 @@
+from entities.projectiles import Projectile  # [class import] - Projectile: the pooled object type
+
+
+# [pool class] - Fixed-capacity store of reusable Projectile objects
+class ProjectilePool:
+    """Reuse Projectile objects through a free list and keep live ones in a dense list."""
+
+    # [constructor] - sets up the free list, the dense live list and stats counters
+    def __init__(self, capacity: int = 2048) -> None:
+        """Initialize an empty pool that will never hold more than capacity projectiles."""
+        self.capacity = capacity  # [attribute] - maximum number of projectiles ever allocated
+        self.active = []          # [attribute] - dense list of live projectiles (iteration order is unstable)
+        self._free = []           # [attribute] - free list of despawned projectiles ready for reuse
+        self.allocated = 0        # [attribute] - number of Projectile objects created so far
+        self.high_water = 0       # [attribute] - largest live count seen
+        self.dropped = 0          # [attribute] - spawn requests refused because the pool was full
+
+    # [public method] - creates projectiles up front so the first volley does not allocate
+    def prewarm(self, count: int = None) -> None:
+        """Allocate inactive projectiles into the free list, up to capacity."""
+        target = self.capacity if count is None else min(count, self.capacity)
+        while self.allocated < target:
+            self._free.append(Projectile())
+            self.allocated += 1
+
+    # [public method] - takes a projectile from the free list and spawns it
+    def spawn(self, name, damage, speed, range, p_source, p_target):
+        """Spawn a projectile, returning None if the pool is at capacity."""
+        if self._free:
+            projectile = self._free.pop()
+        elif self.allocated < self.capacity:
+            projectile = Projectile()
+            self.allocated += 1
+        else:
+            self.dropped += 1
+            return None
+
+        projectile.spawn(name, damage, speed, range, p_source, p_target)
+        self.active.append(projectile)
+        if len(self.active) > self.high_water:
+            self.high_water = len(self.active)
+        return projectile
+
+    # [public method] - O(1) removal by swapping the last live projectile into the hole
+    def release_at(self, index: int) -> None:
+        """Despawn the projectile at index; the last live projectile takes its slot."""
+        active = self.active
+        projectile = active[index]
+        last = active.pop()
+        if last is not projectile:
+            active[index] = last
+        projectile.despawn()
+        self._free.append(projectile)
+
+    # [public method] - removal by identity (O(n) lookup, kept for callers holding a reference)
+    def release(self, projectile) -> None:
+        """Despawn a specific live projectile."""
+        self.release_at(self.active.index(projectile))
+
+    # [public method] - despawns everything and drops cached sprite references
+    def clear(self) -> None:
+        """Despawn all live projectiles and release every pooled sprite reference."""
+        while self.active:
+            self.release_at(len(self.active) - 1)
+        for projectile in self._free:
+            projectile.release()
+
+    # [public method] - returns pool statistics for debugging
+    def stats(self) -> dict:
+        """Return capacity, live count, free count, high-water mark and drop count."""
+        return {
+            'capacity': self.capacity,
+            'live': len(self.active),
+            'free': len(self._free),
+            'allocated': self.allocated,
+            'high_water': self.high_water,
+            'dropped': self.dropped,
+        }
+
+    # [dunder method] - live count, so len(pool) mirrors len(manager.projectiles)
+    def __len__(self) -> int:
+        return len(self.active)
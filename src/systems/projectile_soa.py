@@ -0,0 +1,290 @@
+import pygame        # [library import] - pygame: fallback surface and blitting
+import numpy as np   # [library import] - numpy: contiguous per-field projectile arrays
+from entities.projectiles import PROJECTILE_IMG_PATH, PROJECTILE_SIZE, PROJECTILE_HEADING  # [constant import] - shared projectile sprite
+from systems.asset_cache import load_image  # [function import] - load_image: shared, process-wide surface cache
+from systems.broadphase import Collider, ROW_STRIDE  # [broadphase import] - resolved targets and cell key layout
+from systems.swept_collision import batch_segment_aabb_toi, NO_HIT  # [function import] - batched time of impact
+from systems.game_loop import FIXED_DT  # [constant import] - FIXED_DT: default simulation step in seconds
+from systems.camera import WORLD_RECT  # [constant import] - WORLD_RECT: default projectile bounds
+from systems.rotation_cache import rotation_cache, ANGLE_STEPS  # [cache import] - pre-rotated projectile images
+from systems.damage import damage_pipeline as shared_damage  # [pipeline import] - hits are buffered and resolved per tick
+from systems.telemetry import telemetry  # [telemetry import] - shot events, recorded only while telemetry is on
+
+# [constant] - above this many targets, hits are found through a sorted cell index instead of per-target scans
+GRID_TARGET_THRESHOLD = 8
+
+# [telemetry channels] - same channels as the object backend
+SHOTS = telemetry.counter('projectile.shots')
+SHOT_FIRED = telemetry.event('projectile.fired', ('target_x', 'target_y'))
+
+
+# [manager class] - Vectorized projectile simulation over a structure of NumPy arrays
+class VectorizedProjectileManager:
+    """Projectile manager that stores every field in its own array and updates them in batches.
+
+    Live projectiles occupy the prefix [0:count] of each array. Positions and
+    velocities are floats, so slow diagonal shots no longer drift through
+    integer Rect truncation.
+    """
+
+    # [constructor] - allocates every per-projectile array once
+    def __init__(self, capacity: int = 16384, cell_size: int = 64, swept: bool = False, bounds=None,
+                 damage_pipeline=None) -> None:
+        """Initialize the arrays for up to capacity live projectiles, buffering hits in damage_pipeline."""
+        self.capacity = capacity
+        self.swept = swept          # [attribute] - continuous collision mode flag
+        self.damage_pipeline = damage_pipeline if damage_pipeline is not None else shared_damage  # [attribute] - hit buffer
+        self.bounds = bounds if bounds is not None else WORLD_RECT.copy()  # [attribute] - Rect projectiles must stay inside (default: the world)
+        self.cell_size = cell_size  # [attribute] - broadphase grid cell size in pixels
+        self.count = 0          # [attribute] - number of live projectiles (prefix length)
+        self.high_water = 0     # [attribute] - largest live count seen
+        self.dropped = 0        # [attribute] - shots refused because the arrays were full
+        self.targets = []       # [attribute] - list of potential targets (e.g., enemies, rivals)
+        self._colliders = []    # [attribute] - targets that can actually be hit, resolved in add_target
+        self.collision_tests = 0  # [attribute] - narrowphase candidate tests during the last update
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)     # [array] - centre positions
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)     # [array] - velocity in pixels per second
+        self.step = np.zeros(capacity, dtype=np.float64)         # [array] - speed in pixels per second
+        self.range = np.zeros(capacity, dtype=np.float64)        # [array] - remaining range
+        self.damage = np.zeros(capacity, dtype=np.float64)       # [array] - damage dealt on hit
+        self.alive = np.zeros(capacity, dtype=bool)              # [array] - alive flags for the current frame
+        self.homing = np.empty(capacity, dtype=object)           # [array] - sprite p_target, or None for a point
+        self.heading = np.zeros(capacity, dtype=np.int32)        # [array] - rotation bucket chosen at fire time
+        self.indices = np.arange(capacity)                       # [array] - prebuilt index ramp for full scans
+        self.best_t = np.empty(capacity, dtype=np.float64)       # [scratch] - swept mode: earliest time of impact
+        self.best_c = np.empty(capacity, dtype=np.int64)         # [scratch] - swept mode: collider index of that impact
+        self._dt = FIXED_DT     # [attribute] - length of the last simulation step
+
+        self.half_size = np.array(PROJECTILE_SIZE, dtype=np.float64) / 2  # [attribute] - projectile half extents
+        try:
+            self.image = load_image(PROJECTILE_IMG_PATH, PROJECTILE_SIZE)
+        except (pygame.error, FileNotFoundError):
+            self.image = pygame.Surface(PROJECTILE_SIZE)
+            self.image.fill((255, 0, 0))  # [fallback] - red square if the sprite is missing
+        self.rotations = rotation_cache.get(self.image, ANGLE_STEPS, PROJECTILE_HEADING)  # [attribute] - image per heading bucket
+        self.bucket_images = np.empty(self.rotations.steps, dtype=object)  # [array] - bucket -> rotated Surface, for np.take
+        self.bucket_images[:] = self.rotations.images
+        # [blit sequence] - zip(blit_image[:k], blit_pos[:k]) is what fblits draws; no per-projectile Python objects
+        self.blit_image = np.empty(capacity, dtype=object)       # [scratch] - surface of each drawn projectile
+        self.blit_pos = np.empty((capacity, 2), dtype=np.int32)  # [scratch] - window position of each drawn projectile
+
+    # [public method] - Adds a new target for collision detection
+    def add_target(self, target):
+        """Add a target that projectiles can collide with."""
+        if target not in self.targets:
+            self.targets.append(target)
+            if hasattr(target, 'check_projectile_collision'):
+                self._colliders.append(Collider(target, self.damage_pipeline.register(target)))
+
+    # [public method] - Removes a target from collision detection
+    def remove_target(self, target):
+        """Stop projectiles from colliding with a target."""
+        if target in self.targets:
+            self.targets.remove(target)
+            self._colliders = [c for c in self._colliders if c.target is not target]
+
+    # [public method] - Fires a new projectile from a source to a target
+    def fire_projectile(self, name: str, damage: float, speed: float, range: float, p_source, p_target):
+        """Append a projectile to the live prefix of every array."""
+        i = self.count
+        if i >= self.capacity:
+            self.dropped += 1
+            return
+
+        sx, sy = p_source.rect.center
+        if isinstance(p_target, tuple):
+            tx, ty = p_target
+            self.homing[i] = None
+        else:
+            tx, ty = p_target.rect.center
+            self.homing[i] = p_target
+
+        dx = tx - sx
+        dy = ty - sy
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance > 0:
+            self.vel[i] = (dx / distance * speed, dy / distance * speed)
+            self.step[i] = speed
+        else:
+            self.vel[i] = (0.0, 0.0)
+            self.step[i] = 0.0
+        self.heading[i] = self.rotations.bucket(self.vel[i, 0], self.vel[i, 1])
+        self.pos[i] = (sx, sy)
+        self.range[i] = range
+        self.damage[i] = damage
+        self.alive[i] = True
+        if telemetry.enabled:  # [telemetry] - one attribute read when off
+            telemetry.add(SHOTS)
+            telemetry.emit(SHOT_FIRED, tx, ty)
+
+        self.count = i + 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+
+    # [public method] - Updates all projectiles in batched array operations
+    def update_projectiles(self, dt=FIXED_DT):
+        """Advance, collide, range-decay and cull every live projectile by dt seconds."""
+        self._dt = dt
+        n = self.count
+        if n == 0:
+            return
+        bounds = self.bounds
+
+        pos = self.pos[:n]
+        pos += self.vel[:n] * dt             # [batched movement]
+        rng = self.range[:n]
+        rng -= self.step[:n] * dt            # [batched range decay]
+        alive = self.alive[:n]
+
+        half_w, half_h = self.half_size
+        left = pos[:, 0] - half_w
+        right = pos[:, 0] + half_w
+        top = pos[:, 1] - half_h
+        bottom = pos[:, 1] + half_h
+
+        # [collision detection] - brute-force vector scan for a few targets, sorted cell index for many
+        colliders = self._colliders
+        if self.swept:
+            self.best_t[:n] = NO_HIT
+            self.best_c[:n] = -1
+        if len(colliders) > GRID_TARGET_THRESHOLD:
+            self._collide_grid(n, left, right, top, bottom, alive)
+        else:
+            self.collision_tests = n * len(colliders)
+            for ci, collider in enumerate(colliders):
+                self._narrowphase(ci, collider, self.indices[:n], left, right, top, bottom, alive)
+        if self.swept:
+            # [swept resolution] - each projectile hits only the first target along its path
+            best_c = self.best_c[:n]
+            hits = np.flatnonzero(best_c >= 0)
+            if hits.size:
+                slots = np.array([collider.slot for collider in colliders], dtype=np.int32)
+                self.damage_pipeline.hit_many(slots[best_c[hits]], self.damage[hits])
+            alive &= best_c < 0
+
+        # [batched cull] - out of range or not fully inside the world
+        alive &= rng > 0
+        alive &= (left >= bounds.left) & (right <= bounds.right)
+        alive &= (top >= bounds.top) & (bottom <= bounds.bottom)
+
+        # [redundant collision check] - projectiles fired at a sprite stop when they reach it
+        homing = self.homing[:n]
+        for index in np.flatnonzero(alive & (homing != None)):  # noqa: E711 - elementwise object compare
+            box = homing[index].rect
+            if left[index] < box.right and right[index] > box.left and top[index] < box.bottom and bottom[index] > box.top:
+                alive[index] = False
+
+        self._compact(n)
+
+    # [helper method] - broadphase: only test projectiles whose cell lies under a target's box
+    def _collide_grid(self, n, left, right, top, bottom, alive):
+        """Sort projectiles by cell key once, then slice out each target's cells with searchsorted."""
+        cell = self.cell_size
+        pos = self.pos[:n]
+        half_w, half_h = self.half_size
+        # [swept reach] - a projectile may end this step up to one step away from where it crossed the box
+        reach = self.step[:n].max() * self._dt if self.swept else 0.0
+        reach_x = half_w + reach
+        reach_y = half_h + reach
+        keys = (pos[:, 0] // cell).astype(np.int64) * ROW_STRIDE + (pos[:, 1] // cell).astype(np.int64)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        tests = 0
+
+        for ci, collider in enumerate(self._colliders):
+            box = collider.box
+            # [cell range] - cells a projectile centre can occupy while overlapping the box
+            y0 = int((box.top - reach_y) // cell)
+            y1 = int((box.bottom + reach_y) // cell)
+            for cx in range(int((box.left - reach_x) // cell), int((box.right + reach_x) // cell) + 1):
+                lo = np.searchsorted(sorted_keys, cx * ROW_STRIDE + y0, 'left')
+                hi = np.searchsorted(sorted_keys, cx * ROW_STRIDE + y1, 'right')
+                if hi <= lo:
+                    continue
+                idx = order[lo:hi]
+                tests += idx.size
+                self._narrowphase(ci, collider, idx, left, right, top, bottom, alive)
+
+        self.collision_tests = tests
+
+    # [helper method] - exact test of candidate projectiles idx against one collider
+    def _narrowphase(self, ci, collider, idx, left, right, top, bottom, alive):
+        """Overlap mode buffers hits in the damage pipeline; swept mode records the earliest time of impact."""
+        box = collider.box
+        if not self.swept:
+            hit = alive[idx] & (right[idx] > box.left) & (left[idx] < box.right) & (bottom[idx] > box.top) & (top[idx] < box.bottom)
+            hits = idx[hit]
+            if hits.size:
+                self.damage_pipeline.hit_many(collider.slot, self.damage[hits])  # [damage trigger] - buffered until resolve()
+                alive[hits] = False
+            return
+
+        half_w, half_h = self.half_size
+        vel = self.vel[idx] * self._dt  # [displacement] - distance moved this step
+        end = self.pos[idx]
+        t = batch_segment_aabb_toi(end[:, 0] - vel[:, 0], end[:, 1] - vel[:, 1], vel[:, 0], vel[:, 1],
+                                   box.left - half_w, box.top - half_h, box.right + half_w, box.bottom + half_h)
+        better = alive[idx] & (t < self.best_t[idx])
+        if better.any():
+            winners = idx[better]
+            self.best_t[winners] = t[better]
+            self.best_c[winners] = ci
+
+    # [helper method] - packs surviving projectiles into the array prefix
+    def _compact(self, n: int) -> None:
+        """Move live entries to the front of every array in one pass."""
+        keep = np.flatnonzero(self.alive[:n])
+        m = keep.size
+        if m != n:
+            for array in (self.pos, self.vel, self.step, self.range, self.damage, self.heading, self.homing):
+                array[:m] = array[keep]
+            self.homing[m:n] = None
+            self.alive[:m] = True
+            self.alive[m:n] = False
+        self.count = m
+
+    # [public method] - Draws all active projectiles with a single batched blit
+    def draw_projectiles(self, screen, alpha=1.0, camera=None):
+        """Draw all active projectiles, alpha of the way from their previous to current step position
+
+        Only projectiles inside the camera's view (without a camera: the screen's clip area) are drawn,
+        shifted to window coordinates. The blit sequence lives in preallocated arrays.
+        """
+        n = self.count
+        if n == 0:
+            return
+        topleft = self.pos[:n] - self.half_size
+        if alpha < 1.0:
+            topleft -= self.vel[:n] * ((1.0 - alpha) * self._dt)  # [interpolation] - rewind along velocity
+        view = camera.cull_rect if camera is not None else screen.get_clip()
+        x, y = topleft[:, 0], topleft[:, 1]
+        w, h = self.half_size * 2
+        shown = np.flatnonzero((x + w > view.left) & (x < view.right) & (y + h > view.top) & (y < view.bottom))
+        k = shown.size
+        if k == 0:
+            return
+        heading = self.heading[shown]
+        topleft = topleft[shown]
+        if camera is not None:
+            topleft -= camera.offset
+        topleft += self.rotations.offsets[heading]  # [rotation] - centre each rotated image on its projectile
+        images = self.blit_image[:k]
+        dest = self.blit_pos[:k]
+        np.take(self.bucket_images, heading, out=images)
+        np.copyto(dest, topleft, casting='unsafe')  # [truncate] - same rounding as astype(np.int32)
+        screen.fblits(zip(images, dest))
+
+    # [public method] - Returns backend statistics
+    def stats(self) -> dict:
+        """Return capacity, live count, high-water mark and drop count."""
+        return {
+            'capacity': self.capacity,
+            'live': self.count,
+            'high_water': self.high_water,
+            'dropped': self.dropped,
+        }
+
+    # [dunder method] - live count, mirroring len(ProjectileManager.projectiles)
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,76 @@
+import math          # [library import] - math: heading of a single velocity
+import numpy as np   # [library import] - numpy: vectorized heading buckets and draw offsets
+import pygame        # [library import] - pygame: rotating the source surface once per bucket
+
+# [constants] - defaults
+ANGLE_STEPS = 64     # [constant] - headings per sprite (5.625 degrees apart)
+
+
+# [sprite class] - One surface pre-rotated to evenly spaced headings
+class RotatedSprite:
+    """A surface rendered at `steps` headings once, so drawing an oriented sprite is a plain blit.
+
+    Headings are screen-space angles, clockwise from +x (the direction of
+    atan2(vy, vx) with y pointing down). offsets[bucket] is what to add to the
+    top-left of the unrotated sprite's rect to keep the larger rotated copy
+    centred on it.
+    """
+
+    # [constructor] - renders every bucket up front
+    def __init__(self, surface: pygame.Surface, steps: int = ANGLE_STEPS, heading: float = 0.0) -> None:
+        """Rotate surface, whose art faces heading degrees, to steps evenly spaced headings."""
+        self.steps = steps
+        self.heading = heading               # [attribute] - heading the unrotated art faces
+        self.images = []                     # [attribute] - bucket -> rotated Surface
+        self.offsets = np.zeros((steps, 2), dtype=np.int32)  # [array] - bucket -> top-left shift from the source rect
+        width, height = surface.get_size()
+        for bucket in range(steps):
+            # [rotate] - pygame turns counter-clockwise, screen headings turn clockwise
+            image = pygame.transform.rotate(surface, heading - bucket * 360.0 / steps)
+            self.images.append(image)
+            self.offsets[bucket] = (width // 2 - image.get_width() // 2, height // 2 - image.get_height() // 2)
+        self.offset_pairs = [tuple(offset) for offset in self.offsets.tolist()]  # [attribute] - offsets as tuples, for per-object use
+        self._per_radian = steps / (2 * math.pi)
+
+    # [public method] - nearest bucket for one velocity
+    def bucket(self, vx: float, vy: float) -> int:
+        """Return the bucket closest to the heading of (vx, vy); a zero vector gets bucket 0."""
+        return int(round(math.atan2(vy, vx) * self._per_radian)) % self.steps
+
+    # [vectorized helper] - nearest buckets for many velocities
+    def buckets(self, velocity: np.ndarray) -> np.ndarray:
+        """Return the bucket of every row of an (n, 2) velocity array."""
+        angle = np.arctan2(velocity[:, 1], velocity[:, 0])
+        return np.rint(angle * self._per_radian).astype(np.int32) % self.steps
+
+
+# [cache class] - Shares one RotatedSprite per source surface
+class RotationCache:
+    """RotatedSprites keyed by (surface, steps, heading), built on first request."""
+
+    # [constructor] - empty table
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._entries = {}   # [attribute] - (surface, steps, heading) -> RotatedSprite
+
+    # [public method] - returns (building once) the rotations of a surface
+    def get(self, surface: pygame.Surface, steps: int = ANGLE_STEPS, heading: float = 0.0) -> RotatedSprite:
+        """Return the RotatedSprite of surface, rendering it on the first request."""
+        key = (surface, steps, heading)
+        rotated = self._entries.get(key)
+        if rotated is None:
+            rotated = self._entries[key] = RotatedSprite(surface, steps, heading)
+        return rotated
+
+    # [public method] - forgets every rotation set
+    def clear(self) -> None:
+        """Drop all cached rotations (and the source surfaces they keep alive)."""
+        self._entries.clear()
+
+    # [dunder method] - number of rotation sets
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# [module instance] - rotation sets shared by every projectile
+rotation_cache = RotationCache()
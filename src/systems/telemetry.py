@@ -0,0 +1,175 @@
+import json          # [library import] - json: one record per line in the flushed file
+import threading     # [library import] - threading: background flush so the frame loop never writes files
+import time          # [library import] - time: record timestamps
+from array import array  # [library import] - array: preallocated, typed ring buffer columns
+
+# [constants] - channel kinds
+COUNTER = 0          # [kind] - monotonically increasing total, sampled once per frame
+GAUGE = 1            # [kind] - last value set, sampled once per frame
+EVENT = 2            # [kind] - written to the ring when it happens
+KIND_NAMES = ('counter', 'gauge', 'event')
+
+# [constants] - defaults
+RING_CAPACITY = 1 << 16   # [constant] - records held between flushes before the oldest are overwritten
+FLUSH_INTERVAL = 0.5      # [constant] - seconds between background flushes
+
+
+# [telemetry class] - Typed channels recorded into a ring buffer and flushed off the main thread
+class Telemetry:
+    """Counters, gauges and events with numeric payloads, written into preallocated columns.
+
+    Call sites register a channel once (at import) and get an integer id;
+    recording is then a few array stores with no formatting. Counters and
+    gauges are plain slots updated in place and copied into the ring by
+    sample() once per frame; events go to the ring immediately. A daemon
+    thread turns the ring into JSONL in batches. Call sites check
+    `telemetry.enabled` first, so a disabled channel costs one attribute read.
+    """
+
+    # [constructor] - preallocates the ring
+    def __init__(self, capacity: int = RING_CAPACITY) -> None:
+        """Initialize a disabled recorder with room for capacity records."""
+        self.enabled = False          # [attribute] - checked by every call site before recording
+        self.capacity = capacity
+        self.names = []               # [attribute] - channel id -> name
+        self.kinds = []               # [attribute] - channel id -> COUNTER / GAUGE / EVENT
+        self.fields = []              # [attribute] - channel id -> payload field names (events)
+        self._ids = {}                # [attribute] - name -> channel id
+        self.values = []              # [attribute] - channel id -> current counter total / gauge value
+        self._sampled = []            # [attribute] - channel id -> value at the last sample()
+        # [ring] - one column per field; record i lives at index i % capacity
+        self._time = array('d', bytes(8 * capacity))
+        self._channel = array('H', bytes(2 * capacity))
+        self._a = array('d', bytes(8 * capacity))
+        self._b = array('d', bytes(8 * capacity))
+        self._written = 0             # [attribute] - records ever written (only the main thread advances it)
+        self._flushed = 0             # [attribute] - records ever consumed by the flusher
+        self.dropped = 0              # [attribute] - records overwritten before they were flushed
+        self._epoch = time.perf_counter()
+        self._file = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    # [helper method] - registers (or looks up) a channel
+    def _channel_id(self, name: str, kind: int, fields=()) -> int:
+        channel = self._ids.get(name)
+        if channel is None:
+            channel = len(self.names)
+            self._ids[name] = channel
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.fields.append(tuple(fields))
+            self.values.append(0)
+            self._sampled.append(None)
+        return channel
+
+    # [public method] - declares a counter
+    def counter(self, name: str) -> int:
+        """Return the id of counter name."""
+        return self._channel_id(name, COUNTER)
+
+    # [public method] - declares a gauge
+    def gauge(self, name: str) -> int:
+        """Return the id of gauge name."""
+        return self._channel_id(name, GAUGE)
+
+    # [public method] - declares an event
+    def event(self, name: str, fields=()) -> int:
+        """Return the id of event name, whose (up to two) numeric payload values are called fields."""
+        return self._channel_id(name, EVENT, fields[:2])
+
+    # [public method] - counter increment
+    def add(self, channel: int, amount=1) -> None:
+        """Add amount to counter channel."""
+        self.values[channel] += amount
+
+    # [public method] - gauge update
+    def set(self, channel: int, value) -> None:
+        """Set gauge channel to value."""
+        self.values[channel] = value
+
+    # [public method] - event record
+    def emit(self, channel: int, a: float = 0.0, b: float = 0.0) -> None:
+        """Record event channel now with payload (a, b)."""
+        i = self._written % self.capacity
+        self._time[i] = time.perf_counter() - self._epoch
+        self._channel[i] = channel
+        self._a[i] = a
+        self._b[i] = b
+        self._written += 1
+
+    # [public method] - writes changed counters and gauges to the ring
+    def sample(self) -> None:
+        """Record every counter and gauge whose value changed since the last sample (call once per frame)."""
+        if not self.enabled:
+            return
+        sampled = self._sampled
+        for channel, value in enumerate(self.values):
+            if sampled[channel] != value and self.kinds[channel] != EVENT:
+                sampled[channel] = value
+                self.emit(channel, value)
+
+    # [public method] - turns recording on with a background writer
+    def start(self, path: str, interval: float = FLUSH_INTERVAL) -> None:
+        """Enable recording and flush to the JSONL file at path every interval seconds."""
+        self._file = open(path, 'w')
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,), name='telemetry-flush', daemon=True)
+        self.enabled = True
+        self._thread.start()
+
+    # [public method] - turns recording off and writes what is left
+    def stop(self) -> None:
+        """Disable recording, flush the remaining records and close the file."""
+        self.enabled = False
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+
+    # [helper method] - flush loop of the background thread
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.flush()
+
+    # [public method] - formats and writes pending records
+    def flush(self) -> int:
+        """Write every record not yet flushed (formatting happens here, not at the call site); return the count."""
+        end = self._written
+        start = self._flushed
+        if end - start > self.capacity:
+            self.dropped += end - start - self.capacity
+            start = end - self.capacity
+        if end == start or self._file is None:
+            self._flushed = end
+            return 0
+        capacity = self.capacity
+        names, kinds, fields = self.names, self.kinds, self.fields
+        lines = []
+        for n in range(start, end):
+            i = n % capacity
+            channel = self._channel[i]
+            record = {'t': round(self._time[i], 6), 'name': names[channel], 'kind': KIND_NAMES[kinds[channel]]}
+            if kinds[channel] == EVENT:
+                for field, value in zip(fields[channel], (self._a[i], self._b[i])):
+                    record[field] = value
+            else:
+                record['value'] = self._a[i]
+            lines.append(json.dumps(record))
+        # [overrun] - the main thread may have lapped the ring while we were formatting
+        lapped = self._written - capacity - start
+        if lapped > 0:
+            self.dropped += lapped
+            lines = lines[lapped:]
+        self._file.write('\n'.join(lines) + '\n' if lines else '')
+        self._file.flush()
+        self._flushed = end
+        return len(lines)
+
+
+# [module instance] - process-wide telemetry, off unless started
+telemetry = Telemetry()
@@ -0,0 +1,140 @@
+from collections import OrderedDict  # [library import] - OrderedDict: keeps rendered strings in LRU order
+import pygame        # [library import] - pygame: font rasterization and glyph surfaces
+
+# [constants] - defaults shared by the debug overlay and HUD text
+DEFAULT_SIZE = 36                    # [constant] - same size the debug overlay always used
+DEFAULT_COLOR = (255, 255, 255)      # [constant] - white
+NUMERIC_GLYPHS = "0123456789.-+:,()/%x "  # [constant] - characters pre-rendered into each glyph strip
+
+
+# [glyph class] - One font size and colour rasterized a character at a time
+class GlyphSet:
+    """Per-character surfaces for one (colour, size); numeric characters share a single pre-rendered strip.
+
+    Fast-changing text (FPS, positions, timings, health) is drawn glyph by glyph,
+    so a new value never rasterizes anything. Characters outside the strip are
+    rendered once on first use and kept.
+    """
+
+    # [constructor] - renders the numeric strip and slices it into subsurfaces
+    def __init__(self, font: pygame.font.Font, color) -> None:
+        """Initialize glyphs for font in color."""
+        self.font = font                     # [attribute] - font the glyphs were rendered with
+        self.color = color                   # [attribute] - text colour
+        self.height = font.get_linesize()    # [attribute] - line height in pixels
+        self._glyphs = {}                    # [attribute] - character -> Surface
+
+        surfaces = [font.render(char, True, color) for char in NUMERIC_GLYPHS]
+        width = sum(surface.get_width() for surface in surfaces)
+        height = max(surface.get_height() for surface in surfaces)
+        self.strip = pygame.Surface((width, height), pygame.SRCALPHA, 32)  # [attribute] - the numeric glyph atlas
+        x = 0
+        for char, surface in zip(NUMERIC_GLYPHS, surfaces):
+            # [exact copy] - RGBA_MAX onto a cleared strip copies anti-aliased alpha without blending
+            self.strip.blit(surface, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self._glyphs[char] = self.strip.subsurface((x, 0, surface.get_width(), surface.get_height()))
+            x += surface.get_width()
+
+    # [public method] - returns the surface for one character
+    def glyph(self, char: str) -> pygame.Surface:
+        """Return the glyph for char, rendering it on first use if it is not in the strip."""
+        surface = self._glyphs.get(char)
+        if surface is None:
+            surface = self.font.render(char, True, self.color)
+            self._glyphs[char] = surface
+        return surface
+
+    # [public method] - draws a string as a batch of glyph blits
+    def draw(self, target, text: str, pos) -> pygame.Rect:
+        """Blit text at pos with one fblits call; return the covered rect."""
+        x, y = pos
+        glyph = self.glyph
+        sequence = []
+        for char in text:
+            surface = glyph(char)
+            sequence.append((surface, (x, y)))
+            x += surface.get_width()
+        if sequence:
+            target.fblits(sequence)
+        return pygame.Rect(pos[0], y, x - pos[0], self.height)
+
+
+# [cache class] - Rendered text surfaces plus glyph sets, shared by every overlay
+class TextCache:
+    """Cache rendered text keyed by (string, colour, size) with LRU eviction; glyph sets for changing values."""
+
+    # [constructor] - sets up the font, surface and glyph tables
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize an empty cache holding at most max_entries rendered strings."""
+        self.max_entries = max_entries  # [attribute] - rendered strings kept before the oldest is evicted
+        self._fonts = {}                # [attribute] - size -> Font (the default font at that size)
+        self._entries = OrderedDict()   # [attribute] - (text, colour, size) -> Surface, oldest use first
+        self._glyph_sets = {}           # [attribute] - (colour, size) -> GlyphSet
+        self.hits = 0                   # [attribute] - render() calls served from memory
+        self.misses = 0                 # [attribute] - render() calls that rasterized text
+
+    # [public method] - returns the font for a size, creating it once
+    def font(self, size: int = DEFAULT_SIZE) -> pygame.font.Font:
+        """Return the default font at size."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)  # None = default system font
+            self._fonts[size] = font
+        return font
+
+    # [public method] - rendered surface for a whole string
+    def render(self, text: str, color=DEFAULT_COLOR, size: int = DEFAULT_SIZE) -> pygame.Surface:
+        """Return text rendered in color at size, rasterizing it only the first time."""
+        key = (text, tuple(color), size)
+        surface = self._entries.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = self.font(size).render(text, True, color)
+            self._entries[key] = surface
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)  # [LRU] - drop the least recently used string
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)  # [LRU] - mark as most recently used
+        return surface
+
+    # [public method] - glyph set for a colour and size, creating it once
+    def glyphs(self, color=DEFAULT_COLOR, size: int = DEFAULT_SIZE) -> GlyphSet:
+        """Return the GlyphSet for color at size."""
+        key = (tuple(color), size)
+        glyph_set = self._glyph_sets.get(key)
+        if glyph_set is None:
+            glyph_set = GlyphSet(self.font(size), key[0])
+            self._glyph_sets[key] = glyph_set
+        return glyph_set
+
+    # [public method] - blits a cached string
+    def draw(self, target, text: str, pos, color=DEFAULT_COLOR, size: int = DEFAULT_SIZE) -> pygame.Rect:
+        """Blit text (a label or other rarely changing string) from the cache; return its rect."""
+        return target.blit(self.render(text, color, size), pos)
+
+    # [public method] - label from the cache followed by a value drawn from glyphs
+    def draw_field(self, target, label: str, value: str, pos, color=DEFAULT_COLOR, size: int = DEFAULT_SIZE) -> pygame.Rect:
+        """Blit a cached label then value glyph by glyph, so a changing value never rasterizes text."""
+        rect = self.draw(target, label, pos, color, size)
+        return rect.union(self.glyphs(color, size).draw(target, value, (rect.right, pos[1])))
+
+    # [public method] - drops every rendered string and glyph set
+    def clear(self) -> None:
+        """Forget all rendered strings and glyph sets (fonts are kept)."""
+        self._entries.clear()
+        self._glyph_sets.clear()
+
+    # [public method] - returns cache counters for debugging
+    def stats(self) -> dict:
+        """Return entry, glyph set and hit/miss counts."""
+        return {
+            'entries': len(self._entries),
+            'glyph_sets': len(self._glyph_sets),
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+
+
+# [module instance] - the shared text cache used by the debug overlay and HUD
+text_cache = TextCache()
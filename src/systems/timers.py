@@ -0,0 +1,142 @@
+from systems.game_loop import FIXED_DT  # [constant import] - FIXED_DT: seconds per tick, for ticks_for()
+
+# [constants] - wheel geometry: bits of the tick counter each level indexes
+LEVEL_BITS = (8, 6, 6, 6)   # [layout] - 256 one-tick slots, then 64 slots per level, 2**26 ticks in total
+HORIZON = 1 << sum(LEVEL_BITS)  # [constant] - farther deadlines wait at the top level and are re-filed on cascade
+
+
+# [helper function] - seconds of simulation time to whole ticks
+def ticks_for(seconds: float, dt: float = FIXED_DT) -> int:
+    """Return the number of ticks (at least 1) that covers seconds."""
+    return max(1, round(seconds / dt))
+
+
+# [handle class] - One scheduled callback
+class Timer:
+    """Handle returned by TimerWheel.schedule(); cancel() it to stop the callback."""
+    __slots__ = ('deadline', 'callback', 'args', '_slot', '_wheel')
+
+    # [constructor] - filled in by the wheel
+    def __init__(self, wheel, deadline: int, callback, args) -> None:
+        self.deadline = deadline      # [attribute] - tick the callback runs on
+        self.callback = callback
+        self.args = args
+        self._slot = None             # [attribute] - the slot dict holding the timer (None once fired or cancelled)
+        self._wheel = wheel
+
+    # [property] - still waiting to fire
+    @property
+    def active(self) -> bool:
+        return self._slot is not None
+
+    # [public method] - O(1) removal
+    def cancel(self) -> None:
+        """Stop the timer; a no-op if it already fired or was cancelled."""
+        self._wheel.cancel(self)
+
+
+# [wheel class] - Hierarchical timer wheel driven by simulation ticks
+class TimerWheel:
+    """Callbacks scheduled a number of simulation ticks ahead.
+
+    Level 0 has one slot per tick for the next 256 ticks; each higher level
+    has 64 slots that each span a whole turn of the level below. Insert and
+    cancel are O(1): a slot is a dict keyed by Timer. advance() only looks at
+    the slot of the tick it reaches, plus one slot of a higher level every 256
+    ticks, when that slot's timers are re-filed closer to their deadline. The
+    cost of a tick therefore follows the number of timers expiring, not the
+    number scheduled.
+    """
+
+    # [constructor] - empty slots at tick 0
+    def __init__(self) -> None:
+        """Initialize an empty wheel at tick 0."""
+        self.tick = 0          # [attribute] - ticks advanced so far; timers due at this tick have run
+        self.levels = [[{} for _ in range(1 << bits)] for bits in LEVEL_BITS]  # [attribute] - level -> slot -> timers
+        self._shifts = []      # [attribute] - level -> bit offset of its slot index in the deadline
+        shift = 0
+        for bits in LEVEL_BITS:
+            self._shifts.append(shift)
+            shift += bits
+        self.count = 0         # [attribute] - timers scheduled and not yet fired or cancelled
+        self.fired = 0         # [attribute] - callbacks run so far
+
+    # [public method] - schedules a callback
+    def schedule(self, delay: int, callback, *args) -> Timer:
+        """Run callback(*args) during the advance() that reaches delay ticks from now (at least 1)."""
+        timer = Timer(self, self.tick + max(1, int(delay)), callback, args)
+        self._file(timer)
+        self.count += 1
+        return timer
+
+    # [public method] - O(1) removal
+    def cancel(self, timer: Timer) -> None:
+        """Remove timer from its slot if it is still pending."""
+        slot = timer._slot
+        if slot is not None:
+            del slot[timer]
+            timer._slot = None
+            self.count -= 1
+
+    # [helper method] - puts a timer in the slot matching its distance from now
+    def _file(self, timer: Timer) -> None:
+        delta = timer.deadline - self.tick
+        deadline = timer.deadline if delta < HORIZON else self.tick + HORIZON - 1
+        for level, bits in enumerate(LEVEL_BITS):
+            shift = self._shifts[level]
+            if delta < 1 << (shift + bits) or level == len(LEVEL_BITS) - 1:
+                slot = self.levels[level][(deadline >> shift) & ((1 << bits) - 1)]
+                slot[timer] = None
+                timer._slot = slot
+                return
+
+    # [helper method] - moves one higher-level slot's timers down a level (or more)
+    def _cascade(self, level: int) -> int:
+        """Re-file the timers of level's slot for the current tick and return that slot's index."""
+        index = (self.tick >> self._shifts[level]) & ((1 << LEVEL_BITS[level]) - 1)
+        slots = self.levels[level]
+        timers = slots[index]
+        if timers:
+            slots[index] = {}
+            for timer in timers:
+                self._file(timer)
+        return index
+
+    # [public method] - moves time forward
+    def advance(self, ticks: int = 1) -> int:
+        """Advance ticks simulation ticks, running every callback that comes due, and return how many ran."""
+        fired = 0
+        level0 = self.levels[0]
+        mask = len(level0) - 1
+        for _ in range(ticks):
+            self.tick += 1
+            index = self.tick & mask
+            if index == 0:
+                # [cascade] - a turn of level 0 completed; pull the next span of each higher level down
+                level = 1
+                while level < len(LEVEL_BITS) and self._cascade(level) == 0:
+                    level += 1
+            due = level0[index]
+            if not due:
+                continue
+            level0[index] = {}  # [swap] - callbacks may schedule new timers into fresh slots
+            for timer in due:
+                timer._slot = None
+                self.count -= 1
+                timer.callback(*timer.args)
+            fired += len(due)
+        self.fired += fired
+        return fired
+
+    # [dunder method] - pending timer count
+    def __len__(self) -> int:
+        return self.count
+
+    # [public method] - returns wheel counters for debugging
+    def stats(self) -> dict:
+        """Return the current tick and pending/fired timer counts."""
+        return {'tick': self.tick, 'pending': self.count, 'fired': self.fired}
+
+
+# [module instance] - timers of the windowed game, advanced once per simulation tick
+timers = TimerWheel()